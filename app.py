@@ -1,11 +1,6 @@
+import uuid
+
 import streamlit as st
-import requests
-import json
-import pandas as pd
-import os
-import time  # Add this import
-from io import BytesIO
-import altair as alt
 
 # Set page config
 st.set_page_config(
@@ -14,32 +9,37 @@ st.set_page_config(
     layout="wide"
 )
 
-# Define the base URL for your API
-BASE_URL = "http://localhost:3002/api"
+from salesgpt_client import history
+from salesgpt_client.profiler import ENABLED_BY_DEFAULT, section
+from salesgpt_client.ratelimit import current_owner
+from views.shared import (
+    API_PORTS, DEFAULT_PORT, JOB_SESSION_KEYS, base_url, get_client, get_health_monitor, get_job_manager,
+    format_bytes, get_payload_store, get_profiler, get_transport, health_caption
+)
 
-# Function to make API calls
-def api_call(endpoint, method="GET", data=None, files=None, timeout=60):
-    url = f"{BASE_URL}/{endpoint}"
-    
-    try:
-        if method == "GET":
-            response = requests.get(url, timeout=timeout)
-        elif method == "POST":
-            if files:
-                response = requests.post(url, data=data, files=files, timeout=timeout)
-            else:
-                response = requests.post(url, json=data, timeout=timeout)
-        
-        return response
-    except requests.exceptions.ConnectionError:
-        st.error(f"Connection Error: Cannot connect to {url}. Is the server running?")
-        return None
-    except requests.exceptions.Timeout:
-        st.error(f"Timeout Error: The request to {url} timed out after {timeout} seconds.")
-        return None
-    except Exception as e:
-        st.error(f"Error making API call: {str(e)}")
-        return None
+# Each page is its own script under views/ and only the selected one runs on a rerun.
+# Heavy imports (pandas, altair, numpy) load the first time a page that needs them runs;
+# clients, caches and stores live in views.shared and are created once per process.
+PAGES = [
+    st.Page("views/sales_strategy.py", title="Generate Sales Strategy", default=True),
+    st.Page("views/account_brief.py", title="Account Brief"),
+    st.Page("views/document_management.py", title="Document Management"),
+    st.Page("views/linkedin_profiles.py", title="LinkedIn Profiles"),
+    st.Page("views/history.py", title="History"),
+]
+page = st.navigation(PAGES, position="hidden")
+
+# Page that shows each kind of background job
+JOB_PAGES = {history.STRATEGY: PAGES[0], history.DOCUMENT_STRATEGY: PAGES[2]}
+
+# Requests from this session queue as one owner in the client's rate limiter
+current_owner.set(st.session_state.setdefault("session_id", uuid.uuid4().hex))
+
+# Opt-in profiling of this rerun, switched on in the sidebar "Profiler" panel or with SALESGPT_PROFILE=1
+profiler = get_profiler()
+profile_run = None
+if st.session_state.setdefault("profile_enabled", ENABLED_BY_DEFAULT):
+    profile_run = profiler.start(page.title, st.session_state["session_id"])
 
 # Sidebar navigation
 with st.sidebar:
@@ -47,16 +47,14 @@ with st.sidebar:
     
     # Server configuration
     st.subheader("Server Configuration")
-    port = st.selectbox("API Server Port", [3000, 3001, 3002, 3003], index=3)
-    BASE_URL = f"http://localhost:{port}/api"
+    st.selectbox("API Server Port", API_PORTS, index=API_PORTS.index(DEFAULT_PORT), key="api_port")
+    BASE_URL = base_url()
     st.write(f"Using API endpoint: {BASE_URL}")
     
     # Navigation
     st.subheader("Navigation")
-    selected_api = st.radio(
-        "Select API",
-        ["Generate Sales Strategy", "Document Management", "LinkedIn Profiles"]  # Updated options
-    )
+    for nav_page in PAGES:
+        st.page_link(nav_page)
 
 # Main content area styling
 st.markdown("""
@@ -82,6 +80,42 @@ st.markdown("""
         border-radius: 5px;
         box-shadow: 0 2px 4px rgba(0,0,0,0.05);
     }
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 16px;
+        margin: 10px 0px;
+    }
+    .competitor-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 16px;
+    }
+    .ccs-track {
+        background-color: #e6e9ef;
+        border-radius: 5px;
+        height: 10px;
+        overflow: hidden;
+    }
+    .ccs-fill {
+        height: 100%;
+    }
+    .ccs-verdict {
+        padding: 10px 15px;
+        border-radius: 5px;
+    }
+    .ccs-success {
+        background-color: #e8f5e9;
+        color: #1b5e20;
+    }
+    .ccs-warning {
+        background-color: #fff8e1;
+        color: #8d6e00;
+    }
+    .ccs-error {
+        background-color: #ffebee;
+        color: #b71c1c;
+    }
     .metric-card {
         background-color: #f8f9fa;
         border-radius: 5px;
@@ -113,631 +147,196 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Generate Sales Strategy API
-if selected_api == "Generate Sales Strategy":
-    st.title("Generate Sales Strategy")
-    st.write("Generate a comprehensive sales strategy for a target company")
+# Selected page
+with section(page.title):
+    page.run()
+
+# System Status section
+with st.sidebar, section("Sidebar"):
+    st.markdown("---")
+    st.subheader("System Status")
     
-    # Input fields
-    col1, col2 = st.columns(2)
-    with col1:
-        company_name = st.text_input("Company Name", "Google")
-    with col2:
-        location = st.text_input("Location (optional)", "United States")
+    # Check API health from the shared background monitor
+    monitor = get_health_monitor(BASE_URL)
+    if st.button("Check API Status"):
+        # An explicit check runs now and refreshes the shared snapshot for everyone
+        monitor.check()
     
-    # Advanced options
-    with st.expander("Advanced Options"):
-        timeout = st.slider("Request Timeout (seconds)", 30, 300, 120)
+    health = monitor.snapshot()
+    if health.online:
+        st.success("API Server is running")
+    elif health.checked_at is None:
+        st.info("Checking API status...")
+    else:
+        st.error("API Server is not responding correctly")
+        if health.consecutive_failures > 1:
+            st.caption(f"{health.consecutive_failures} failed checks in a row")
+    st.caption(health_caption(health))
     
-    # Button to generate strategy
-    if st.button("Generate Sales Strategy"):
-        with st.spinner("Generating sales strategy... This may take up to 60 seconds."):
-            try:
-                payload = {
-                    "companyName": company_name,
-                    "location": location if location else None  # Only send if not empty
-                }
-                
-                # Add more detailed timeout and error handling
-                response = api_call("generateSalesStrategy", method="POST", data=payload, timeout=120)
-                
-                if response is None:
-                    st.error("Server is not responding. Please check if the backend is running.")
-                    st.info("Make sure your backend server is running on: " + BASE_URL)
-                elif response.status_code == 200:
-                    try:
-                        result = response.json()
-                        # Display the results as before
-                        st.success("Sales strategy generated successfully!")
-                        
-                        # Company overview section
-                        st.header(f"{result.get('companyName', 'Company')} Sales Strategy")
-                        
-                        # Company metrics in a nice row
-                        col1, col2, col3, col4 = st.columns(4)  # Changed from 3 to 4 columns
-
-                        with col1:
-                            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                            st.markdown(f'<div class="metric-value">{result.get("industry", "N/A")}</div>', unsafe_allow_html=True)
-                            st.markdown('<div class="metric-label">Industry</div>', unsafe_allow_html=True)
-                            st.markdown('</div>', unsafe_allow_html=True)
-
-                        with col2:
-                            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                            st.markdown(f'<div class="metric-value">{result.get("businessType", "N/A")}</div>', unsafe_allow_html=True)
-                            st.markdown('<div class="metric-label">Business Type</div>', unsafe_allow_html=True)
-                            st.markdown('</div>', unsafe_allow_html=True)
-
-                        with col3:
-                            company_size = result.get('companySize', {})
-                            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                            st.markdown(f'<div class="metric-value">{company_size.get("employeeCount", "N/A")}</div>', unsafe_allow_html=True)
-                            st.markdown('<div class="metric-label">Employees</div>', unsafe_allow_html=True)
-                            st.markdown('</div>', unsafe_allow_html=True)
-
-                        with col4:
-                            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                            headquarters = result.get('headquarters', 'N/A')  # This looks correct
-                            st.markdown(f'<div class="metric-value">{headquarters}</div>', unsafe_allow_html=True)
-                            st.markdown('<div class="metric-label">Location</div>', unsafe_allow_html=True)
-                            st.markdown('</div>', unsafe_allow_html=True)
-                        
-                        # Product/Service Details section
-                        st.subheader("Products & Services")
-                        product_services = result.get('productOrServiceDetails', [])
-                        if product_services:
-                            for item in product_services:
-                                st.markdown(f"• {item}")
-                        else:
-                            st.write("No product/service information available")
-                        
-                        # Sales Strategy sections
-                        sales_strategy = result.get('salesStrategy', {})
-                        if sales_strategy:
-                            # Current Situation
-                            st.subheader("Current Situation")
-                            current_situation = sales_strategy.get('currentSituation', {})
-                            
-                            st.markdown('<div class="strategy-section">', unsafe_allow_html=True)
-                            st.markdown("#### Opportunities & Priorities")
-                            st.write(current_situation.get('opportunitiesAndPriorities', 'Not available'))
-                            
-                            st.markdown("#### Existing Technology Solutions")
-                            tech_solutions = current_situation.get('existingTechnologySolutions', [])
-                            for tech in tech_solutions:
-                                st.markdown(f"• {tech}")
-                            
-                            st.markdown("#### Pain Points & Market Pressures")
-                            pain_points = current_situation.get('painPointsAndMarketPressures', [])
-                            for point in pain_points:
-                                st.markdown(f"• {point}")
-                            st.markdown('</div>', unsafe_allow_html=True)
-                            
-                            # Value Proposition
-                            st.subheader("Value Proposition")
-                            value_prop = sales_strategy.get('valueProposition', {})
-                            
-                            st.markdown('<div class="strategy-section">', unsafe_allow_html=True)
-                            st.markdown("#### Key Message")
-                            st.write(value_prop.get('keyMessage', 'Not available'))
-                            
-                            st.markdown("#### Benefits")
-                            benefits = value_prop.get('benefits', [])
-                            for benefit in benefits:
-                                st.markdown(f"• {benefit}")
-                            
-                            st.markdown("#### Differentiation")
-                            st.write(value_prop.get('differentiation', 'Not available'))
-                            st.markdown('</div>', unsafe_allow_html=True)
-                            
-                            # Obstacles & Mitigation
-                            st.subheader("Potential Obstacles & Mitigation")
-                            obstacles = sales_strategy.get('potentialObstaclesMitigation', {})
-
-                            if obstacles:
-                                st.markdown('<div class="strategy-section">', unsafe_allow_html=True)
-                                # Check if we have numbered obstacles or direct key-value pairs
-                                for key, value in obstacles.items():
-                                    if isinstance(value, dict) and 'description' in value:
-                                        # Handle the obstacle1, obstacle2, obstacle3 format
-                                        st.markdown(f"**{value['description']}**")
-                                        st.write(f"*Mitigation:* {value.get('mitigation', 'Not available')}")
-                                        st.markdown("---")
-                                    elif key == 'description' and 'mitigation' in obstacles:
-                                        # Handle the direct format with description and mitigation as keys
-                                        st.markdown(f"**{obstacles['description']}**")
-                                        st.write(f"*Mitigation:* {obstacles.get('mitigation', 'Not available')}")
-                                        st.markdown("---")
-                                        break  # Only process once if this is the format
-                                st.markdown('</div>', unsafe_allow_html=True)
-                            else:
-                                st.info("No obstacles information available")
-                            
-                            # Engagement Strategy
-                            st.subheader("Engagement Strategy")
-                            engagement = sales_strategy.get('engagementStrategy', [])
-                            
-                            st.markdown('<div class="strategy-section">', unsafe_allow_html=True)
-                            for item in engagement:
-                                st.markdown(f"• {item}")
-                            st.markdown('</div>', unsafe_allow_html=True)
-                            
-                            # Competitor Analysis
-                            st.subheader("Competitor Analysis")
-                            competitors = sales_strategy.get('competitorAnalysis', [])
-                            
-                            if competitors:
-                                cols = st.columns(2)
-                                for i, competitor in enumerate(competitors):
-                                    with cols[i % 2]:  # This ensures it works with any number of competitors
-                                        st.markdown('<div class="competitor-card">', unsafe_allow_html=True)
-                                        st.markdown(f"### {competitor.get('competitor', 'Competitor')}")
-                                        
-                                        st.markdown("**Strengths:**")
-                                        strengths = competitor.get('strengths', [])
-                                        for strength in strengths:
-                                            st.markdown(f"• {strength}")
-                                        
-                                        st.markdown("**Weaknesses:**")
-                                        weaknesses = competitor.get('weaknesses', [])
-                                        for weakness in weaknesses:
-                                            st.markdown(f"• {weakness}")
-                                        st.markdown('</div>', unsafe_allow_html=True)
-                            
-                            # CCS Score
-                            st.subheader("Customer Compatibility Score (CCS)")
-                            ccs_score = sales_strategy.get('ccsScore', 0)
-                            
-                            # Create a gauge-like visualization
-                            score_color = "#4CAF50" if ccs_score >= 85 else "#FFC107" if ccs_score >= 75 else "#F44336"
-                            
-                            # Create a progress bar for the CCS score
-                            st.progress(ccs_score/100)
-                            st.markdown(f'<p style="text-align:center; font-size:24px; font-weight:bold; color:{score_color}">{ccs_score}/100</p>', unsafe_allow_html=True)
-                            
-                            if ccs_score >= 85:
-                                st.success("Excellent compatibility with this prospect")
-                            elif ccs_score >= 75:
-                                st.warning("Good compatibility with this prospect")
-                            else:
-                                st.error("Average compatibility - may require additional effort")
-                        
-                        # Raw JSON option
-                        with st.expander("View raw JSON data"):
-                            st.json(result)
-                        
-                        # Add this after your CCS Score section
-                        with st.expander("Debug Info"):
-                            st.subheader("Response Structure")
-                            st.json({
-                                "top_level_keys": list(result.keys()),
-                                "salesStrategy_keys": list(sales_strategy.keys() if sales_strategy else []),
-                                "obstacles_count": len(obstacles) if obstacles else 0,
-                                "competitors_count": len(competitors) if competitors else 0
-                            })
-                    except ValueError:
-                        st.error("Received an invalid response from the server.")
-                        st.code(response.text)
-                else:
-                    st.error(f"Error: Failed to generate sales strategy. Status: {response.status_code}")
-                    try:
-                        error_data = response.json()
-                        st.json(error_data)
-                    except:
-                        st.text(f"Response text: {response.text}")
-            except requests.exceptions.RequestException as e:
-                st.error(f"Network error: {str(e)}")
-
-# Document Management API - Unified Section
-elif selected_api == "Document Management":
-    st.title("Document Management")
+    # Responses kept between reruns, against this session's and the process-wide budget
+    payload_store = get_payload_store()
+    memory = payload_store.usage(st.session_state["session_id"])
+    st.progress(
+        min(memory["session_bytes"] / memory["session_budget"], 1.0),
+        text=f"Session memory: {format_bytes(memory['session_bytes'])} of {format_bytes(memory['session_budget'])} "
+             f"({memory['session_entries']} responses)",
+    )
+    st.caption(
+        f"All sessions: {format_bytes(memory['total_bytes'])} of {format_bytes(memory['global_budget'])}, "
+        f"{memory['evicted']} responses evicted ({format_bytes(memory['evicted_bytes'])})"
+    )
+    if memory["session_entries"] and st.button("Free session memory"):
+        payload_store.clear(st.session_state["session_id"])
+        st.rerun()
     
-    # Create tabs for different document operations
-    tabs = st.tabs(["Upload Document", "Document Library", "Query Documents", "Generate Strategy"])
+    # This session's background jobs; any of them can be reopened on its page or cancelled
+    jobs_panel = st.expander("Background Jobs", key="jobs_panel", on_change="rerun")
+    if jobs_panel.open:
+        with jobs_panel:
+            manager = get_job_manager()
+            session_jobs = manager.jobs(owner=st.session_state["session_id"])
+            job_stats = manager.stats()
+            st.caption(
+                f"{job_stats['running']} running and {job_stats['queued']} queued "
+                f"on {job_stats['workers']} workers across all sessions"
+            )
+            if not session_jobs:
+                st.caption("No jobs started in this session")
+            else:
+                st.dataframe(
+                    [{"job": job.label, "status": job.status_label, "elapsed_s": round(job.elapsed, 1)} for job in session_jobs],
+                    width="stretch",
+                    hide_index=True,
+                )
+                jobs_by_id = {job.id: job for job in session_jobs}
+                selected_job = jobs_by_id[st.selectbox(
+                    "Job",
+                    list(jobs_by_id),
+                    format_func=lambda job_id: f"{jobs_by_id[job_id].label} ({jobs_by_id[job_id].status_label})",
+                    key="jobs_selected",
+                )]
+                open_col, cancel_col = st.columns(2)
+                with open_col:
+                    if st.button("Open", key="jobs_open"):
+                        st.session_state[JOB_SESSION_KEYS[selected_job.kind]] = selected_job.id
+                        st.switch_page(JOB_PAGES[selected_job.kind])
+                with cancel_col:
+                    if st.button("Cancel", key="jobs_cancel", disabled=selected_job.finished):
+                        manager.cancel(selected_job.id)
+                        st.rerun()
     
-    # Tab 1: Upload Document
-    with tabs[0]:
-        st.subheader("Upload Document")
-        
-        # Show API connection status
-        server_url = BASE_URL
-        st.caption(f"📡 Connected to server: {server_url}")
-        server_status = api_call("system/status", timeout=2)
-        if server_status and server_status.status_code == 200:
-            st.success("✅ Server is online")
-        else:
-            st.error(f"❌ Server is offline or unreachable at {server_url}")
-            st.info("Check if your backend server is running and accessible")
-        
-        uploaded_file = st.file_uploader("Choose a PDF or DOCX file", type=["pdf", "docx"], key="doc_upload")
-        
-        if uploaded_file is not None:
-            file_info = {
-                "Filename": uploaded_file.name,
-                "Size": f"{uploaded_file.size / 1024:.2f} KB",
-                "Type": uploaded_file.type
-            }
-            st.write("File information:", file_info)
+    # Connection reuse counters for the shared transport
+    pool_panel = st.expander("Connection Pool", key="pool_panel", on_change="rerun")
+    if pool_panel.open:
+        with pool_panel:
+            import pandas as pd
             
-            if st.button("Upload Document"):
-                # Create progress container
-                progress_container = st.container()
-                
-                with progress_container:
-                    # Create columns for status indicators
-                    col1, col2, col3 = st.columns(3)
-                    
-                    # Initialize progress indicators
-                    with col1:
-                        upload_status = st.empty()
-                    with col2:
-                        vectorize_status = st.empty()
-                    with col3:
-                        index_status = st.empty()
-                    
-                    # Set initial status
-                    upload_status.markdown("⏳ Initializing upload...")
-                    vectorize_status.markdown("⏳ Vectorization pending...")
-                    index_status.markdown("⏳ Indexing pending...")
-                    
-                    # Add progress bar
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    try:
-                        # Begin simulating progress for upload preparation
-                        for i in range(25):
-                            progress_bar.progress(i)
-                            status_text.text(f"Preparing file for upload... {i}%")
-                            time.sleep(0.05)
-                        
-                        # Update upload status
-                        upload_status.markdown("⏳ Uploading document...")
-                        
-                        # Continue progress
-                        for i in range(25, 50):
-                            progress_bar.progress(i)
-                            status_text.text(f"Uploading file... {i}%")
-                            time.sleep(0.05)
-                        
-                        # Make API call with appropriate timeout
-                        files = {"document": uploaded_file}
-                        
-                        # Continue with upload - longer timeout (180 seconds)
-                        try:
-                            response = api_call("documents/upload", method="POST", files=files, timeout=180)
-                            
-                            if response and response.status_code in [200, 202]:
-                                result = response.json()
-                                
-                                # Update progress for successful upload
-                                progress_bar.progress(50)
-                                status_text.text(f"File uploaded! Processing content... 50%")
-                                upload_status.markdown("✅ Upload successful")
-                                
-                                # Show document ID early
-                                document_id = result.get('documentId')
-                                st.info(f"Document ID: `{document_id}`")
-                                
-                                # Simulate vectorization progress
-                                vectorize_status.markdown("⏳ Extracting text...")
-                                for i in range(50, 65):
-                                    progress_bar.progress(i)
-                                    status_text.text(f"Extracting text from document... {i}%")
-                                    time.sleep(0.05)
-                                
-                                vectorize_status.markdown("⏳ Generating embeddings...")
-                                for i in range(65, 80):
-                                    progress_bar.progress(i)
-                                    status_text.text(f"Creating vector embeddings... {i}%")
-                                    time.sleep(0.05)
-                                
-                                vectorize_status.markdown("✅ Vectorization complete")
-                                
-                                # Simulate indexing progress
-                                index_status.markdown("⏳ Indexing document...")
-                                for i in range(80, 100):
-                                    progress_bar.progress(i)
-                                    status_text.text(f"Indexing document for search... {i}%")
-                                    time.sleep(0.05)
-                                
-                                # Final status updates
-                                progress_bar.progress(100)
-                                status_text.text("Document processing complete! 100%")
-                                index_status.markdown("✅ Indexing complete")
-                                
-                                # Success message
-                                st.success("Document uploaded and processed successfully!")
-                                
-                                # Display document info
-                                st.subheader("Document Information")
-                                st.write(f"Document ID: `{document_id}`")
-                                st.write(f"Collection: `{result.get('collectionName')}`")
-                                st.write(f"File name: {result.get('fileData', {}).get('originalName')}")
-                                st.write(f"File size: {result.get('fileData', {}).get('size')} bytes")
-                                
-                                # Copy button for document ID
-                                st.code(document_id, language="text")
-                                st.info("👆 Copy this Document ID to use for queries and strategy generation")
-                                
-                                # Document details
-                                with st.expander("View full document details"):
-                                    st.json(result)
-                                    
-                                # Refresh button for document list
-                                if st.button("View All Documents"):
-                                    st.switch_page("Document Library")
-                                
-                            else:
-                                # Handle upload failure
-                                progress_bar.progress(100)
-                                status_text.text("Upload failed!")
-                                
-                                upload_status.markdown("❌ Upload failed")
-                                vectorize_status.markdown("❌ Vectorization failed")
-                                index_status.markdown("❌ Indexing failed")
-                                
-                                status = response.status_code if response else "Unknown"
-                                error_msg = f"Error: Failed to upload document. Status: {status}"
-                                
-                                # Add more detailed error info
-                                if not response:
-                                    st.error(error_msg)
-                                    st.error(f"Server is not responding. Please check if the backend is running on {server_url}")
-                                else:
-                                    try:
-                                        error_data = response.json()
-                                        error_msg += f"\nError details: {error_data.get('error', 'Unknown error')}"
-                                        st.error(error_msg)
-                                        st.json(error_data)
-                                    except:
-                                        st.error(f"{error_msg}\nResponse: {response.text}")
-                        except Exception as e:
-                            upload_status.markdown("❌ Upload error")
-                            vectorize_status.markdown("❌ Process error")
-                            index_status.markdown("❌ Process error")
-                            st.error(f"Error during upload: {str(e)}")
-                    except Exception as e:
-                        st.error(f"Error during upload process: {str(e)}")
-    
-    # Add system status visualization
-    with tabs[0]:
-        with st.expander("Storage System Status"):
-            try:
-                status_response = api_call("system/status", method="GET", timeout=5)
-                if status_response and status_response.status_code == 200:
-                    system_status = status_response.json()
-                    
-                    # Create status indicators
-                    st.markdown("### Storage Systems")
-                    
-                    cols = st.columns(2)
-                    with cols[0]:
-                        gcp_status = "operational" if system_status.get("components", {}).get("gcsStorage") == "operational" else "degraded"
-                        gcp_icon = "✅" if gcp_status == "operational" else "⚠️"
-                        st.markdown(f"{gcp_icon} **Google Cloud Storage**: {gcp_status.title()}")
-                        
-                    with cols[1]:
-                        chroma_status = "operational" if system_status.get("components", {}).get("documentStorage") == "operational" else "degraded"
-                        chroma_icon = "✅" if chroma_status == "operational" else "⚠️"
-                        st.markdown(f"{chroma_icon} **Document Database**: {chroma_status.title()}")
-                    
-                    # If any system is degraded, show message
-                    if gcp_status != "operational" or chroma_status != "operational":
-                        st.warning("One or more storage systems are experiencing issues. Documents may still upload but with limited functionality.")
-                        
-                        if system_status.get("components", {}).get("documentStorageMessage"):
-                            st.info(f"Storage message: {system_status['components']['documentStorageMessage']}")
-                else:
-                    st.error("Could not retrieve system status")
-            except Exception as e:
-                st.error(f"Error checking system status: {str(e)}")
+            transport = get_transport(BASE_URL)
+            st.json(transport.totals())
+            st.dataframe(pd.DataFrame(transport.stats()), width="stretch", hide_index=True)
     
-    # Tab 2: Document Library
-    with tabs[1]:
-        st.subheader("Document Library")
-        st.write("View and manage your uploaded documents")
-        
-        if st.button("Refresh Document List"):
-            with st.spinner("Fetching documents..."):
-                response = api_call("documents/list", method="GET")
+    # Latency telemetry for every call made through the shared client
+    performance_panel = st.expander("Performance", key="performance_panel", on_change="rerun")
+    if performance_panel.open:
+        with performance_panel:
+            import altair as alt
+            import pandas as pd
+            
+            telemetry = get_client(BASE_URL).telemetry
+            events = telemetry.events()
+            if not events:
+                st.caption("No API calls recorded yet")
+            else:
+                st.caption(f"Last {len(events)} of {telemetry.recorded} calls (buffer holds {telemetry.maxlen})")
+                events_df = pd.DataFrame([event.to_dict() for event in events])
                 
-                if response and response.status_code == 200:
-                    docs = response.json().get("documents", [])
-                    if docs:
-                        # Create a table of documents
-                        docs_df = pd.DataFrame(
-                            [[doc.get("documentId"), 
-                              doc.get("metadata", {}).get("originalName", "Unknown"),
-                              doc.get("metadata", {}).get("uploadedAt", "Unknown"),
-                              "✅" if doc.get("processed", False) else "⏳"] 
-                             for doc in docs],
-                            columns=["Document ID", "Filename", "Upload Date", "Status"]
-                        )
-                        
-                        st.dataframe(docs_df, use_container_width=True)
-                        
-                        # Allow selection of a document for details
-                        selected_doc = st.selectbox(
-                            "Select document to view details",
-                            options=docs_df["Document ID"].tolist(),
-                            format_func=lambda x: f"{x} - {docs_df[docs_df['Document ID']==x]['Filename'].values[0]}"
-                        )
-                        
-                        if selected_doc:
-                            doc_response = api_call(f"documents/{selected_doc}", method="GET")
-                            if doc_response and doc_response.status_code == 200:
-                                doc_details = doc_response.json()
-                                
-                                # Show document details
-                                st.subheader("Document Details")
-                                metadata = doc_details.get('metadata', {})
-                                if metadata:
-                                    for key, value in metadata.items():
-                                        st.write(f"**{key}:** {value}")
-                                
-                                # Add document preview/download options if available
-                                if "fileUrl" in doc_details:
-                                    st.markdown(f"[View Document]({doc_details['fileUrl']})")
-                                
-                                with st.expander("Raw Document Data"):
-                                    st.json(doc_details)
-                    else:
-                        st.info("No documents found. Upload a document first.")
-                else:
-                    status = response.status_code if response else "Unknown"
-                    st.error(f"Error: Failed to fetch documents. Status: {status}")
-    
-    # Tab 3: Query Documents
-    with tabs[2]:
-        st.subheader("Query Documents")
-        st.write("Search for information across your uploaded documents")
-        
-        # Query input
-        query = st.text_area("Enter your query", "What are the key challenges in the sales process?")
-        limit = st.slider("Number of results", 1, 10, 5)
-        
-        if st.button("Search Documents"):
-            with st.spinner("Searching documents..."):
-                payload = {
-                    "query": query,
-                    "limit": limit
-                }
+                # Wall time histogram, one colour per endpoint
+                histogram = alt.Chart(events_df).mark_bar().encode(
+                    x=alt.X("wall_ms:Q", bin=alt.Bin(maxbins=30), title="Wall time (ms)"),
+                    y=alt.Y("count():Q", title="Calls"),
+                    color=alt.Color("endpoint:N", legend=alt.Legend(orient="bottom", columns=1)),
+                    tooltip=["endpoint:N", "count():Q"],
+                ).properties(height=180)
+                st.altair_chart(histogram, width="stretch")
                 
-                response = api_call("documents/query", method="POST", data=payload)
+                # Per-endpoint percentiles; queue/ttfb/transfer show which phase is slow
+                summary_df = pd.DataFrame(telemetry.summary()).round(1)
+                st.dataframe(summary_df, width="stretch", hide_index=True)
                 
-                if response and response.status_code == 200:
-                    result = response.json()
-                    
-                    # Handle potentially different response formats
-                    if 'results' in result and 'documents' in result['results']:
-                        documents = result['results']['documents'][0] if len(result['results']['documents']) > 0 else []
-                        metadatas = result['results']['metadatas'][0] if len(result['results']['metadatas']) > 0 else []
-                        
-                        st.success(f"Found {len(documents)} matching documents")
-                        
-                        for i, (doc, meta) in enumerate(zip(documents, metadatas)):
-                            with st.expander(f"Result {i+1}: {meta.get('originalName', 'Document')}"):
-                                st.markdown("**Document Excerpt:**")
-                                st.text(doc[:1000] + ("..." if len(doc) > 1000 else ""))
-                                
-                                st.markdown("**Metadata:**")
-                                st.json(meta)
-                    else:
-                        st.warning("Response format is different than expected")
-                        st.json(result)
-                else:
-                    status = response.status_code if response else "Unknown"
-                    st.error(f"Error: Failed to query documents. Status: {status}")
-    
-    # Tab 4: Generate Document-Based Strategy
-    with tabs[3]:
-        st.subheader("Generate Document-Based Sales Strategy")
-        st.write("Generate a sales strategy using insights from uploaded documents")
-        
-        # Input fields
-        col1, col2 = st.columns(2)
-        with col1:
-            document_id = st.text_input("Document ID", "")
-        with col2:
-            company_name = st.text_input("Company Name", "Google")
-        
-        # Advanced options
-        with st.expander("Advanced Options"):
-            timeout = st.slider("Request Timeout (seconds)", 30, 300, 120)
-        
-        if document_id and company_name and st.button("Generate Strategy"):
-            with st.spinner("Generating document-based sales strategy..."):
-                payload = {
-                    "documentId": document_id,
-                    "companyName": company_name
-                }
+                # Requests answered by joining an identical call already in flight
+                coalescing = get_client(BASE_URL).singleflight.stats()
+                st.caption(
+                    f"Coalesced {coalescing['shared']} of {coalescing['calls']} requests "
+                    f"({coalescing['shared_rate']:.0%}) into calls already in flight, {coalescing['in_flight']} in flight now"
+                )
+                if coalescing["shared"]:
+                    coalesced_df = pd.DataFrame(coalescing["endpoints"])
+                    st.dataframe(coalesced_df[coalesced_df["shared"] > 0], width="stretch", hide_index=True)
                 
-                response = api_call("documents/generateSalesStrategy", method="POST", data=payload, timeout=timeout)
+                # Adaptive limits for endpoints backed by rate-limited upstreams
+                limiter_stats = get_client(BASE_URL).limiter.stats()
+                throttled = sum(row["throttled"] for row in limiter_stats)
+                waited = sum(row["waited_s"] for row in limiter_stats)
+                st.caption(f"Rate limiter: {throttled} calls answered 429 and resent, {waited:.1f}s spent waiting for a slot")
+                limiter_df = pd.DataFrame(limiter_stats)[
+                    ["endpoint", "rate", "concurrency", "in_flight", "queued", "waiting_owners", "throttled", "waited_s"]
+                ]
+                st.dataframe(limiter_df.round(2), width="stretch", hide_index=True)
                 
-                if response and response.status_code == 200:
-                    result = response.json()
-                    st.success("Document-based sales strategy generated successfully!")
-                    
-                    # Display company info
-                    st.subheader("Company Information")
-                    company_info = result.get('companyInfo', {})
-                    if company_info:
-                        st.json(company_info)
-                    
-                    # Display sales strategy
-                    st.subheader("Sales Strategy")
-                    strategy = result.get('salesStrategy', "")
-                    st.markdown(strategy)
-                else:
-                    status = response.status_code if response else "Unknown"
-                    st.error(f"Error: Failed to generate strategy. Status: {status}")
-
-# LinkedIn Profiles API
-elif selected_api == "LinkedIn Profiles":
-    st.title("LinkedIn Profiles Search")
-    st.write("Find LinkedIn profiles based on company, position, and location")
+                export_col, clear_col = st.columns(2)
+                with export_col:
+                    st.download_button(
+                        "Export events",
+                        events_df.to_csv(index=False),
+                        file_name="salesgpt_api_events.csv",
+                        mime="text/csv",
+                    )
+                with clear_col:
+                    if st.button("Clear", key="clear_telemetry"):
+                        telemetry.clear()
+                        get_client(BASE_URL).singleflight.reset()
     
-    col1, col2 = st.columns(2)
-    with col1:
-        company = st.text_input("Company Name", "Google")
-        position = st.text_input("Position", "Software Engineer")
-    with col2:
-        location = st.text_input("Location", "Bangalore")
-        limit = st.slider("Number of profiles", 1, 10, 5)
-    
-    if st.button("Search LinkedIn Profiles"):
-        with st.spinner(f"Searching for {position} at {company} in {location}..."):
-            payload = {
-                "company": company,
-                "position": position,
-                "location": location,
-                "limit": limit
-            }
-            
-            response = api_call("linkedinProfiles/search", method="POST", data=payload)
+    # Where rerun time goes, for sessions that opt in
+    profiler_panel = st.expander("Profiler", key="profiler_panel", on_change="rerun")
+    if profiler_panel.open:
+        with profiler_panel:
+            import pandas as pd
             
-            if response and response.status_code == 200:
-                result = response.json()
-                
-                st.success(f"Found {len(result.get('profiles', []))} LinkedIn profiles")
-                
-                for i, profile in enumerate(result.get('profiles', [])):
-                    with st.container():
-                        st.markdown(f"### Profile {i+1}")
-                        st.markdown(f"**Title:** {profile.get('title', 'No title')}")
-                        st.markdown(f"**URL:** [{profile.get('url')}]({profile.get('url')})")
-                        st.markdown(f"**Snippet:** {profile.get('snippet', 'No description')}")
-                        st.markdown("---")
+            # Kept outside the widget so profiling stays on while the panel is closed
+            st.checkbox(
+                "Profile reruns",
+                value=st.session_state["profile_enabled"],
+                key="profile_toggle",
+                on_change=lambda: st.session_state.update(profile_enabled=st.session_state["profile_toggle"]),
+            )
+            profile_stats = profiler.stats()
+            st.caption(
+                f"{profile_stats['runs']} reruns profiled, {profile_stats['samples']} stack samples "
+                f"every {profile_stats['interval_ms']:.0f} ms, {profile_stats['active']} running now"
+            )
+            if profile_stats["runs"]:
+                top_n = st.slider("Slowest sections", 5, 50, 10, key="profile_top_n")
+                st.dataframe(pd.DataFrame(profiler.top_sections(top_n)), width="stretch", hide_index=True)
+                runs_df = pd.DataFrame(profiler.runs())
+                runs_df["started_at"] = pd.to_datetime(runs_df["started_at"], unit="s").dt.strftime("%H:%M:%S")
+                st.dataframe(runs_df.head(20), width="stretch", hide_index=True)
                 
-                # Show raw data in expander
-                with st.expander("View raw results"):
-                    st.json(result)
-            else:
-                status = response.status_code if response else "Unknown"
-                st.error(f"Error: Failed to search LinkedIn profiles. Status: {status}")
-                if response:
-                    try:
-                        st.json(response.json())
-                    except:
-                        st.error("Could not parse error response")
-
-# System Status section
-with st.sidebar:
-    st.markdown("---")
-    st.subheader("System Status")
-    
-    # Check API health
-    if st.button("Check API Status"):
-        try:
-            response = api_call("", method="GET", timeout=5)
-            if response and response.status_code == 200:
-                st.success("API Server is running")
-            else:
-                st.error("API Server is not responding correctly")
-        except Exception as e:
-            st.error(f"Error checking API: {str(e)}")
+                export_col, clear_col = st.columns(2)
+                with export_col:
+                    st.download_button(
+                        "Export flame graph stacks",
+                        profiler.folded(),
+                        file_name="salesgpt_reruns.folded",
+                        mime="text/plain",
+                        help="Folded stacks for flamegraph.pl, speedscope or inferno",
+                    )
+                with clear_col:
+                    if st.button("Clear", key="clear_profile"):
+                        profiler.clear()
     
     # Display server info
     st.info("SalesGPT Backend Client v1.1")
-    st.caption("© 2024 SalesGPT")
\ No newline at end of file
+    st.caption("© 2024 SalesGPT")
+
+if profile_run is not None:
+    profiler.finish(profile_run)
@@ -1,9 +1,86 @@
+const crypto = require('crypto');
 const { v4: uuidv4 } = require('uuid');
 const chromaService = require('../services/chromaService');
+const processingStatus = require('../services/processingStatus');
+const aiService = require('../services/aiService');
 const pdfParse = require('pdf-parse');
 const mammoth = require('mammoth');
 
+// Fingerprints of uploaded documents -> their list entry, keyed 'contentHash:<sha256>'
+// (the file bytes) and 'textHash:<sha256>' (the extracted text, lowercased with
+// whitespace collapsed). A document uploaded again, or re-exported with the same
+// text, is linked to the existing one instead of being extracted and embedded twice.
+const documentsByHash = new Map();
+let hashIndexLoaded = null;
+
+const sha256 = (data) => crypto.createHash('sha256').update(data).digest('hex');
+
+const normalizedTextHash = (text) => sha256(text.toLowerCase().replace(/\s+/g, ' ').trim());
+
+const rememberHashes = (entry) => {
+  for (const field of ['contentHash', 'textHash']) {
+    if (entry.metadata && entry.metadata[field]) {
+      documentsByHash.set(`${field}:${entry.metadata[field]}`, entry);
+    }
+  }
+};
+
+const forgetHashes = (documentId) => {
+  for (const [key, entry] of documentsByHash) {
+    if (entry.documentId === documentId) {
+      documentsByHash.delete(key);
+    }
+  }
+};
+
+// Documents uploaded before this process started are found through their chunk
+// metadata; every collection is summarized once, then lookups are in memory
+const loadHashIndex = () => {
+  if (!hashIndexLoaded) {
+    hashIndexLoaded = (async () => {
+      const collections = await chromaService.listAllCollections();
+      const statuses = statusesByCollection();
+      await Promise.all(collections
+        .filter(col => col.name.startsWith('doc_'))
+        .map(async (collection) => {
+          try {
+            rememberHashes(await summarizeCollection(collection.name, statuses.get(collection.name)));
+          } catch (err) {
+            console.error(`Error reading fingerprints of collection ${collection.name}:`, err);
+          }
+        }));
+    })().catch((err) => {
+      hashIndexLoaded = null;
+      throw err;
+    });
+  }
+  return hashIndexLoaded;
+};
+
+const findByHash = async (field, hash) => {
+  await loadHashIndex();
+  return documentsByHash.get(`${field}:${hash}`) || null;
+};
+
+const sendDuplicate = (res, file, existing, matchedOn) => {
+  console.log(`${file.originalname} matches document ${existing.documentId} (${matchedOn}), skipping processing`);
+  return res.status(200).json({
+    message: 'Document already uploaded; linked to the existing copy',
+    documentId: existing.documentId,
+    collectionName: existing.collectionName,
+    duplicate: true,
+    matchedOn,
+    fileData: {
+      originalName: file.originalname,
+      size: file.size,
+      mimeType: file.mimetype
+    }
+  });
+};
+
 // Upload and process document
+// Identical files (or files with identical text) are linked to the existing
+// document unless ?allowDuplicate=true
 const uploadDocument = async (req, res) => {
   try {
     // Check if file exists
@@ -15,8 +92,17 @@ const uploadDocument = async (req, res) => {
     
     const fileBuffer = req.file.buffer;
     const fileType = req.file.mimetype;
+    const allowDuplicate = req.query.allowDuplicate === 'true';
     let extractedText = '';
     
+    const contentHash = sha256(fileBuffer);
+    if (!allowDuplicate) {
+      const existing = await findByHash('contentHash', contentHash);
+      if (existing) {
+        return sendDuplicate(res, req.file, existing, 'contentHash');
+      }
+    }
+    
     // Extract text based on file type
     try {
       if (fileType === 'application/pdf' || req.file.originalname.toLowerCase().endsWith('.pdf')) {
@@ -57,6 +143,14 @@ const uploadDocument = async (req, res) => {
       });
     }
     
+    const textHash = normalizedTextHash(extractedText);
+    if (!allowDuplicate) {
+      const existing = await findByHash('textHash', textHash);
+      if (existing) {
+        return sendDuplicate(res, req.file, existing, 'textHash');
+      }
+    }
+    
     // Generate a unique document ID
     const documentId = uuidv4();
     
@@ -67,7 +161,9 @@ const uploadDocument = async (req, res) => {
       mimeType: req.file.mimetype,
       fileSize: req.file.size,
       uploadedAt: new Date().toISOString(),
-      textLength: extractedText.length
+      textLength: extractedText.length,
+      contentHash,
+      textHash
     };
     
     // Create collection name
@@ -76,6 +172,16 @@ const uploadDocument = async (req, res) => {
       documentId
     );
     
+    // Registered before indexing so a copy uploaded meanwhile links to this one
+    rememberHashes({ documentId, collectionName, metadata, processed: false });
+    
+    // Text is already extracted; chunks are embedded and indexed in the background
+    processingStatus.update(documentId, {
+      stage: 'queued',
+      collectionName,
+      textLength: extractedText.length
+    });
+    
     // Return initial response to client to show upload was successful
     res.status(202).json({
       message: 'Document uploaded successfully and processing started',
@@ -91,11 +197,21 @@ const uploadDocument = async (req, res) => {
     // Continue processing in background (after response is sent)
     try {
       // Add document content to ChromaDB
-      await chromaService.addDocument(extractedText, metadata, documentId);
+      processingStatus.update(documentId, { stage: 'indexing' });
+      let count = 0;
+      await chromaService.addDocument(extractedText, metadata, documentId, (chunksIndexed, totalChunks) => {
+        count = totalChunks;
+        processingStatus.update(documentId, { chunksIndexed, totalChunks });
+      });
+      processingStatus.update(documentId, { stage: 'complete', completedAt: new Date().toISOString() });
+      // Hash lookups now report the finished document, so copies are no longer sent again
+      rememberHashes({ documentId, collectionName, metadata, count, processed: true });
       console.log('Document added to ChromaDB:', documentId);
     } catch (chromaError) {
       console.error('Error adding document to ChromaDB:', chromaError.message);
-      // Nothing we can do at this point since response is already sent
+      // The response is already sent, so report the failure through the status endpoint
+      processingStatus.update(documentId, { stage: 'failed', error: chromaError.message });
+      forgetHashes(documentId);
     }
   } catch (error) {
     console.error('Error uploading document:', error);
@@ -110,7 +226,68 @@ const uploadDocument = async (req, res) => {
   }
 };
 
-// Get document by ID
+// Find a document's list entry without reading its chunks. Collection names end with
+// the first 8 characters of the document ID, so only matching collections are summarized
+// (each at most once); other collections are only checked if none match.
+const locateDocument = async (documentId) => {
+  for (const summary of documentSummaries.values()) {
+    if (summary.documentId === documentId) {
+      return summary;
+    }
+  }
+  
+  const collections = (await chromaService.listAllCollections()).filter(col => col.name.startsWith('doc_'));
+  const suffix = `_${documentId.substring(0, 8)}`;
+  const candidates = collections.filter(col => col.name.endsWith(suffix));
+  const statuses = statusesByCollection();
+  for (const collection of candidates.length > 0 ? candidates : collections) {
+    try {
+      const summary = await summarizeCollection(collection.name, statuses.get(collection.name));
+      if (summary.documentId === documentId) {
+        return summary;
+      }
+    } catch (e) {
+      // Collection unreadable, continue searching
+    }
+  }
+  return null;
+};
+
+// The first maxChars characters of a document's text, read a few chunks at a time
+const EXCERPT_PAGE_CHUNKS = 8;
+
+const loadDocumentExcerpt = async (documentId, maxChars) => {
+  const summary = await locateDocument(documentId);
+  if (!summary) {
+    return null;
+  }
+  
+  let text = '';
+  let metadata = summary.metadata;
+  for (let offset = 0; text.length < maxChars; offset += EXCERPT_PAGE_CHUNKS) {
+    const { chunks, total } = await chromaService.getDocumentChunks(
+      documentId, summary.collectionName, offset, EXCERPT_PAGE_CHUNKS
+    );
+    if (offset === 0 && chunks.length > 0) {
+      metadata = chunks[0].metadata;
+    }
+    text += chunks.map(chunk => chunk.text).join('');
+    if (chunks.length < EXCERPT_PAGE_CHUNKS || offset + chunks.length >= total) {
+      break;
+    }
+  }
+  
+  return {
+    id: documentId,
+    text: text.substring(0, maxChars),
+    textLength: summary.metadata.textLength || text.length,
+    metadata,
+    collectionName: summary.collectionName
+  };
+};
+
+// Get a document's metadata and a short text preview; the text itself is fetched
+// in chunk ranges from /:documentId/chunks
 const getDocumentById = async (req, res) => {
   try {
     const { documentId } = req.params;
@@ -120,38 +297,23 @@ const getDocumentById = async (req, res) => {
     }
     
     try {
-      // First, find which collection has this document
-      const collections = await chromaService.listAllCollections();
-      let document = null;
+      const summary = await locateDocument(documentId);
       
-      // Search through all document collections
-      for (const collection of collections) {
-        try {
-          if (collection.name.startsWith('doc_')) {
-            // Try to get document from this collection
-            try {
-              document = await chromaService.getDocumentFromCollection(documentId, collection.name);
-              if (document) {
-                break; // Found it
-              }
-            } catch (e) {
-              // Document not in this collection, continue searching
-            }
-          }
-        } catch (collectionError) {
-          console.error(`Error checking collection ${collection.name}:`, collectionError);
-        }
-      }
-      
-      if (!document) {
+      if (!summary) {
         return res.status(404).json({ error: 'Document not found' });
       }
       
+      // Only the first chunk is read, for its full metadata and the preview
+      const { chunks } = await chromaService.getDocumentChunks(documentId, summary.collectionName, 0, 1);
+      const firstText = chunks.length > 0 ? chunks[0].text : '';
+      
       return res.status(200).json({
-        documentId: document.id,
-        collectionName: document.collectionName,
-        metadata: document.metadata,
-        textPreview: document.text.substring(0, 300) + '...'
+        documentId: summary.documentId,
+        collectionName: summary.collectionName,
+        metadata: chunks.length > 0 ? chunks[0].metadata : summary.metadata,
+        count: summary.count,
+        processed: summary.processed,
+        textPreview: firstText.substring(0, 300) + '...'
       });
     } catch (storageError) {
       console.error('Error retrieving document:', storageError);
@@ -169,7 +331,139 @@ const getDocumentById = async (req, res) => {
   }
 };
 
+// Get a range of a document's indexed chunks, paginated with ?offset=&limit=
+// An optional ?collectionName= must name the document's own collection
+const getDocumentChunks = async (req, res) => {
+  try {
+    const { documentId } = req.params;
+    const offset = Math.max(parseInt(req.query.offset, 10) || 0, 0);
+    const limit = parseInt(req.query.limit, 10) > 0 ? parseInt(req.query.limit, 10) : null;
+    
+    // The collection always comes from the document itself, never straight from the query
+    const summary = await locateDocument(documentId);
+    if (!summary || (req.query.collectionName && req.query.collectionName !== summary.collectionName)) {
+      return res.status(404).json({ error: 'Document not found' });
+    }
+    const { collectionName } = summary;
+    
+    try {
+      const { chunks, total } = await chromaService.getDocumentChunks(documentId, collectionName, offset, limit);
+      return res.status(200).json({
+        documentId,
+        collectionName,
+        offset,
+        total,
+        chunks
+      });
+    } catch (e) {
+      return res.status(404).json({ error: 'Document not found' });
+    }
+  } catch (error) {
+    console.error('Error getting document chunks:', error);
+    return res.status(500).json({ 
+      error: 'Failed to get document chunks', 
+      details: error.message 
+    });
+  }
+};
+
+// Find an uploaded document by the SHA-256 of its file, so clients can skip
+// sending a file the server already has
+const getDocumentByHash = async (req, res) => {
+  try {
+    const existing = await findByHash('contentHash', req.params.contentHash.toLowerCase());
+    
+    if (!existing) {
+      return res.status(404).json({ error: 'No document with this content hash' });
+    }
+    
+    return res.status(200).json(existing);
+  } catch (error) {
+    console.error('Error looking up document by hash:', error);
+    return res.status(500).json({ 
+      error: 'Failed to look up document', 
+      details: error.message 
+    });
+  }
+};
+
+// Get background processing status for an uploaded document
+const getDocumentStatus = async (req, res) => {
+  const { documentId } = req.params;
+  const status = processingStatus.get(documentId);
+  
+  if (!status) {
+    return res.status(404).json({ error: 'No processing status for this document' });
+  }
+  
+  return res.status(200).json(status);
+};
+
+// Summaries of fully indexed document collections, keyed by collection name.
+// Indexed documents never change, so each collection is read at most once.
+const documentSummaries = new Map();
+
+// Map collection name -> processing status for uploads this server has seen
+const statusesByCollection = () => {
+  const byCollection = new Map();
+  for (const status of processingStatus.list()) {
+    if (status.collectionName) {
+      byCollection.set(status.collectionName, status);
+    }
+  }
+  return byCollection;
+};
+
+// Build the list entry for one collection, reading Chroma only on a cache miss
+const summarizeCollection = async (collectionName, status) => {
+  const cached = documentSummaries.get(collectionName);
+  if (cached) {
+    return cached;
+  }
+  
+  const { metadata, count } = await chromaService.getCollectionSummary(collectionName);
+  const processed = !status || status.stage === 'complete';
+  
+  if (!metadata) {
+    // Fallback if no metadata available
+    return {
+      documentId: collectionName,
+      collectionName,
+      metadata: {
+        originalName: collectionName,
+        uploadedAt: new Date().toISOString()
+      },
+      count: 0,
+      processed
+    };
+  }
+  
+  const summary = {
+    documentId: metadata.documentId,
+    collectionName,
+    metadata: {
+      originalName: metadata.originalName,
+      uploadedAt: metadata.uploadedAt,
+      fileSize: metadata.fileSize,
+      textLength: metadata.textLength,
+      contentHash: metadata.contentHash,
+      textHash: metadata.textHash
+    },
+    count,
+    processed
+  };
+  rememberHashes(summary);
+  
+  // Chunk counts keep growing while a document is indexing, so only cache finished ones
+  if (processed) {
+    documentSummaries.set(collectionName, summary);
+  }
+  return summary;
+};
+
 // List all document collections
+// Supports If-None-Match (ETag over collection names and indexing state) and
+// ?since=<ISO timestamp> to return only documents added or changed since a previous sync.
 const listDocuments = async (req, res) => {
   try {
     // Get all collections
@@ -177,42 +471,38 @@ const listDocuments = async (req, res) => {
     
     // Filter for document collections (they start with 'doc_')
     const docCollections = collections.filter(col => col.name.startsWith('doc_'));
+    const collectionNames = docCollections.map(col => col.name).sort();
+    const statuses = statusesByCollection();
     
-    if (!docCollections || docCollections.length === 0) {
-      return res.status(200).json({ documents: [] });
+    // The library only changes when collections appear/disappear or indexing progresses
+    const fingerprint = collectionNames.map(name => {
+      const status = statuses.get(name);
+      return [name, status ? status.stage : '', status ? status.chunksIndexed : 0];
+    });
+    const etag = `"${crypto.createHash('sha1').update(JSON.stringify(fingerprint)).digest('hex')}"`;
+    res.set('ETag', etag);
+    res.set('Cache-Control', 'no-cache');
+    
+    if (req.headers['if-none-match'] === etag) {
+      return res.status(304).end();
     }
     
+    const since = req.query.since ? Date.parse(req.query.since) : NaN;
+    const syncedAt = new Date().toISOString();
+    
+    // On an incremental sync skip documents the caller already has
+    const changed = docCollections.filter(collection => {
+      if (isNaN(since)) {
+        return true;
+      }
+      const cached = documentSummaries.get(collection.name);
+      return !cached || Date.parse(cached.metadata.uploadedAt) > since;
+    });
+    
     // Get summary info for each collection
-    const documents = await Promise.all(docCollections.map(async (collection) => {
+    const documents = await Promise.all(changed.map(async (collection) => {
       try {
-        const collectionInfo = await chromaService.getCollectionInfo(collection.name);
-        
-        // Extract document metadata from first chunk
-        if (collectionInfo && collectionInfo.metadatas && collectionInfo.metadatas.length > 0) {
-          const metadata = collectionInfo.metadatas[0];
-          return {
-            documentId: metadata.documentId,
-            collectionName: collection.name,
-            metadata: {
-              originalName: metadata.originalName,
-              uploadedAt: metadata.uploadedAt,
-              fileSize: metadata.fileSize,
-              textLength: metadata.textLength
-            },
-            count: collectionInfo.ids.length
-          };
-        }
-        
-        // Fallback if no metadata available
-        return {
-          documentId: collection.name,
-          collectionName: collection.name,
-          metadata: {
-            originalName: collection.name,
-            uploadedAt: new Date().toISOString()
-          },
-          count: 0
-        };
+        return await summarizeCollection(collection.name, statuses.get(collection.name));
       } catch (err) {
         console.error(`Error getting info for collection ${collection.name}:`, err);
         return {
@@ -227,7 +517,10 @@ const listDocuments = async (req, res) => {
     const validDocuments = documents.filter(doc => doc.documentId !== 'error');
     
     return res.status(200).json({
-      documents: validDocuments
+      documents: validDocuments,
+      collectionNames,
+      syncedAt,
+      incremental: !isNaN(since)
     });
   } catch (error) {
     console.error('Error listing documents:', error);
@@ -262,9 +555,119 @@ const queryDocuments = async (req, res) => {
   }
 };
 
+// Characters of document text included in the strategy prompt
+const STRATEGY_CONTEXT_CHARS = 12000;
+
+const buildStrategyPrompt = (companyName, document) => {
+  const name = document.metadata?.originalName || 'the uploaded document';
+  return `You are preparing a sales strategy for selling to ${companyName}.
+Use the following excerpt from "${name}" as your primary source of insight.
+
+--- DOCUMENT EXCERPT ---
+${document.text.substring(0, STRATEGY_CONTEXT_CHARS)}
+--- END OF EXCERPT ---
+
+Write the strategy in Markdown with these sections:
+## Key Insights from the Document
+## Current Situation at ${companyName}
+## Value Proposition
+## Potential Obstacles & Mitigation
+## Engagement Strategy
+## Recommended Next Steps
+
+Be specific to ${companyName} and cite the document where it supports a point.`;
+};
+
+// Write one server-sent event
+const sendEvent = (res, event, data) => {
+  res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+};
+
+// Generate a sales strategy for a company from an uploaded document.
+// Clients that send "Accept: text/event-stream" get the strategy as it is
+// generated: one "meta" event, "token" events carrying text deltas, then
+// "done" with the same payload as the JSON response (or "error").
+const generateSalesStrategy = async (req, res) => {
+  const { documentId, companyName } = req.body || {};
+  
+  if (!documentId || !companyName) {
+    return res.status(400).json({ error: 'documentId and companyName are required' });
+  }
+  
+  let document;
+  try {
+    // Only the excerpt used in the prompt is read, not the whole document
+    document = await loadDocumentExcerpt(documentId, STRATEGY_CONTEXT_CHARS);
+  } catch (error) {
+    console.error('Error retrieving document for strategy:', error);
+    return res.status(500).json({ 
+      error: 'Failed to retrieve document', 
+      details: error.message 
+    });
+  }
+  
+  if (!document) {
+    return res.status(404).json({ error: 'Document not found' });
+  }
+  
+  const companyInfo = {
+    companyName,
+    documentId,
+    documentName: document.metadata?.originalName,
+    collectionName: document.collectionName,
+    textLength: document.textLength,
+    excerptLength: document.text.length
+  };
+  const prompt = buildStrategyPrompt(companyName, document);
+  
+  if (!(req.get('Accept') || '').includes('text/event-stream')) {
+    try {
+      const salesStrategy = await aiService.generateContent(prompt);
+      return res.status(200).json({ documentId, companyName, companyInfo, salesStrategy });
+    } catch (error) {
+      console.error('Error generating document strategy:', error);
+      return res.status(500).json({ 
+        error: 'Failed to generate strategy', 
+        details: error.message 
+      });
+    }
+  }
+  
+  res.status(200).set({
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'X-Accel-Buffering': 'no'  // stop proxies from buffering the stream
+  });
+  res.flushHeaders();
+  
+  let disconnected = false;
+  res.on('close', () => {
+    disconnected = !res.writableEnded;
+  });
+  
+  sendEvent(res, 'meta', { documentId, companyName, companyInfo });
+  try {
+    const salesStrategy = await aiService.generateContentStream(prompt, (text) => {
+      if (!disconnected) {
+        sendEvent(res, 'token', { text });
+      }
+    });
+    sendEvent(res, 'done', { documentId, companyName, companyInfo, salesStrategy });
+  } catch (error) {
+    console.error('Error streaming document strategy:', error);
+    sendEvent(res, 'error', { error: 'Failed to generate strategy', details: error.message });
+  }
+  res.end();
+};
+
 module.exports = {
   uploadDocument,
   getDocumentById,
+  getDocumentChunks,
+  getDocumentStatus,
+  getDocumentByHash,
   queryDocuments,
-  listDocuments
+  listDocuments,
+  generateSalesStrategy
 };
\ No newline at end of file
@@ -46,6 +46,14 @@ const searchLinkedInProfiles = async (req, res) => {
     });
   } catch (error) {
     console.error('Error searching LinkedIn profiles:', error);
+    // Pass Exa rate limits through so clients back off and retry
+    if (error.response && error.response.status === 429) {
+      res.set('Retry-After', String(error.response.headers['retry-after'] || 5));
+      return res.status(429).json({
+        success: false,
+        message: 'LinkedIn search provider rate limit reached, retry later'
+      });
+    }
     return res.status(500).json({
       success: false,
       message: 'Error searching LinkedIn profiles',
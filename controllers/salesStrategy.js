@@ -16,7 +16,10 @@ const makeRequest = (options) => {
                 
                 // Check for non-200 status codes
                 if (response.statusCode !== 200) {
-                    return reject(new Error(`API returned status code ${response.statusCode}: ${body.toString()}`));
+                    const error = new Error(`API returned status code ${response.statusCode}: ${body.toString()}`);
+                    error.statusCode = response.statusCode;
+                    error.retryAfter = response.headers['retry-after'];
+                    return reject(error);
                 }
                 
                 try {
@@ -58,6 +61,11 @@ const safeApiCall = async (options, retries = 2) => {
       return await makeRequest(newOptions);
     }
     
+    // Retrying a rate limit right away only deepens it; let the caller back off
+    if (error.statusCode === 429) {
+      throw error;
+    }
+    
     // If retries left, wait a bit and try again
     if (retries > 0) {
       console.log(`Retrying API call, ${retries} attempts left...`);
@@ -164,6 +172,8 @@ const generateSalesStrategy = async (req, res) => {
             
             if (!searchResponse.data || !searchResponse.data.organizations || searchResponse.data.organizations.length === 0) {
                 console.log(`No company information found for ${companyName}, using fallback`);
+                // Let clients know this is canned data so they don't cache it
+                res.set('X-SalesGPT-Fallback', 'true');
                 return res.status(200).json(fallbackResponse);
             }
 
@@ -416,7 +426,16 @@ const generateSalesStrategy = async (req, res) => {
             
         } catch (apiError) {
             console.error("API error:", apiError);
+            // A rate-limited upstream is temporary; tell the client to retry rather than
+            // handing it the canned fallback strategy
+            if (apiError.statusCode === 429) {
+                res.set('Retry-After', String(apiError.retryAfter || 5));
+                return res.status(429).json({ 
+                    error: 'Company data provider rate limit reached, retry later' 
+                });
+            }
             // Return fallback response if API calls fail
+            res.set('X-SalesGPT-Fallback', 'true');
             return res.status(200).json(fallbackResponse);
         }
         
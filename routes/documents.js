@@ -11,12 +11,14 @@ const upload = multer({
 
 // Document routes
 router.post('/upload', upload.single('document'), documentController.uploadDocument);
-router.get('/:documentId', documentController.getDocumentById);
+// '/list' must be registered before '/:documentId' or it is captured as a document ID
 router.get('/list', documentController.listDocuments);
+router.get('/hash/:contentHash', documentController.getDocumentByHash);
+router.get('/:documentId/status', documentController.getDocumentStatus);
+router.get('/:documentId/chunks', documentController.getDocumentChunks);
+router.get('/:documentId', documentController.getDocumentById);
 router.post('/query', documentController.queryDocuments);
-
-// This route is likely causing the error - generateSalesStrategy is undefined
-// Comment it out if you don't need it yet or define the function
-// router.post('/generate-strategy', documentController.generateSalesStrategy);
+// Streams server-sent events when the client sends "Accept: text/event-stream"
+router.post('/generateSalesStrategy', documentController.generateSalesStrategy);
 
 module.exports = router;
\ No newline at end of file
@@ -16,10 +16,12 @@ router.get('/system/status', async (req, res) => {
     const status = {
       server: 'operational',
       timestamp: new Date().toISOString(),
-      components: {}
+      components: {},
+      componentLatencyMs: {}
     };
     
     // Check local storage
+    let started = Date.now();
     try {
       const dataPath = path.join(__dirname, '../data');
       await fs.access(dataPath);
@@ -28,8 +30,10 @@ router.get('/system/status', async (req, res) => {
       status.components.localStorage = 'degraded';
       status.components.localStorageMessage = 'Storage directories not accessible';
     }
+    status.componentLatencyMs.localStorage = Date.now() - started;
     
     // Check ChromaDB
+    started = Date.now();
     try {
       const chromaService = require('../services/chromaService');
       await chromaService.getOrCreateCollection();
@@ -38,6 +42,22 @@ router.get('/system/status', async (req, res) => {
       status.components.documentStorage = 'degraded';
       status.components.documentStorageMessage = err.message;
     }
+    status.componentLatencyMs.documentStorage = Date.now() - started;
+    
+    // Check Google Cloud Storage
+    started = Date.now();
+    try {
+      const { bucket, bucketName } = require('../config/gcloud');
+      const [exists] = await bucket.exists();
+      status.components.gcsStorage = exists ? 'operational' : 'degraded';
+      if (!exists) {
+        status.components.gcsStorageMessage = `Bucket ${bucketName} not found`;
+      }
+    } catch (err) {
+      status.components.gcsStorage = 'degraded';
+      status.components.gcsStorageMessage = err.message;
+    }
+    status.componentLatencyMs.gcsStorage = Date.now() - started;
     
     // Add memory usage
     const memoryUsage = process.memoryUsage();
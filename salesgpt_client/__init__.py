@@ -0,0 +1,46 @@
+"""Python client for the SalesGPT backend API."""
+
+from .aio import AsyncSalesGPTClient
+from .client import SalesGPTClient
+from .errors import APIError, DeadlineExceeded, JobCancelled, SalesGPTError, StreamError
+from .models import (
+    ChunkPage,
+    Document,
+    DocumentChunk,
+    DocumentListing,
+    DocumentStrategy,
+    LinkedInProfile,
+    ProcessingStatus,
+    ProfileSearchResult,
+    QueryHit,
+    QueryResult,
+    SalesStrategy,
+    SystemStatus,
+    UploadResult,
+)
+from .transport import Transport, TransportConfig
+
+__all__ = [
+    "APIError",
+    "AsyncSalesGPTClient",
+    "ChunkPage",
+    "DeadlineExceeded",
+    "Document",
+    "DocumentChunk",
+    "DocumentListing",
+    "DocumentStrategy",
+    "JobCancelled",
+    "LinkedInProfile",
+    "ProcessingStatus",
+    "ProfileSearchResult",
+    "QueryHit",
+    "QueryResult",
+    "SalesGPTClient",
+    "SalesGPTError",
+    "SalesStrategy",
+    "StreamError",
+    "SystemStatus",
+    "Transport",
+    "TransportConfig",
+    "UploadResult",
+]
@@ -0,0 +1,91 @@
+"""asyncio client for the SalesGPT API.
+
+Calls run on worker threads against the same pooled Transport as the
+synchronous client, so sync and async callers in one process share
+connections. An asyncio.Semaphore bounds how many calls are in flight.
+"""
+
+import asyncio
+
+from .client import DEFAULT_BASE_URL, DEFAULT_MAX_CONCURRENCY, SalesGPTClient
+
+
+class AsyncSalesGPTClient:
+    """Awaitable wrapper around SalesGPTClient with the same method names."""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, client=None, transport=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, **client_kwargs):
+        self.client = client or SalesGPTClient(
+            base_url, transport=transport, max_concurrency=max_concurrency, **client_kwargs
+        )
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+
+    @property
+    def semaphore(self):
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func, *args, **kwargs):
+        """Run a blocking callable on a worker thread under the concurrency limit."""
+        async with self.semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def request(self, method, endpoint, **kwargs):
+        return await self.run(self.client.request, method, endpoint, **kwargs)
+
+    async def generate_sales_strategy(self, company_name, location=None, **kwargs):
+        return await self.run(self.client.generate_sales_strategy, company_name, location, **kwargs)
+
+    async def upload_document(self, file, filename=None, **kwargs):
+        return await self.run(self.client.upload_document, file, filename, **kwargs)
+
+    async def find_document_by_hash(self, content_hash):
+        return await self.run(self.client.find_document_by_hash, content_hash)
+
+    async def list_documents(self):
+        return await self.run(self.client.list_documents)
+
+    async def get_document(self, document_id):
+        return await self.run(self.client.get_document, document_id)
+
+    async def document_chunks(self, document_id, collection_name=None, offset=0, limit=None):
+        return await self.run(self.client.document_chunks, document_id, collection_name, offset, limit)
+
+    async def query_documents(self, query, limit=5):
+        return await self.run(self.client.query_documents, query, limit)
+
+    async def generate_document_strategy(self, document_id, company_name, **kwargs):
+        return await self.run(self.client.generate_document_strategy, document_id, company_name, **kwargs)
+
+    async def stream_document_strategy(self, document_id, company_name, **kwargs):
+        """Async iterator over SalesGPTClient.stream_document_strategy events."""
+        events = self.client.stream_document_strategy(document_id, company_name, **kwargs)
+        async with self.semaphore:
+            try:
+                while True:
+                    event = await asyncio.to_thread(next, events, None)
+                    if event is None:
+                        return
+                    yield event
+            finally:
+                await asyncio.to_thread(events.close)
+
+    async def search_linkedin_profiles(self, company, position, location, limit=5, **kwargs):
+        return await self.run(
+            self.client.search_linkedin_profiles, company, position, location, limit, **kwargs
+        )
+
+    async def system_status(self, **kwargs):
+        return await self.run(self.client.system_status, **kwargs)
+
+    async def close(self):
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
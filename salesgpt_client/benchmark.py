@@ -0,0 +1,248 @@
+"""Load and latency benchmark for the endpoints the Streamlit app drives.
+
+Workers replay a weighted mix of API calls through SalesGPTClient, so
+pooling, retries and the concurrency cap are the same as in the app.
+The report is plain JSON (per-endpoint p50/p95/p99, throughput and
+error rate) and can be saved as a baseline and compared against later
+runs::
+
+    python -m salesgpt_client bench --standin --requests 500 --save-baseline baseline.json
+    python -m salesgpt_client bench --standin --requests 500 --baseline baseline.json
+"""
+
+import io
+import platform
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import SalesGPTClient
+from .errors import APIError
+from .telemetry import percentile
+
+# Relative weights of each call in a typical session: status and list on
+# every page view, queries and strategies less often, uploads rarely.
+DEFAULT_MIX = {
+    "system/status": 30,
+    "documents/list": 25,
+    "documents/query": 20,
+    "generateSalesStrategy": 10,
+    "linkedinProfiles/search": 10,
+    "documents/upload": 5,
+}
+
+# A run regresses when p95 grows by more than this fraction and this many milliseconds
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_SLACK_MS = 5.0
+
+COMPANIES = ("Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises")
+LOCATIONS = ("United States", "Germany", "Singapore", None)
+QUERIES = (
+    "What are the key challenges in the sales process?",
+    "pricing objections",
+    "renewal risk and churn signals",
+    "security review requirements",
+    "budget approval process",
+)
+POSITIONS = ("VP Sales", "CTO", "Head of Procurement")
+
+
+def parse_mix(spec):
+    """Parse ``"documents/query=5,system/status=1"`` into a weight dict."""
+    mix = {}
+    for part in (spec or "").split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"unknown endpoint {name!r}; choose from {', '.join(DEFAULT_MIX)}")
+        mix[name] = float(weight or 1)
+    return mix or dict(DEFAULT_MIX)
+
+
+def sample_pdf(text="SalesGPT benchmark document"):
+    """A small, valid one-page PDF containing ``text``."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _operations(pdf):
+    return {
+        "system/status": lambda client, rng: client.system_status(),
+        "documents/list": lambda client, rng: client.list_documents(),
+        "documents/query": lambda client, rng: client.query_documents(rng.choice(QUERIES), 5),
+        "generateSalesStrategy": lambda client, rng: client.generate_sales_strategy(
+            rng.choice(COMPANIES), rng.choice(LOCATIONS)
+        ),
+        "linkedinProfiles/search": lambda client, rng: client.search_linkedin_profiles(
+            rng.choice(COMPANIES), rng.choice(POSITIONS), rng.choice(LOCATIONS[:3]), 5
+        ),
+        # The same bytes every time; allow duplicates so each call is a full upload
+        "documents/upload": lambda client, rng: client.upload_document(
+            io.BytesIO(pdf), "benchmark.pdf", "application/pdf", allow_duplicate=True
+        ),
+    }
+
+
+def summarize(samples, elapsed):
+    """Aggregate ``(endpoint, seconds, ok, error)`` samples into a stats dict."""
+
+    def stats(rows):
+        latencies = sorted(seconds * 1000 for _, seconds, _, _ in rows)
+        errors = sum(1 for _, _, ok, _ in rows if not ok)
+        return {
+            "requests": len(rows),
+            "errors": errors,
+            "error_rate": errors / len(rows) if rows else 0.0,
+            "throughput": len(rows) / elapsed if elapsed > 0 else 0.0,
+            "mean_ms": sum(latencies) / len(latencies) if latencies else None,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1] if latencies else None,
+        }
+
+    endpoints = {}
+    for sample in samples:
+        endpoints.setdefault(sample[0], []).append(sample)
+    errors = {}
+    for endpoint, _, ok, error in samples:
+        if not ok:
+            errors.setdefault(endpoint, {})
+            errors[endpoint][error] = errors[endpoint].get(error, 0) + 1
+    return {
+        "overall": stats(samples),
+        "endpoints": {name: stats(rows) for name, rows in sorted(endpoints.items())},
+        "errors": errors,
+    }
+
+
+def run_benchmark(base_url, concurrency=8, requests=200, duration=None, mix=None,
+                  seed=0, client=None):
+    """Replay ``requests`` calls (or run for ``duration`` seconds) and return a report dict."""
+    mix = mix or dict(DEFAULT_MIX)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    operations = _operations(sample_pdf())
+    owns_client = client is None
+    client = client or SalesGPTClient(base_url, max_concurrency=concurrency)
+
+    samples = []
+    lock = threading.Lock()
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    def next_ticket():
+        nonlocal issued
+        with lock:
+            if deadline is None and issued >= requests:
+                return False
+            issued += 1
+        return deadline is None or time.perf_counter() < deadline
+
+    def worker(index):
+        rng = random.Random(seed * 1000 + index)
+        while next_ticket():
+            name = rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            ok, error = True, None
+            try:
+                operations[name](client, rng)
+            except APIError as e:
+                ok, error = False, f"HTTP {e.status_code}"
+            except Exception as e:
+                ok, error = False, type(e).__name__
+            elapsed = time.perf_counter() - started
+            with lock:
+                samples.append((name, elapsed, ok, error))
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+            for future in [pool.submit(worker, i) for i in range(concurrency)]:
+                future.result()
+    finally:
+        if owns_client:
+            client.close()
+    elapsed = time.perf_counter() - started
+
+    report = summarize(samples, elapsed)
+    report["config"] = {
+        "base_url": base_url,
+        "concurrency": concurrency,
+        "requests": None if duration else requests,
+        "duration": duration,
+        "mix": mix,
+        "seed": seed,
+    }
+    report["elapsed_s"] = elapsed
+    report["started_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - elapsed))
+    report["host"] = {"python": platform.python_version(), "platform": platform.platform()}
+    return report
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE, slack_ms=DEFAULT_SLACK_MS):
+    """List regressions of ``report`` against ``baseline``; empty when none.
+
+    An endpoint regresses when its p95 exceeds the baseline p95 by more
+    than ``tolerance`` (relative) plus ``slack_ms`` (absolute), or when its
+    error rate rises by more than one percentage point.
+    """
+    regressions = []
+    for name, before in baseline.get("endpoints", {}).items():
+        after = report.get("endpoints", {}).get(name)
+        if after is None or not after["requests"]:
+            continue
+        if before.get("p95_ms") is not None and after["p95_ms"] is not None:
+            limit = before["p95_ms"] * (1 + tolerance) + slack_ms
+            if after["p95_ms"] > limit:
+                regressions.append({
+                    "endpoint": name,
+                    "metric": "p95_ms",
+                    "baseline": before["p95_ms"],
+                    "current": after["p95_ms"],
+                    "limit": limit,
+                })
+        if after["error_rate"] > before.get("error_rate", 0.0) + 0.01:
+            regressions.append({
+                "endpoint": name,
+                "metric": "error_rate",
+                "baseline": before.get("error_rate", 0.0),
+                "current": after["error_rate"],
+                "limit": before.get("error_rate", 0.0) + 0.01,
+            })
+    return regressions
+
+
+def format_table(report):
+    """Human-readable summary of a report."""
+    header = f"{'endpoint':<26}{'req':>6}{'err%':>7}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}"
+    lines = [header, "-" * len(header)]
+    rows = list(report["endpoints"].items()) + [("overall", report["overall"])]
+    for name, row in rows:
+        def ms(value):
+            return f"{value:.1f}" if value is not None else "-"
+        lines.append(
+            f"{name:<26}{row['requests']:>6}{row['error_rate'] * 100:>6.1f}%{row['throughput']:>8.1f}"
+            f"{ms(row['p50_ms']):>9}{ms(row['p95_ms']):>9}{ms(row['p99_ms']):>9}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,138 @@
+"""Account brief: run the strategy, document and contact calls at once.
+
+Each section is an independent callable returning ``(payload, from_cache)``.
+They all start together, so the brief takes as long as its slowest
+section instead of the sum of all of them, and a failing or slow section
+never holds back the others.
+"""
+
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from .bulk import CACHED, DONE, FAILED, QUEUED, RUNNING, STATUS_ICONS
+
+
+STRATEGY = "strategy"
+INSIGHTS = "insights"
+DOCUMENT_STRATEGY = "document_strategy"
+CONTACTS = "contacts"
+
+SECTION_LABELS = {
+    STRATEGY: "Sales strategy",
+    INSIGHTS: "Document insights",
+    DOCUMENT_STRATEGY: "Document-based strategy",
+    CONTACTS: "LinkedIn contacts",
+}
+
+
+@dataclass
+class BriefSection:
+    key: str
+    fetch: object = field(repr=False)
+    status: str = QUEUED
+    result: object = field(default=None, repr=False)
+    error: str = None
+    started: float = None  # seconds after the brief started
+    elapsed: float = None
+    reported: bool = False  # yielded by run_brief
+    _future: object = field(default=None, repr=False, compare=False)
+
+    @property
+    def label(self):
+        return SECTION_LABELS.get(self.key, self.key)
+
+    @property
+    def finished(self):
+        return self.status in (DONE, CACHED, FAILED)
+
+    @property
+    def status_label(self):
+        return STATUS_ICONS.get(self.status, self.status)
+
+
+@dataclass
+class BriefTiming:
+    wall: float  # end to end
+    total: float  # sum of every section, i.e. the sequential cost
+    critical: str = None  # key of the slowest section
+
+    @property
+    def saved(self):
+        return max(self.total - self.wall, 0.0)
+
+
+def run_brief(sections, deadline=None, poll_interval=0.25, origin=None):
+    """Start every section at once and yield each one as it finishes.
+
+    Yields None every ``poll_interval`` seconds while sections are still
+    running. Sections still running after ``deadline`` seconds are marked
+    failed and yielded; their threads are left to finish in the
+    background and their results are discarded.
+
+    Calling it again after the caller stopped iterating (e.g. a Streamlit
+    rerun) waits for the sections already started instead of fetching
+    them again, and yields only sections not yet reported. Pass the first
+    call's ``origin`` (a ``time.perf_counter()`` value) to keep its clock.
+    """
+    origin = time.perf_counter() if origin is None else origin
+
+    def work(section):
+        section.status = RUNNING
+        started = time.perf_counter()
+        section.started = started - origin
+        try:
+            result, from_cache = section.fetch()
+        except Exception as e:
+            if not section.finished:
+                section.error = str(e)
+                section.status = FAILED
+        else:
+            if not section.finished:
+                section.result = result
+                section.status = CACHED if from_cache else DONE
+        finally:
+            if section.elapsed is None:
+                section.elapsed = time.perf_counter() - started
+        return section
+
+    pool = ThreadPoolExecutor(max_workers=max(len(sections), 1), thread_name_prefix="brief")
+    try:
+        for section in sections:
+            if section._future is None:
+                # Workers keep the caller's context, e.g. its rate limiter owner
+                section._future = pool.submit(contextvars.copy_context().run, work, section)
+        pending = {section._future: section for section in sections if not section.reported}
+        while pending:
+            remaining = None if deadline is None else deadline - (time.perf_counter() - origin)
+            if remaining is not None and remaining <= 0:
+                for section in pending.values():
+                    if not section.finished:
+                        section.status = FAILED
+                        section.error = f"No response within {deadline:.0f}s"
+                        section.elapsed = time.perf_counter() - origin - (section.started or 0.0)
+                    section.reported = True
+                    yield section
+                return
+            timeout = poll_interval if remaining is None else min(poll_interval, remaining)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                yield None
+            for future in done:
+                section = pending.pop(future)
+                section.reported = True
+                yield section
+    finally:
+        # Don't block on sections abandoned at the deadline
+        pool.shutdown(wait=False)
+
+
+def brief_timing(sections, wall):
+    timed = [section for section in sections if section.elapsed is not None]
+    critical = max(timed, key=lambda section: section.elapsed).key if timed else None
+    return BriefTiming(
+        wall=wall,
+        total=sum(section.elapsed for section in timed),
+        critical=critical,
+    )
@@ -0,0 +1,200 @@
+"""Run generateSalesStrategy for many accounts with a bounded worker pool."""
+
+import contextvars
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from .cache import strategy_cache_key
+
+
+# Accepted input column names, matched ignoring case, spaces and underscores
+COMPANY_COLUMNS = ("companyname", "company", "account", "accountname", "name")
+LOCATION_COLUMNS = ("location", "country", "region", "city")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+CACHED = "cached"
+FAILED = "failed"
+
+STATUS_ICONS = {
+    QUEUED: "⏳ queued",
+    RUNNING: "🔄 running",
+    DONE: "✅ done",
+    CACHED: "⚡ cached",
+    FAILED: "❌ failed",
+}
+
+
+class BulkInputError(ValueError):
+    pass
+
+
+@dataclass
+class BulkRow:
+    index: int
+    company_name: str
+    location: str = ""
+    status: str = QUEUED
+    result: dict = field(default=None, repr=False)
+    error: str = None
+    elapsed: float = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, CACHED, FAILED)
+
+
+def _find_column(columns, candidates):
+    lowered = {"".join(ch for ch in str(c).lower() if ch.isalnum()): c for c in columns}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    return None
+
+
+def load_accounts(source):
+    """Build BulkRows from a DataFrame, a CSV path or a CSV file object."""
+    df = source if isinstance(source, pd.DataFrame) else pd.read_csv(source)
+
+    company_col = _find_column(df.columns, COMPANY_COLUMNS)
+    if company_col is None:
+        raise BulkInputError(
+            "Could not find a company column. Expected one of: " + ", ".join(COMPANY_COLUMNS)
+        )
+    location_col = _find_column(df.columns, LOCATION_COLUMNS)
+
+    rows = []
+    for company, location in zip(
+        df[company_col],
+        df[location_col] if location_col is not None else [""] * len(df),
+    ):
+        company = "" if pd.isna(company) else str(company).strip()
+        if not company:
+            continue
+        location = "" if pd.isna(location) else str(location).strip()
+        rows.append(BulkRow(index=len(rows), company_name=company, location=location))
+    return rows
+
+
+def strategy_fetcher(client, cache=None, timeout=120, force_refresh=False):
+    """Return a fetch(row) callable that serves from ``cache`` when it can.
+
+    ``client`` is a SalesGPTClient. The callable raises on transport or
+    HTTP errors so run_bulk can mark the row failed; it never touches
+    Streamlit, so it is safe in worker threads.
+    """
+
+    def fetch(row):
+        key = strategy_cache_key(row.company_name, row.location)
+        if cache is not None and not force_refresh:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry.value, True
+
+        strategy = client.generate_sales_strategy(row.company_name, row.location, timeout=timeout)
+        if cache is not None and not strategy.fallback:
+            cache.put(key, strategy.raw)
+        return strategy.raw, False
+
+    return fetch
+
+
+def run_bulk(rows, fetch, max_workers=4, poll_interval=0.5):
+    """Fan ``rows`` out to ``fetch`` and yield each row as its state changes.
+
+    At most ``max_workers`` requests are in flight. A failing row is
+    recorded with its error and never stops the others. The generator
+    also yields None every ``poll_interval`` seconds so callers can
+    refresh a live view of the running rows. Rows still queued when the
+    caller stops iterating are not sent and keep their QUEUED status.
+    """
+
+    def work(row):
+        row.status = RUNNING
+        started = time.perf_counter()
+        try:
+            row.result, from_cache = fetch(row)
+            row.status = CACHED if from_cache else DONE
+        except Exception as e:
+            row.error = str(e)
+            row.status = FAILED
+        finally:
+            row.elapsed = time.perf_counter() - started
+        return row
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bulk")
+    try:
+        # Workers keep the caller's context, e.g. its rate limiter owner
+        pending = {pool.submit(contextvars.copy_context().run, work, row) for row in rows if not row.finished}
+        while pending:
+            done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            if not done:
+                yield None
+            for future in done:
+                yield future.result()
+    finally:
+        # A caller that stops iterating doesn't wait for the rest; queued rows stay QUEUED
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def status_frame(rows):
+    return pd.DataFrame(
+        [
+            {
+                "#": row.index + 1,
+                "Company": row.company_name,
+                "Location": row.location,
+                "Status": STATUS_ICONS.get(row.status, row.status),
+                "Time (s)": round(row.elapsed, 1) if row.elapsed is not None else None,
+                "Error": row.error or "",
+            }
+            for row in rows
+        ]
+    )
+
+
+def results_frame(rows):
+    """Flatten completed results into one row per account for CSV export."""
+    records = []
+    for row in rows:
+        result = row.result or {}
+        strategy = result.get("salesStrategy") or {}
+        value_prop = strategy.get("valueProposition") or {}
+        records.append({
+            "company": row.company_name,
+            "location": row.location,
+            "status": row.status,
+            "error": row.error or "",
+            "elapsed_s": round(row.elapsed, 2) if row.elapsed is not None else None,
+            "companyName": result.get("companyName"),
+            "industry": result.get("industry"),
+            "businessType": result.get("businessType"),
+            "headquarters": result.get("headquarters"),
+            "employeeCount": (result.get("companySize") or {}).get("employeeCount"),
+            "ccsScore": strategy.get("ccsScore"),
+            "keyMessage": value_prop.get("keyMessage"),
+            "engagementStrategy": "; ".join(map(str, strategy.get("engagementStrategy") or [])),
+        })
+    return pd.DataFrame(records)
+
+
+def results_records(rows):
+    return [
+        {
+            "company": row.company_name,
+            "location": row.location,
+            "status": row.status,
+            "error": row.error,
+            "result": row.result,
+        }
+        for row in rows
+    ]
+
+
+def results_json(rows):
+    return json.dumps(results_records(rows), indent=2)
@@ -0,0 +1,160 @@
+"""Disk-backed TTL cache with size-based LRU eviction."""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "SALESGPT_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "salesgpt"),
+)
+
+
+def normalize_text(value):
+    """Casefold and collapse whitespace so trivially different inputs match."""
+    return " ".join((value or "").split()).casefold()
+
+
+def strategy_cache_key(company_name, location=None):
+    return f"{normalize_text(company_name)}|{normalize_text(location)}"
+
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+
+def query_cache_key(query, limit):
+    """Key for a documents/query call; punctuation is ignored as well as case and spacing."""
+    return f"{normalize_text(_PUNCTUATION_RE.sub(' ', query or ''))}|{int(limit)}"
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    value: object
+    created_at: float
+    size: int
+
+    @property
+    def age(self):
+        return time.time() - self.created_at
+
+
+class ResultCache:
+    """Persistent key/value cache stored in a single SQLite file.
+
+    Entries older than ``ttl`` seconds are treated as misses and purged.
+    When the stored JSON exceeds ``max_bytes`` the least recently read
+    entries are evicted first.
+    """
+
+    def __init__(self, path, ttl=24 * 3600, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        """Return a CacheEntry for ``key`` or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, size, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return CacheEntry(key, json.loads(value), created_at, size)
+
+    def put(self, key, value):
+        payload = json.dumps(value)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def _evict(self, now):
+        if self.ttl is not None:
+            self._conn.execute(
+                "DELETE FROM entries WHERE created_at < ?", (now - self.ttl,)
+            )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop least recently read entries until we are back under budget
+        rows = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self):
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "entries": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0,
+        }
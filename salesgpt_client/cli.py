@@ -0,0 +1,333 @@
+"""Command line entry point: ``python -m salesgpt_client <command>``.
+
+Examples::
+
+    python -m salesgpt_client status
+    python -m salesgpt_client strategies accounts.csv --concurrency 8 -o strategies.jsonl
+    python -m salesgpt_client ingest contracts/ archive.zip --concurrency 6
+    python -m salesgpt_client query "pricing objections" --limit 3
+    python -m salesgpt_client bench --standin --concurrency 16 --requests 1000 -o report.json
+    python -m salesgpt_client standin --port 3003
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import requests
+
+from . import benchmark, ingest
+from .aio import AsyncSalesGPTClient
+from .bulk import CACHED, DONE, FAILED, load_accounts, results_frame, results_records, strategy_fetcher
+from .cache import DEFAULT_CACHE_DIR, ResultCache
+from .client import DEFAULT_BASE_URL, SalesGPTClient
+from .errors import SalesGPTError
+from .ratelimit import DEFAULT_LIMITS
+from .standin import StandinBackend, parse_ceilings, parse_latency
+
+
+def _dump(value):
+    # Models keep the untouched API payload in .raw; print that
+    if isinstance(value, list):
+        value = [getattr(v, "raw", v) for v in value]
+    else:
+        value = getattr(value, "raw", value)
+    json.dump(value, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
+
+
+def _log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+async def _run_strategies(args):
+    rows = load_accounts(args.accounts)
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(os.path.join(DEFAULT_CACHE_DIR, "strategies.sqlite3"))
+
+    started = time.perf_counter()
+    rate_limits = None if args.no_rate_limit else DEFAULT_LIMITS
+    async with AsyncSalesGPTClient(args.base_url, max_concurrency=args.concurrency, rate_limits=rate_limits) as client:
+        fetch = strategy_fetcher(
+            client.client, cache, timeout=args.timeout, force_refresh=args.force_refresh
+        )
+
+        async def run_row(row):
+            row_started = time.perf_counter()
+            try:
+                row.result, from_cache = await client.run(fetch, row)
+                row.status = CACHED if from_cache else DONE
+            except Exception as e:
+                row.error = str(e)
+                row.status = FAILED
+            row.elapsed = time.perf_counter() - row_started
+            _log(f"[{row.index + 1}/{len(rows)}] {row.company_name}: {row.status}"
+                 + (f" ({row.error})" if row.error else f" in {row.elapsed:.1f}s"))
+
+        await asyncio.gather(*(run_row(row) for row in rows))
+
+    failed = sum(1 for row in rows if row.status == FAILED)
+    _log(f"{len(rows)} accounts, {failed} failed, {time.perf_counter() - started:.1f}s total")
+
+    if args.output and args.output.endswith(".csv"):
+        results_frame(rows).to_csv(args.output, index=False)
+    else:
+        lines = "\n".join(json.dumps(record) for record in results_records(rows))
+        if args.output:
+            with open(args.output, "w") as fh:
+                fh.write(lines + "\n")
+        else:
+            sys.stdout.write(lines + "\n")
+    return 1 if failed else 0
+
+
+def _run_ingest(args):
+    items = ingest.items_from_paths(args.paths)
+    if not items:
+        _log("no PDF or DOCX files found")
+        return 1
+    journal = ingest.IngestJournal(args.journal)
+    if args.restart:
+        journal.clear()
+
+    started = time.perf_counter()
+    with SalesGPTClient(args.base_url) as client:
+        finished = 0
+        for item in ingest.run_ingest(items, client, journal, max_workers=args.concurrency,
+                                      dedupe=not args.allow_duplicates):
+            if item is None:
+                continue
+            finished += 1
+            _log(f"[{finished}/{len(items)}] {item.name}: {item.status}"
+                 + (f" ({item.error})" if item.error else f" {item.document_id} in {item.elapsed:.1f}s"))
+    journal.close()
+
+    summary = ingest.summarize(items, time.perf_counter() - started)
+    _log(f"{summary.files} files, {summary.done} indexed, {summary.resumed} already ingested, "
+         f"{summary.linked} linked to server duplicates, {summary.failed} failed, {summary.wall:.1f}s total "
+         f"({summary.files_per_minute:.1f} files/min, "
+         f"{summary.bytes_uploaded / 1024 / 1024:.1f} MB sent at {summary.megabytes_per_second:.2f} MB/s)")
+    if summary.duplicates:
+        _log(f"duplicates saved {summary.saved_bytes / 1024 / 1024:.1f} MB of uploads "
+             f"and {summary.saved_embeddings} chunk embeddings")
+    return 1 if summary.failed else 0
+
+
+def _run_bench(args):
+    backend = None
+    base_url = args.base_url
+    if args.standin:
+        backend = StandinBackend(
+            latency=parse_latency(args.latency),
+            error_rate=args.error_rate,
+            seed=args.seed,
+            ceilings=parse_ceilings(args.ceiling),
+        )
+        base_url = backend.start()
+        _log(f"stand-in backend at {base_url}")
+
+    client = SalesGPTClient(
+        base_url, max_concurrency=args.concurrency, rate_limits=DEFAULT_LIMITS if args.rate_limit else None
+    )
+    try:
+        report = benchmark.run_benchmark(
+            base_url,
+            concurrency=args.concurrency,
+            requests=args.requests,
+            duration=args.duration,
+            mix=benchmark.parse_mix(args.mix),
+            seed=args.seed,
+            client=client,
+        )
+    finally:
+        client.close()
+        if backend is not None:
+            backend.stop()
+    report["config"]["standin"] = bool(args.standin)
+    report["config"]["rate_limit"] = bool(args.rate_limit)
+    if client.limiter is not None:
+        report["rate_limiter"] = client.limiter.stats()
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = benchmark.compare(report, json.load(fh), tolerance=args.tolerance)
+        report["regressions"] = regressions
+        for r in regressions:
+            _log(f"REGRESSION {r['endpoint']} {r['metric']}: {r['current']:.3f} > {r['limit']:.3f} "
+                 f"(baseline {r['baseline']:.3f})")
+        status = 1 if regressions else 0
+
+    _log(benchmark.format_table(report))
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fh:
+            json.dump(report, fh, indent=2)
+        _log(f"baseline saved to {args.save_baseline}")
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    else:
+        _dump(report)
+    return status
+
+
+def _run_standin(args):
+    backend = StandinBackend(
+        latency=parse_latency(args.latency),
+        error_rate=args.error_rate,
+        seed=args.seed,
+        ceilings=parse_ceilings(args.ceiling),
+    )
+    _log(f"stand-in backend at {backend.start(args.host, args.port)} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        backend.stop()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="salesgpt_client", description="SalesGPT API client")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL,
+                        help="API base URL (default: $SALESGPT_API_URL or %(default)s)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("status", help="Show backend system status")
+    sub.add_parser("list", help="List uploaded documents")
+
+    p = sub.add_parser("get", help="Show one document's metadata")
+    p.add_argument("document_id")
+
+    p = sub.add_parser("text", help="Print a range of a document's text, by chunk")
+    p.add_argument("document_id")
+    p.add_argument("--start", type=int, default=0, help="First chunk, counting from 0")
+    p.add_argument("--count", type=int, default=10, help="Number of chunks")
+
+    p = sub.add_parser("upload", help="Upload PDF/DOCX files")
+    p.add_argument("files", nargs="+")
+
+    p = sub.add_parser("ingest", help="Upload and index many files, folders or zip archives in parallel")
+    p.add_argument("paths", nargs="+", help="PDF/DOCX files, folders (searched recursively) or zip archives")
+    p.add_argument("--concurrency", type=int, default=ingest.DEFAULT_MAX_WORKERS)
+    p.add_argument("--journal", default=ingest.DEFAULT_JOURNAL_PATH,
+                   help="Progress journal used to skip files already ingested")
+    p.add_argument("--restart", action="store_true", help="Forget earlier progress and ingest every file again")
+    p.add_argument("--allow-duplicates", action="store_true",
+                   help="Upload and index files even if the server already has an identical copy")
+
+    p = sub.add_parser("query", help="Search uploaded documents")
+    p.add_argument("query")
+    p.add_argument("--limit", type=int, default=5)
+
+    p = sub.add_parser("strategy", help="Generate a sales strategy for one company")
+    p.add_argument("company")
+    p.add_argument("--location", default=None)
+
+    p = sub.add_parser("doc-strategy", help="Generate a document-based sales strategy")
+    p.add_argument("document_id")
+    p.add_argument("company")
+    p.add_argument("--stream", action="store_true", help="Print the strategy text as it is generated")
+
+    p = sub.add_parser("profiles", help="Search LinkedIn profiles")
+    p.add_argument("company")
+    p.add_argument("position")
+    p.add_argument("location")
+    p.add_argument("--limit", type=int, default=5)
+
+    p = sub.add_parser("strategies", help="Generate strategies for a CSV of accounts")
+    p.add_argument("accounts", help="CSV with a company column and optional location column")
+    p.add_argument("-o", "--output", help="Write results to a .jsonl or .csv file (default: JSON lines on stdout)")
+    p.add_argument("--concurrency", type=int, default=4)
+    p.add_argument("--timeout", type=float, default=120)
+    p.add_argument("--no-cache", action="store_true", help="Do not read or write the strategy cache")
+    p.add_argument("--force-refresh", action="store_true", help="Regenerate even if cached")
+    p.add_argument("--no-rate-limit", action="store_true",
+                   help="Send as fast as --concurrency allows instead of pacing to the upstream limits")
+
+    p = sub.add_parser("bench", help="Benchmark a mix of API calls and report latency percentiles")
+    p.add_argument("--standin", action="store_true", help="Run against a local stand-in backend instead of --base-url")
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--requests", type=int, default=200, help="Total calls to make (ignored with --duration)")
+    p.add_argument("--duration", type=float, default=None, help="Run for this many seconds instead")
+    p.add_argument("--mix", default="", help="Endpoint weights, e.g. documents/query=5,system/status=1 "
+                                             "(default: a typical app session)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("-o", "--output", help="Write the JSON report to a file (default: stdout)")
+    p.add_argument("--save-baseline", metavar="PATH", help="Also save the report as a baseline")
+    p.add_argument("--baseline", metavar="PATH", help="Compare against a saved baseline; exit 1 on regression")
+    p.add_argument("--tolerance", type=float, default=benchmark.DEFAULT_TOLERANCE,
+                   help="Allowed relative p95 increase over the baseline (default: %(default)s)")
+    p.add_argument("--rate-limit", action="store_true",
+                   help="Pace rate-limited endpoints with the client's adaptive limiter")
+    _add_standin_arguments(p)
+
+    p = sub.add_parser("standin", help="Serve a local stand-in backend")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=3003)
+    p.add_argument("--seed", type=int, default=None)
+    _add_standin_arguments(p)
+    return parser
+
+
+def _add_standin_arguments(p):
+    p.add_argument("--latency", action="append", default=[], metavar="ENDPOINT=SECONDS",
+                   help="Override stand-in latency for an endpoint; repeatable")
+    p.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stand-in responses that fail with 500")
+    p.add_argument("--ceiling", action="append", default=[], metavar="ENDPOINT=RPS",
+                   help="Answer 429 beyond this many requests per second to an endpoint; repeatable")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "strategies":
+        return asyncio.run(_run_strategies(args))
+    if args.command == "ingest":
+        return _run_ingest(args)
+    if args.command == "bench":
+        return _run_bench(args)
+    if args.command == "standin":
+        return _run_standin(args)
+
+    try:
+        with SalesGPTClient(args.base_url) as client:
+            if args.command == "status":
+                _dump(client.system_status())
+            elif args.command == "list":
+                _dump(client.list_documents())
+            elif args.command == "get":
+                _dump(client.get_document(args.document_id))
+            elif args.command == "text":
+                page = client.document_chunks(args.document_id, offset=args.start, limit=args.count)
+                if page.chunks:
+                    sys.stdout.write("".join(chunk.text for chunk in page.chunks) + "\n")
+                _log(f"{len(page.chunks)} chunks from {page.offset} of {page.total}")
+            elif args.command == "upload":
+                _dump([client.upload_document(path) for path in args.files])
+            elif args.command == "query":
+                _dump(client.query_documents(args.query, args.limit))
+            elif args.command == "strategy":
+                _dump(client.generate_sales_strategy(args.company, args.location))
+            elif args.command == "doc-strategy" and args.stream:
+                for kind, value in client.stream_document_strategy(args.document_id, args.company):
+                    if kind == "token":
+                        sys.stdout.write(value)
+                        sys.stdout.flush()
+                sys.stdout.write("\n")
+            elif args.command == "doc-strategy":
+                _dump(client.generate_document_strategy(args.document_id, args.company))
+            elif args.command == "profiles":
+                _dump(client.search_linkedin_profiles(args.company, args.position, args.location, args.limit))
+    except (SalesGPTError, requests.RequestException) as e:
+        _log(f"error: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
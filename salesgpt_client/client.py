@@ -0,0 +1,386 @@
+"""Synchronous client for the SalesGPT API."""
+
+import contextlib
+import os
+import threading
+import time
+
+import requests
+
+from . import sse
+from .deadline import cap_timeout, current_deadline, in_background, remaining
+from .errors import APIError, DeadlineExceeded, StreamError
+from .models import (
+    ChunkPage,
+    Document,
+    DocumentListing,
+    DocumentStrategy,
+    ProcessingStatus,
+    ProfileSearchResult,
+    QueryResult,
+    SalesStrategy,
+    SystemStatus,
+    UploadResult,
+)
+from .profiler import section
+from .ratelimit import RateLimiter, current_owner, retry_after_seconds
+from .singleflight import SingleFlight, request_key
+from .telemetry import Telemetry
+from .transport import Transport
+from .upload import MultipartStream
+
+
+DEFAULT_BASE_URL = os.environ.get("SALESGPT_API_URL", "http://localhost:3003/api")
+DEFAULT_MAX_CONCURRENCY = int(os.environ.get("SALESGPT_MAX_CONCURRENCY", 16))
+# Slots background jobs never take, so interactive calls are not queued behind long generations
+DEFAULT_INTERACTIVE_SLOTS = int(os.environ.get("SALESGPT_INTERACTIVE_SLOTS", 4))
+
+# Per-endpoint default timeouts in seconds
+STRATEGY_TIMEOUT = 120
+UPLOAD_TIMEOUT = 180
+STATUS_TIMEOUT = 5
+
+
+class SalesGPTClient:
+    """Thread-safe client covering every endpoint the Streamlit app uses.
+
+    All calls share one pooled Transport and at most ``max_concurrency``
+    requests are in flight at once, regardless of how many threads use
+    the client. With ``coalesce=True``, identical JSON requests made while
+    one is already in flight share that call's response. ``rate_limits``
+    (a dict of ratelimit.EndpointLimit, e.g. ratelimit.DEFAULT_LIMITS)
+    paces those endpoints adaptively and resends calls answered with 429.
+    Work in a background job (see ``jobs``) may hold at most
+    ``max_concurrency - interactive_slots`` of the slots.
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, transport=None, timeout=60,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, telemetry=None, coalesce=False,
+                 rate_limits=None, interactive_slots=DEFAULT_INTERACTIVE_SLOTS):
+        self.transport = transport or Transport(base_url)
+        self.telemetry = telemetry or Telemetry()
+        self.singleflight = SingleFlight() if coalesce else None
+        self.limiter = RateLimiter(rate_limits) if rate_limits else None
+        self.base_url = self.transport.base_url
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.background_slots = max(max_concurrency - interactive_slots, 1)
+        self._background_slots = threading.BoundedSemaphore(self.background_slots)
+
+    def request(self, method, endpoint, json=None, data=None, files=None, timeout=None, **kwargs):
+        """Send a raw request and return the requests.Response.
+
+        Transport errors (connection refused, timeouts) propagate as
+        requests exceptions; HTTP error statuses do not raise here. Every
+        call sent to the backend is recorded in ``self.telemetry``. Inside
+        a job with a deadline (see ``deadline``) the timeout is capped at
+        the time left and DeadlineExceeded is raised once none is.
+
+        When coalescing, only plain JSON requests are shared; uploads,
+        streamed responses and calls with extra options always go out.
+        """
+        if self.singleflight is not None and data is None and files is None and not kwargs:
+            response, _ = self.singleflight.do(
+                request_key(method, endpoint, json),
+                lambda: self._send(method, endpoint, json=json, timeout=timeout),
+                endpoint,
+            )
+            return response
+        return self._send(method, endpoint, json=json, data=data, files=files, timeout=timeout, **kwargs)
+
+    @contextlib.contextmanager
+    def _slot(self, endpoint):
+        """Hold a connection slot, waiting no longer than the current deadline.
+
+        Background work takes one of its own slots first.
+        """
+        semaphores = [self._background_slots, self._slots] if in_background.get() else [self._slots]
+        held = []
+        try:
+            for semaphore in semaphores:
+                left = remaining()
+                if not semaphore.acquire(timeout=None if left is None else max(left, 0.0)):
+                    raise DeadlineExceeded(f"No connection slot for {endpoint} before the deadline")
+                held.append(semaphore)
+            yield
+        finally:
+            for semaphore in reversed(held):
+                semaphore.release()
+
+    def _send(self, method, endpoint, json=None, data=None, files=None, timeout=None, **kwargs):
+        limiter = self.limiter.get(endpoint) if self.limiter is not None else None
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            # Time held back by the rate limiter counts as queueing
+            if limiter is not None:
+                limiter.acquire(current_owner.get(), current_deadline.get())
+            queued = 0.0
+            response = None
+            try:
+                # Never wait on the server past the current job's deadline; raising
+                # here still hands the limiter slot back below
+                attempt_timeout = cap_timeout(timeout or self.timeout, endpoint)
+                with self._slot(endpoint):
+                    queued = time.perf_counter() - started
+                    try:
+                        with section("transport"):
+                            response = self.transport.request(
+                                method,
+                                endpoint,
+                                json=json,
+                                data=data,
+                                files=files,
+                                timeout=attempt_timeout,
+                                **kwargs,
+                            )
+                    except Exception as e:
+                        self.telemetry.record(method, endpoint, started, queued, error=type(e).__name__)
+                        raise
+            finally:
+                if limiter is not None:
+                    limiter.release(
+                        response.status_code if response is not None else None,
+                        time.perf_counter() - started - queued,
+                        retry_after_seconds(response.headers.get("Retry-After")) if response is not None else None,
+                        # A canned fallback returns early and says nothing about upstream latency
+                        sample=response is not None and response.headers.get("X-SalesGPT-Fallback") != "true",
+                    )
+            self.telemetry.record(method, endpoint, started, queued, response, stream=kwargs.get("stream", False))
+
+            # A 429 means the call was not processed, so it is safe to send again once admitted
+            if limiter is None or response.status_code != 429 or attempt >= limiter.limit.max_retries:
+                return response
+            # Hand the 429 back rather than resend a call that could not finish in time
+            left = remaining()
+            if left is not None and left <= (retry_after_seconds(response.headers.get("Retry-After")) or 0.0):
+                return response
+            response.close()
+            attempt += 1
+
+    def _json(self, method, endpoint, ok=(200,), **kwargs):
+        response = self.request(method, endpoint, **kwargs)
+        try:
+            with section("decode"):
+                payload = response.json()
+        except ValueError:
+            payload = None
+        if response.status_code not in ok:
+            raise APIError(endpoint, response.status_code, payload, response.text)
+        if payload is None:
+            raise APIError(endpoint, response.status_code, None, response.text)
+        return payload, response
+
+    def generate_sales_strategy(self, company_name, location=None, timeout=STRATEGY_TIMEOUT):
+        payload, response = self._json(
+            "POST",
+            "generateSalesStrategy",
+            json={"companyName": company_name, "location": location or None},
+            timeout=timeout,
+        )
+        fallback = response.headers.get("X-SalesGPT-Fallback") == "true"
+        return SalesStrategy.from_json(payload, fallback=fallback)
+
+    def upload_document(self, file, filename=None, content_type=None, timeout=UPLOAD_TIMEOUT,
+                        progress=None, allow_duplicate=False):
+        """Upload a PDF/DOCX given as a path or a binary file object.
+
+        The multipart body is streamed from ``file`` with chunked transfer
+        encoding, so the file is never fully buffered in memory.
+        ``progress(sent, total)`` is called as body chunks are handed to
+        the connection. Unless ``allow_duplicate`` is set, a file the server
+        already has (same bytes or same text) is linked to the existing
+        document and the result has ``duplicate`` set.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as fh:
+                return self.upload_document(
+                    fh, filename or os.path.basename(file), content_type, timeout, progress, allow_duplicate
+                )
+        name = filename or os.path.basename(getattr(file, "name", "document"))
+        body = MultipartStream(file, name, content_type, callback=progress)
+        payload, _ = self._json(
+            "POST",
+            "documents/upload",
+            ok=(200, 202),
+            data=body,
+            headers={"Content-Type": body.content_type},
+            params={"allowDuplicate": "true"} if allow_duplicate else None,
+            timeout=timeout,
+        )
+        return UploadResult.from_json(payload)
+
+    def find_document_by_hash(self, content_hash):
+        """The uploaded document whose file has this SHA-256, or None.
+
+        Also None for servers without the lookup route.
+        """
+        try:
+            payload, _ = self._json("GET", f"documents/hash/{content_hash}", timeout=STATUS_TIMEOUT)
+        except APIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return Document.from_json(payload)
+
+    def document_status(self, document_id):
+        payload, _ = self._json("GET", f"documents/{document_id}/status", timeout=STATUS_TIMEOUT)
+        return ProcessingStatus.from_json(payload)
+
+    def wait_for_processing(self, document_id, on_update=None, interval=0.5, timeout=300):
+        """Poll documents/{id}/status until indexing completes or fails.
+
+        Returns the last ProcessingStatus seen, which is unfinished if
+        ``timeout`` ran out, or None if the backend has no status for the
+        document (older servers, or a restarted process).
+        """
+        deadline = time.monotonic() + timeout
+        last_seen = None
+        while True:
+            try:
+                status = self.document_status(document_id)
+            except APIError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+            if on_update is not None and status.raw != last_seen:
+                on_update(status)
+                last_seen = status.raw
+            if status.finished or time.monotonic() >= deadline:
+                return status
+            time.sleep(interval)
+
+    def list_documents(self):
+        payload, _ = self._json("GET", "documents/list")
+        return [Document.from_json(doc) for doc in payload.get("documents", [])]
+
+    def sync_documents(self, etag=None, since=None):
+        """Conditional, optionally incremental documents/list.
+
+        Sends If-None-Match when ``etag`` is given and ?since= when
+        ``since`` (a previous ``synced_at``) is given. Returns a
+        DocumentListing with ``not_modified`` set on a 304.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        params = {"since": since} if since else None
+        response = self.request("GET", "documents/list", headers=headers, params=params)
+        if response.status_code == 304:
+            return DocumentListing(documents=[], etag=etag, not_modified=True)
+        if response.status_code != 200:
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = None
+            raise APIError("documents/list", response.status_code, payload, response.text)
+        return DocumentListing.from_json(response.json(), etag=response.headers.get("ETag"))
+
+    def get_document(self, document_id):
+        payload, _ = self._json("GET", f"documents/{document_id}")
+        return Document.from_json(payload)
+
+    def document_chunks(self, document_id, collection_name=None, offset=0, limit=None):
+        """One page of a document's indexed chunks, in chunk order."""
+        params = {"offset": offset}
+        if collection_name:
+            params["collectionName"] = collection_name
+        if limit:
+            params["limit"] = limit
+        payload, _ = self._json("GET", f"documents/{document_id}/chunks", params=params)
+        return ChunkPage.from_json(payload)
+
+    def iter_document_chunks(self, document_id, collection_name=None, page_size=500):
+        """Yield every chunk of a document, fetching ``page_size`` at a time."""
+        offset = 0
+        while offset is not None:
+            page = self.document_chunks(document_id, collection_name, offset, page_size)
+            yield from page.chunks
+            offset = page.next_offset
+
+    def query_documents(self, query, limit=5):
+        payload, _ = self._json("POST", "documents/query", json={"query": query, "limit": limit})
+        return QueryResult.from_json(payload)
+
+    def generate_document_strategy(self, document_id, company_name, timeout=STRATEGY_TIMEOUT):
+        payload, _ = self._json(
+            "POST",
+            "documents/generateSalesStrategy",
+            json={"documentId": document_id, "companyName": company_name},
+            timeout=timeout,
+        )
+        return DocumentStrategy.from_json(payload, document_id, company_name)
+
+    def stream_document_strategy(self, document_id, company_name, timeout=STRATEGY_TIMEOUT):
+        """Generate a document-based strategy, yielding it as it is written.
+
+        Yields ``("meta", dict)`` once, ``("token", str)`` for each text
+        delta, then ``("done", DocumentStrategy)``. ``timeout`` bounds the
+        wait for each piece of the stream, not the whole generation. A
+        backend that answers with plain JSON yields a single ``done``.
+        Raises APIError for an error status and StreamError when the
+        stream breaks or reports an error before ``done``.
+        """
+        endpoint = "documents/generateSalesStrategy"
+        response = self.request(
+            "POST",
+            endpoint,
+            json={"documentId": document_id, "companyName": company_name},
+            headers={"Accept": "text/event-stream"},
+            timeout=timeout,
+            stream=True,
+        )
+        with response:
+            if response.status_code != 200:
+                try:
+                    payload = response.json()
+                except ValueError:
+                    payload = None
+                raise APIError(endpoint, response.status_code, payload, response.text)
+
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                yield "done", DocumentStrategy.from_json(response.json(), document_id, company_name)
+                return
+
+            try:
+                for event in sse.iter_events(response.iter_lines(chunk_size=None)):
+                    data = event.json()
+                    if event.event == "meta":
+                        yield "meta", data
+                    elif event.event == "token":
+                        yield "token", data.get("text", "")
+                    elif event.event == "done":
+                        yield "done", DocumentStrategy.from_json(data, document_id, company_name)
+                        return
+                    elif event.event == "error":
+                        raise StreamError(f"{endpoint} failed mid-stream: {data.get('details') or data.get('error')}")
+            except (requests.RequestException, ValueError) as e:
+                raise StreamError(f"{endpoint} stream broke: {e}") from e
+        raise StreamError(f"{endpoint} stream ended before the strategy was complete")
+
+    def search_linkedin_profiles(self, company, position, location, limit=5, expertise="", team=""):
+        payload, _ = self._json(
+            "POST",
+            "linkedinProfiles/search",
+            json={
+                "company": company,
+                "position": position,
+                "location": location,
+                "limit": limit,
+                "expertise": expertise,
+                "team": team,
+            },
+        )
+        return ProfileSearchResult.from_json(payload)
+
+    def system_status(self, timeout=STATUS_TIMEOUT):
+        payload, _ = self._json("GET", "system/status", timeout=timeout)
+        return SystemStatus.from_json(payload)
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,37 @@
+"""End-to-end time budgets for work done on behalf of one job.
+
+A deadline is a ``time.monotonic()`` value held in a context variable, so
+it follows the work into worker threads started with
+``contextvars.copy_context()``. The client caps each request's timeout
+at the time left, stops waiting for a rate limiter slot once it has
+passed, and does not resend a throttled call that could not finish in
+time.
+"""
+
+import contextvars
+import time
+
+from .errors import DeadlineExceeded
+
+
+current_deadline = contextvars.ContextVar("salesgpt_deadline", default=None)
+# True inside a background job; such work may not take the client's slots kept for interactive calls
+in_background = contextvars.ContextVar("salesgpt_background", default=False)
+
+
+def remaining():
+    """Seconds left before the current deadline, or None if there is none."""
+    deadline = current_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def cap_timeout(timeout, what="request"):
+    """``timeout`` shortened to the time left; raises DeadlineExceeded if none is."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded(f"No time left in the budget for {what}")
+    return left if timeout is None else min(timeout, left)
@@ -0,0 +1,31 @@
+"""Exceptions raised by the SalesGPT client."""
+
+
+class SalesGPTError(Exception):
+    """Base class for client errors."""
+
+
+class APIError(SalesGPTError):
+    """The backend answered with a non-success status code."""
+
+    def __init__(self, endpoint, status_code, payload=None, text=""):
+        self.endpoint = endpoint
+        self.status_code = status_code
+        self.payload = payload
+        self.text = text
+        detail = ""
+        if isinstance(payload, dict):
+            detail = payload.get("error") or payload.get("message") or ""
+        super().__init__(f"{endpoint} failed with HTTP {status_code}" + (f": {detail}" if detail else ""))
+
+
+class StreamError(SalesGPTError):
+    """A streamed response ended early or reported an error mid-stream."""
+
+
+class DeadlineExceeded(SalesGPTError):
+    """The time budget for a job ran out before a call could complete."""
+
+
+class JobCancelled(SalesGPTError):
+    """A background job noticed it was cancelled and stopped early."""
@@ -0,0 +1,131 @@
+"""Background poller that keeps a cached view of backend health."""
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+DEFAULT_INTERVAL = float(os.environ.get("SALESGPT_HEALTH_INTERVAL", 15))
+
+
+@dataclass
+class ComponentState:
+    state: str
+    since: float
+    message: str = None
+    latency_ms: float = None
+
+
+@dataclass
+class HealthSnapshot:
+    online: bool = False
+    checked_at: float = None
+    latency_ms: float = None
+    error: str = None
+    consecutive_failures: int = 0
+    components: dict = field(default_factory=dict)  # name -> ComponentState
+    status: object = None  # last SystemStatus, if any
+
+    @property
+    def age(self):
+        return None if self.checked_at is None else time.time() - self.checked_at
+
+    def component(self, name):
+        return self.components.get(name)
+
+
+class HealthMonitor:
+    """Poll system/status on a daemon thread and keep the latest result.
+
+    Readers call snapshot() and never block on the network. One monitor
+    is shared by every session talking to the same backend.
+    """
+
+    def __init__(self, client, interval=DEFAULT_INTERVAL, timeout=5, history=240):
+        self.client = client
+        self.interval = interval
+        self.timeout = timeout
+        self.history = deque(maxlen=history)  # (checked_at, latency_ms, online)
+        self._snapshot = HealthSnapshot()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def snapshot(self):
+        with self._lock:
+            return self._snapshot
+
+    def latency_history(self):
+        with self._lock:
+            return list(self.history)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.check()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def check(self):
+        """Run one status check and publish the result. Returns the snapshot."""
+        started = time.perf_counter()
+        status = None
+        error = None
+        try:
+            status = self.client.system_status(timeout=self.timeout)
+        except Exception as e:
+            error = str(e)
+        latency_ms = (time.perf_counter() - started) * 1000
+        now = time.time()
+
+        with self._lock:
+            previous = self._snapshot
+            components = {}
+            if status is not None:
+                component_latency = status.raw.get("componentLatencyMs") or {}
+                for name, state in status.components.items():
+                    if not isinstance(state, str) or name.endswith("Message"):
+                        continue
+                    before = previous.components.get(name)
+                    components[name] = ComponentState(
+                        state=state,
+                        # Keep the original timestamp while the state is unchanged
+                        since=before.since if before and before.state == state else now,
+                        message=status.components.get(f"{name}Message"),
+                        latency_ms=component_latency.get(name),
+                    )
+            else:
+                # Backend unreachable: components are unknown, not degraded
+                for name, before in previous.components.items():
+                    components[name] = ComponentState(
+                        state="unknown",
+                        since=before.since if before.state == "unknown" else now,
+                        message=error,
+                    )
+
+            online = status is not None and status.operational
+            self._snapshot = HealthSnapshot(
+                online=online,
+                checked_at=now,
+                latency_ms=latency_ms,
+                error=error,
+                consecutive_failures=0 if online else previous.consecutive_failures + 1,
+                components=components,
+                # A failed check keeps the last status the server reported
+                status=status if status is not None else previous.status,
+            )
+            self.history.append((now, latency_ms, online))
+            return self._snapshot
@@ -0,0 +1,187 @@
+"""Local, indexed history of generated strategies, queries and searches."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+from .cache import normalize_text
+
+
+STRATEGY = "strategy"
+DOCUMENT_STRATEGY = "document_strategy"
+QUERY = "query"
+LINKEDIN_SEARCH = "linkedin_search"
+
+KIND_LABELS = {
+    STRATEGY: "Sales strategy",
+    DOCUMENT_STRATEGY: "Document strategy",
+    QUERY: "Document query",
+    LINKEDIN_SEARCH: "LinkedIn search",
+}
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("SALESGPT_HISTORY_MAX_ENTRIES", 5000))
+
+
+@dataclass
+class HistoryEntry:
+    id: int
+    kind: str
+    created_at: float
+    company: str = None
+    document_id: str = None
+    summary: str = None
+    elapsed: float = None
+    params: dict = field(default_factory=dict)
+    response: object = None  # only loaded by HistoryStore.get()
+
+    @property
+    def label(self):
+        return KIND_LABELS.get(self.kind, self.kind)
+
+
+class HistoryStore:
+    """Append-only SQLite log of results with lookups by company, date and document.
+
+    Listing reads only the indexed columns; the stored response is parsed
+    when a single entry is opened with get(). The oldest entries are
+    dropped beyond ``max_entries``.
+    """
+
+    _COLUMNS = "id, kind, created_at, company, document_id, summary, elapsed, params"
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                company TEXT,
+                company_key TEXT,
+                document_id TEXT,
+                summary TEXT,
+                elapsed REAL,
+                params TEXT NOT NULL,
+                response TEXT NOT NULL
+            )"""
+        )
+        for name, columns in (
+            ("history_created", "created_at"),
+            ("history_kind", "kind, created_at"),
+            ("history_company", "company_key, created_at"),
+            ("history_document", "document_id, created_at"),
+        ):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON history ({columns})")
+        self._conn.commit()
+
+    def record(self, kind, params, response, elapsed=None, company=None, document_id=None, summary=None):
+        """Store one result and return its id."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO history (kind, created_at, company, company_key, document_id, summary, "
+                "elapsed, params, response) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    now,
+                    company,
+                    normalize_text(company) if company else None,
+                    document_id,
+                    summary,
+                    elapsed,
+                    json.dumps(params or {}),
+                    json.dumps(response),
+                ),
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM history WHERE id <= ?", (cursor.lastrowid - self.max_entries,)
+                )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    @staticmethod
+    def _entry(row, response=None):
+        id_, kind, created_at, company, document_id, summary, elapsed, params = row
+        return HistoryEntry(
+            id=id_,
+            kind=kind,
+            created_at=created_at,
+            company=company,
+            document_id=document_id,
+            summary=summary,
+            elapsed=elapsed,
+            params=json.loads(params),
+            response=response,
+        )
+
+    @staticmethod
+    def _where(kinds=None, company=None, document_id=None, since=None, until=None):
+        clauses, args = [], []
+        if kinds:
+            clauses.append(f"kind IN ({','.join('?' * len(kinds))})")
+            args.extend(kinds)
+        if company:
+            # Prefix match on the normalized name uses the company index
+            key = normalize_text(company)
+            clauses.append("company_key >= ? AND company_key < ?")
+            args.extend([key, key + "\uffff"])
+        if document_id:
+            clauses.append("document_id = ?")
+            args.append(document_id.strip())
+        if since is not None:
+            clauses.append("created_at >= ?")
+            args.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            args.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def search(self, kinds=None, company=None, document_id=None, since=None, until=None,
+               limit=50, offset=0):
+        """Newest-first entries matching every given filter, without responses."""
+        where, args = self._where(kinds, company, document_id, since, until)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM history{where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                args + [limit, offset],
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def count(self, kinds=None, company=None, document_id=None, since=None, until=None):
+        where, args = self._where(kinds, company, document_id, since, until)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM history{where}", args).fetchone()[0]
+
+    def get(self, entry_id):
+        """The full entry including its response, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS}, response FROM history WHERE id = ?", (entry_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._entry(row[:-1], json.loads(row[-1]))
+
+    def delete(self, entry_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM history WHERE id = ?", (entry_id,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM history")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
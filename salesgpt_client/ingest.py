@@ -0,0 +1,442 @@
+"""Bulk document ingestion: many files, folders or zip archives at once.
+
+Files are uploaded and indexed by a bounded pool of workers. Each file's
+progress is written to a small SQLite journal keyed by a hash of its
+content, so an interrupted run (a failure, a closed tab, a killed job)
+resumes where it stopped: finished files are skipped and files whose
+upload went through are only polled until indexing completes.
+
+The journal doubles as a manifest for deduplication. A file is checked
+against it, then against the server (by content hash), before any bytes
+are sent; the server also links uploads whose extracted text matches an
+existing document. Duplicates are never embedded again, and the bytes
+and embeddings they saved are tallied in the journal.
+"""
+
+import contextvars
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from .cache import DEFAULT_CACHE_DIR
+
+
+QUEUED = "queued"
+UPLOADING = "uploading"
+INDEXING = "indexing"
+DONE = "done"
+RESUMED = "resumed"
+LINKED = "linked"
+FAILED = "failed"
+
+STATUS_ICONS = {
+    QUEUED: "⏳ Queued",
+    UPLOADING: "⬆️ Uploading",
+    INDEXING: "🔄 Indexing",
+    DONE: "✅ Done",
+    RESUMED: "♻️ Already ingested",
+    LINKED: "🔗 Duplicate on server",
+    FAILED: "❌ Failed",
+}
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+DEFAULT_JOURNAL_PATH = os.path.join(DEFAULT_CACHE_DIR, "ingest.sqlite3")
+DEFAULT_MAX_WORKERS = int(os.environ.get("SALESGPT_INGEST_WORKERS", 4))
+
+_HASH_BLOCK = 1024 * 1024
+
+
+def supported(name):
+    """True for PDF/DOCX files that are not hidden or archive metadata."""
+    base = os.path.basename(name)
+    if not base or base.startswith(".") or "__MACOSX" in name.replace("\\", "/").split("/"):
+        return False
+    return os.path.splitext(base)[1].lower() in CONTENT_TYPES
+
+
+@dataclass
+class IngestItem:
+    """One file to ingest; ``open()`` returns a fresh binary file object."""
+
+    name: str
+    size: int
+    open: object = field(repr=False)
+    status: str = QUEUED
+    content_hash: str = None
+    document_id: str = None
+    collection_name: str = None
+    bytes_sent: int = 0
+    chunks: int = None
+    error: str = None
+    elapsed: float = None
+    saved_bytes: int = 0  # not uploaded because the file was a known duplicate
+
+    @property
+    def content_type(self):
+        return CONTENT_TYPES.get(os.path.splitext(self.name)[1].lower(), "application/octet-stream")
+
+    @property
+    def finished(self):
+        return self.status in (DONE, RESUMED, LINKED, FAILED)
+
+    @property
+    def duplicate(self):
+        return self.status in (RESUMED, LINKED)
+
+
+class _BorrowedFile:
+    """A caller-owned file object that its ``with`` block leaves open."""
+
+    def __init__(self, file):
+        self._file = file
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+
+def open_buffer(buffer):
+    """Open an in-memory upload (e.g. a Streamlit UploadedFile) from the start, without copying it."""
+    buffer.seek(0)
+    return _BorrowedFile(buffer)
+
+
+def _zip_items(archive, prefix=""):
+    items = []
+    for info in archive.infolist():
+        if not info.is_dir() and supported(info.filename):
+            items.append(IngestItem(
+                name=prefix + info.filename,
+                size=info.file_size,
+                open=lambda info=info: archive.open(info),
+            ))
+    return items
+
+
+def items_from_uploads(files):
+    """IngestItems for Streamlit UploadedFiles; zip archives are expanded."""
+    items = []
+    for uploaded in files:
+        if uploaded.name.lower().endswith(".zip"):
+            archive = zipfile.ZipFile(uploaded)
+            items.extend(_zip_items(archive, prefix=f"{uploaded.name}/"))
+        elif supported(uploaded.name):
+            items.append(IngestItem(
+                name=uploaded.name,
+                size=uploaded.size,
+                open=lambda uploaded=uploaded: open_buffer(uploaded),
+            ))
+    return items
+
+
+def items_from_paths(paths):
+    """IngestItems for files, folders (walked recursively) and zip archives on disk."""
+    items = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                items.extend(items_from_paths(os.path.join(root, name) for name in sorted(names)))
+        elif path.lower().endswith(".zip"):
+            items.extend(_zip_items(zipfile.ZipFile(path), prefix=f"{path}/"))
+        elif supported(path):
+            items.append(IngestItem(
+                name=path,
+                size=os.path.getsize(path),
+                open=lambda path=path: open(path, "rb"),
+            ))
+    return items
+
+
+def content_hash(file):
+    digest = hashlib.sha256()
+    for block in iter(lambda: file.read(_HASH_BLOCK), b""):
+        digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestJournal:
+    """Per-file ingestion progress, keyed by content hash, in SQLite."""
+
+    _FIELDS = ("name", "size", "status", "document_id", "collection_name", "chunks", "error")
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS files (
+                content_hash TEXT PRIMARY KEY,
+                name TEXT,
+                size INTEGER,
+                status TEXT NOT NULL,
+                document_id TEXT,
+                collection_name TEXT,
+                chunks INTEGER,
+                error TEXT,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS savings (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, content_hash):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self._FIELDS)} FROM files WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return dict(zip(self._FIELDS, row)) if row else None
+
+    def record(self, item):
+        """Save ``item``'s current state under its content hash."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (content_hash, name, size, status, document_id, "
+                "collection_name, chunks, error, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (item.content_hash, item.name, item.size, item.status, item.document_id,
+                 item.collection_name, item.chunks, item.error, time.time()),
+            )
+            self._conn.commit()
+
+    def add_savings(self, item):
+        """Tally a duplicate ``item``: one file, its unsent bytes and unneeded embeddings."""
+        with self._lock:
+            for name, value in (("files", 1), ("bytes", item.saved_bytes), ("embeddings", item.chunks or 0)):
+                self._conn.execute(
+                    "INSERT INTO savings (name, value) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                    (name, value),
+                )
+            self._conn.commit()
+
+    def savings(self):
+        """All-time duplicates skipped: ``{"files": n, "bytes": n, "embeddings": n}``."""
+        with self._lock:
+            totals = dict(self._conn.execute("SELECT name, value FROM savings").fetchall())
+        return {name: totals.get(name, 0) for name in ("files", "bytes", "embeddings")}
+
+    def counts(self):
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM files GROUP BY status").fetchall())
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM savings")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def find_existing(client, item, journal=None):
+    """Link ``item`` to an already ingested copy, first from the journal, then the server.
+
+    ``item.content_hash`` must be set. Returns True (with the item marked
+    RESUMED or LINKED) if a copy was found and nothing needs uploading.
+    """
+    previous = journal.get(item.content_hash) if journal is not None else None
+    if previous and previous["status"] in (DONE, RESUMED, LINKED):
+        _resume(item, previous)
+        return True
+    document = client.find_document_by_hash(item.content_hash)
+    if document is None or not document.processed:
+        return False
+    item.document_id = document.document_id
+    item.collection_name = document.collection_name
+    item.chunks = document.chunk_count
+    item.status = LINKED
+    item.saved_bytes = item.size
+    return True
+
+
+def _resume(item, previous):
+    item.document_id = previous["document_id"]
+    item.collection_name = previous["collection_name"]
+    item.chunks = previous["chunks"]
+    item.status = RESUMED
+    item.saved_bytes = item.size
+
+
+def ingest_file(client, item, journal=None, timeout=180, index_timeout=600, dedupe=True):
+    """Upload one file and wait for it to be indexed, resuming from the journal.
+
+    With ``dedupe`` a file already ingested, locally or on the server, is
+    linked to the existing document instead of being uploaded again.
+    """
+    with item.open() as fh:
+        item.content_hash = content_hash(fh)
+    previous = journal.get(item.content_hash) if journal is not None else None
+
+    indexing = previous and previous["status"] == INDEXING and previous["document_id"]
+
+    if dedupe and not indexing:
+        if find_existing(client, item, journal):
+            return item
+    elif previous and previous["status"] in (DONE, RESUMED, LINKED):
+        _resume(item, previous)
+        return item
+
+    linked = False
+    if indexing:
+        # The upload went through last time; only indexing is left to watch
+        item.document_id = previous["document_id"]
+        item.collection_name = previous["collection_name"]
+    else:
+        item.status = UPLOADING
+
+        def on_progress(sent, total):
+            item.bytes_sent = sent
+
+        with item.open() as fh:
+            upload = client.upload_document(
+                fh, item.name.replace("\\", "/").rsplit("/", 1)[-1], item.content_type,
+                timeout=timeout, progress=on_progress, allow_duplicate=not dedupe,
+            )
+        item.document_id = upload.document_id
+        item.collection_name = upload.collection_name
+        # The server matched the bytes or the extracted text of an existing
+        # document: nothing is embedded, but it may still be indexing
+        linked = upload.duplicate
+
+    item.status = INDEXING
+    if journal is not None:
+        journal.record(item)
+
+    def on_update(status):
+        item.chunks = status.total_chunks
+
+    final = client.wait_for_processing(item.document_id, on_update=on_update, timeout=index_timeout)
+    if final is not None and final.failed:
+        raise RuntimeError(f"Indexing failed: {final.error}")
+    if final is not None and not final.done:
+        raise TimeoutError(f"Still indexing after {index_timeout}s")
+    if final is not None:
+        item.chunks = final.total_chunks
+    item.status = LINKED if linked else DONE
+    return item
+
+
+def run_ingest(items, client, journal=None, max_workers=DEFAULT_MAX_WORKERS, poll_interval=0.5, **kwargs):
+    """Ingest ``items`` with at most ``max_workers`` in flight, yielding each as it finishes.
+
+    Yields None every ``poll_interval`` seconds so callers can redraw the
+    status grid. If the caller stops iterating, files not yet started
+    are left queued for the next run.
+    """
+
+    def work(item):
+        started = time.perf_counter()
+        try:
+            ingest_file(client, item, journal, **kwargs)
+        except Exception as e:
+            item.error = str(e)
+            item.status = FAILED
+        finally:
+            item.elapsed = time.perf_counter() - started
+        if journal is not None and item.content_hash and item.status != RESUMED:
+            journal.record(item)
+        if journal is not None and item.duplicate:
+            journal.add_savings(item)
+        return item
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest")
+    try:
+        # Workers keep the caller's context, e.g. its rate limiter owner
+        pending = {
+            pool.submit(contextvars.copy_context().run, work, item) for item in items if not item.finished
+        }
+        while pending:
+            done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            if not done:
+                yield None
+            for future in done:
+                yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass
+class IngestSummary:
+    files: int
+    done: int
+    resumed: int
+    failed: int
+    bytes_total: int
+    bytes_uploaded: int
+    wall: float
+    linked: int = 0
+    saved_bytes: int = 0
+    saved_embeddings: int = 0
+
+    @property
+    def duplicates(self):
+        return self.resumed + self.linked
+
+    @property
+    def files_per_minute(self):
+        return self.done / self.wall * 60 if self.wall > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes_uploaded / 1024 / 1024 / self.wall if self.wall > 0 else 0.0
+
+
+def summarize(items, wall):
+    """Counts, throughput and bytes for a run; duplicates found before upload send no bytes."""
+    duplicates = [item for item in items if item.duplicate]
+    return IngestSummary(
+        files=len(items),
+        done=sum(1 for item in items if item.status == DONE),
+        resumed=sum(1 for item in items if item.status == RESUMED),
+        failed=sum(1 for item in items if item.status == FAILED),
+        bytes_total=sum(item.size for item in items),
+        bytes_uploaded=sum(item.bytes_sent for item in items),
+        wall=wall,
+        linked=sum(1 for item in items if item.status == LINKED),
+        saved_bytes=sum(item.saved_bytes for item in duplicates),
+        saved_embeddings=sum(item.chunks or 0 for item in duplicates),
+    )
+
+
+def status_frame(items):
+    return pd.DataFrame(
+        [
+            {
+                "File": item.name,
+                "Size (KB)": round(item.size / 1024, 1),
+                "Status": STATUS_ICONS.get(item.status, item.status),
+                "Uploaded": f"{min(item.bytes_sent / item.size, 1.0):.0%}" if item.size and item.bytes_sent else "",
+                "Chunks": item.chunks,
+                "Time (s)": round(item.elapsed, 1) if item.elapsed is not None else None,
+                "Document ID": item.document_id or "",
+                "Error": item.error or "",
+            }
+            for item in items
+        ]
+    )
@@ -0,0 +1,250 @@
+"""Background jobs for long-running calls such as strategy generation.
+
+A JobManager owns one process-wide worker pool. Submitting a job returns
+at once with its id; the caller keeps the id (e.g. in Streamlit session
+state) and polls ``get()`` from any later rerun or page to show
+progress, partial output and the result. Every job runs under a time
+budget that the client honours end to end (see ``deadline``).
+
+Given a PayloadStore, a finished job hands its result to the store under
+its owner's session and keeps only the key, so results count against
+that session's memory budget and can be evicted like any other payload.
+
+A queued job that is cancelled never starts. A running one is marked
+cancelled at once and its result is discarded when it arrives; work
+that checks ``job.check()`` between steps, like reading a stream, stops
+at the next step, while a single blocking request is left to finish in
+the background.
+"""
+
+import contextvars
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .client import DEFAULT_INTERACTIVE_SLOTS, DEFAULT_MAX_CONCURRENCY
+from .deadline import current_deadline, in_background
+from .errors import DeadlineExceeded, JobCancelled
+from .ratelimit import current_owner
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+STATUS_ICONS = {
+    QUEUED: "⏳ queued",
+    RUNNING: "🔄 running",
+    DONE: "✅ done",
+    FAILED: "❌ failed",
+    CANCELLED: "🚫 cancelled",
+}
+
+# As many as the client lets background work hold connections; more would only queue for them
+DEFAULT_MAX_WORKERS = int(os.environ.get(
+    "SALESGPT_JOB_WORKERS", max(DEFAULT_MAX_CONCURRENCY - DEFAULT_INTERACTIVE_SLOTS, 1)
+))
+# Finished jobs are kept this many seconds so a later rerun can still show them
+DEFAULT_RETENTION = float(os.environ.get("SALESGPT_JOB_RETENTION", 3600))
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    label: str
+    owner: str = None
+    params: dict = field(default_factory=dict)
+    budget: float = None  # seconds from submission
+    status: str = QUEUED
+    result: object = field(default=None, repr=False)
+    error: str = None
+    note: str = None  # something worth showing alongside the result
+    partial: str = field(default="", repr=False)  # output so far, for streamed work
+    first_output: float = None  # seconds after starting
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float = None
+    finished_at: float = None
+    deadline: float = None  # time.monotonic() value
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _future: object = field(default=None, repr=False)
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def status_label(self):
+        return STATUS_ICONS.get(self.status, self.status)
+
+    @property
+    def elapsed(self):
+        """Seconds since submission, or until it finished."""
+        return (self.finished_at or time.time()) - self.submitted_at
+
+    @property
+    def result_key(self):
+        """Key of the result in the job manager's payload store."""
+        return ("job", self.id)
+
+    @property
+    def remaining(self):
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def check(self):
+        """Raise if the job was cancelled or ran out of time; call between steps."""
+        if self._cancel.is_set():
+            raise JobCancelled(f"{self.label} was cancelled")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise DeadlineExceeded(f"{self.label} ran past its {self.budget:.0f}s budget")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "label": self.label,
+            "status": self.status_label,
+            "elapsed_s": round(self.elapsed, 1),
+            "budget_s": self.budget,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Runs jobs on a shared worker pool and keeps them for later polling.
+
+    ``fn(job)`` does the work in a worker thread with the submitter's
+    context (its rate limiter owner) and the job's deadline set; it must
+    not touch Streamlit. Its return value becomes the job's result, read
+    with ``result()``; with a ``store`` it is kept there rather than on
+    the job. Finished jobs are dropped ``retention`` seconds after they
+    end.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, retention=DEFAULT_RETENTION, store=None):
+        self.max_workers = max_workers
+        self.retention = retention
+        self.store = store
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+
+    def submit(self, kind, fn, label=None, params=None, owner=None, budget=None):
+        """Queue ``fn(job)`` and return the Job straight away."""
+        job = Job(
+            id=uuid.uuid4().hex[:12],
+            kind=kind,
+            label=label or kind,
+            owner=owner if owner is not None else current_owner.get(),
+            params=params or {},
+            budget=budget,
+        )
+        if budget is not None:
+            job.deadline = time.monotonic() + budget
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        job._future = self._pool.submit(contextvars.copy_context().run, self._run, job, fn)
+        return job
+
+    def _run(self, job, fn):
+        if job.finished:
+            return
+        job.status = RUNNING
+        job.started_at = time.time()
+        current_deadline.set(job.deadline)
+        in_background.set(True)
+        try:
+            # Queueing counts against the budget too
+            job.check()
+            result = fn(job)
+        except JobCancelled:
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            if job.deadline is not None and time.monotonic() >= job.deadline and not isinstance(e, DeadlineExceeded):
+                error = f"{job.label} ran past its {job.budget:.0f}s budget ({e})"
+            else:
+                error = str(e) or type(e).__name__
+            self._finish(job, FAILED, error=error)
+        else:
+            self._finish(job, DONE, result=result)
+
+    def _finish(self, job, status, result=None, error=None):
+        with self._lock:
+            # A job cancelled while running keeps that status; its late result is dropped
+            if job.finished:
+                return
+            if self.store is not None and result is not None:
+                # The job keeps only the key; the result counts against its owner's budget
+                self.store.put(job.owner, job.result_key, result)
+            else:
+                job.result = result
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+
+    def get(self, job_id):
+        """The job with this id, or None once it is unknown or pruned."""
+        if job_id is None:
+            return None
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def result(self, job):
+        """A finished job's result, or None if it had none or the store has evicted it."""
+        if job.result is not None or self.store is None:
+            return job.result
+        return self.store.get(job.owner, job.result_key)
+
+    def jobs(self, owner=None, kind=None):
+        """Jobs newest first, optionally only one owner's or one kind."""
+        with self._lock:
+            self._prune()
+            jobs = list(self._jobs.values())
+        return [
+            job for job in reversed(jobs)
+            if (owner is None or job.owner == owner) and (kind is None or job.kind == kind)
+        ]
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job; returns False if it had already finished."""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job._cancel.set()
+        if job._future is not None:
+            job._future.cancel()
+        self._finish(job, CANCELLED)
+        return True
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished and job.finished_at < cutoff]:
+            job = self._jobs.pop(job_id)
+            if self.store is not None:
+                self.store.discard(job.owner, job.result_key)
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        counts = {status: 0 for status in STATUS_ICONS}
+        for job in jobs:
+            counts[job.status] += 1
+        return {"workers": self.max_workers, "jobs": len(jobs), **counts}
+
+    def shutdown(self):
+        for job in self.jobs():
+            self.cancel(job.id)
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,95 @@
+"""Session-local document library kept in sync with documents/list."""
+
+import time
+from dataclasses import dataclass
+
+
+SORT_OPTIONS = ("Newest first", "Oldest first", "Name A-Z", "Name Z-A")
+
+
+@dataclass
+class SyncResult:
+    mode: str  # "full", "incremental" or "not modified"
+    changed: int
+    total: int
+    elapsed: float
+    at: float
+
+
+class DocumentLibrary:
+    """Client-side copy of the document list.
+
+    The first sync pulls the full list. Later syncs send the last ETag
+    and sync timestamp, so an unchanged library costs one 304 and a
+    changed one only transfers new or updated documents.
+    """
+
+    def __init__(self):
+        self.documents = {}  # collection name -> Document
+        self.etag = None
+        self.synced_at = None
+        self.last_sync = None
+
+    @property
+    def synced(self):
+        return self.last_sync is not None
+
+    def sync(self, client, full=False):
+        started = time.perf_counter()
+        listing = client.sync_documents(
+            etag=None if full else self.etag,
+            since=None if full else self.synced_at,
+        )
+
+        if listing.not_modified:
+            mode = "not modified"
+        elif listing.incremental and listing.collection_names is not None:
+            # Drop documents whose collections are gone, then merge changes
+            current = set(listing.collection_names)
+            self.documents = {
+                name: doc for name, doc in self.documents.items() if name in current
+            }
+            for doc in listing.documents:
+                self.documents[doc.collection_name] = doc
+            mode = "incremental"
+        else:
+            # Full snapshot (first sync, forced, or a server without ?since support)
+            self.documents = {doc.collection_name: doc for doc in listing.documents}
+            mode = "full"
+
+        if not listing.not_modified:
+            self.etag = listing.etag
+            self.synced_at = listing.synced_at
+
+        self.last_sync = SyncResult(
+            mode=mode,
+            changed=len(listing.documents),
+            total=len(self.documents),
+            elapsed=time.perf_counter() - started,
+            at=time.time(),
+        )
+        return self.last_sync
+
+    def get(self, document_id):
+        for doc in self.documents.values():
+            if doc.document_id == document_id:
+                return doc
+        return None
+
+    def query(self, text="", sort=SORT_OPTIONS[0], page=1, page_size=25):
+        """Filter, sort and paginate. Returns (documents_on_page, total_matches)."""
+        needle = (text or "").strip().casefold()
+        docs = [
+            doc for doc in self.documents.values()
+            if not needle
+            or needle in (doc.original_name or "").casefold()
+            or needle in (doc.document_id or "").casefold()
+        ]
+
+        if sort in ("Name A-Z", "Name Z-A"):
+            docs.sort(key=lambda d: (d.original_name or "").casefold(), reverse=sort == "Name Z-A")
+        else:
+            docs.sort(key=lambda d: d.uploaded_at or "", reverse=sort == "Newest first")
+
+        start = max(page - 1, 0) * page_size
+        return docs[start:start + page_size], len(docs)
@@ -0,0 +1,201 @@
+"""Bounded, size-accounted storage for large API payloads.
+
+Sessions keep responses such as document details, bulk results and
+finished jobs' output around between reruns. A PayloadStore holds them under a per-session byte budget and a
+global one for the whole process. Each payload is sized once by its
+compact JSON encoding. When a budget is exceeded, entries are evicted by
+size times time since last viewed, so large payloads nobody is looking
+at go first. Evicted payloads are simply gone; callers reload them on
+demand.
+"""
+
+import dataclasses
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+DEFAULT_SESSION_BUDGET = int(float(os.environ.get("SALESGPT_SESSION_MEMORY_MB", 20)) * 1024 * 1024)
+DEFAULT_GLOBAL_BUDGET = int(float(os.environ.get("SALESGPT_MEMORY_BUDGET_MB", 256)) * 1024 * 1024)
+# Sessions not seen for this many seconds are dropped wholesale
+DEFAULT_IDLE_TTL = float(os.environ.get("SALESGPT_SESSION_IDLE_TTL", 3600))
+
+# Preview limits for rendering raw payloads
+PREVIEW_STRING = 500
+PREVIEW_ITEMS = 20
+
+
+def _encodable(value):
+    # Dataclasses (bulk rows, brief sections) are sized by all their fields
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return vars(value)
+    return str(value)
+
+
+def payload_size(payload):
+    """Bytes of the compact JSON encoding, a stable proxy for memory held."""
+    return len(json.dumps(payload, separators=(",", ":"), default=_encodable).encode("utf-8"))
+
+
+def preview(payload, max_string=PREVIEW_STRING, max_items=PREVIEW_ITEMS):
+    """A copy with long strings and lists cut short; returns (copy, values shortened)."""
+    shortened = 0
+
+    def cut(value):
+        nonlocal shortened
+        if isinstance(value, str) and len(value) > max_string:
+            shortened += 1
+            return f"{value[:max_string]}… (+{len(value) - max_string} chars)"
+        if isinstance(value, list):
+            items = [cut(item) for item in value[:max_items]]
+            if len(value) > max_items:
+                shortened += 1
+                items.append(f"… {len(value) - max_items} more items")
+            return items
+        if isinstance(value, dict):
+            keys = list(value)
+            result = {key: cut(value[key]) for key in keys[:max_items]}
+            if len(keys) > max_items:
+                shortened += 1
+                result["…"] = f"{len(keys) - max_items} more keys"
+            return result
+        return value
+
+    return cut(payload), shortened
+
+
+@dataclass
+class StoredPayload:
+    session: str
+    key: object
+    payload: object = field(repr=False)
+    size: int = 0
+    stored_at: float = field(default_factory=time.time)
+    viewed_at: float = field(default_factory=time.time)
+    views: int = 0
+
+    def cost(self, now):
+        # Large and long unviewed goes first
+        return self.size * (now - self.viewed_at + 1.0)
+
+
+class PayloadStore:
+    """Payloads by (session, key) under per-session and global byte budgets.
+
+    A payload larger than either budget is not kept.
+    """
+
+    def __init__(self, session_budget=DEFAULT_SESSION_BUDGET, global_budget=DEFAULT_GLOBAL_BUDGET,
+                 idle_ttl=DEFAULT_IDLE_TTL):
+        self.session_budget = session_budget
+        self.global_budget = global_budget
+        self.idle_ttl = idle_ttl
+        self._sessions = {}  # session -> {key: StoredPayload}
+        self._seen = {}  # session -> last access
+        self._bytes = {}  # session -> bytes held
+        self._total = 0
+        self._lock = threading.Lock()
+
+        self.evicted = 0
+        self.evicted_bytes = 0
+        self.rejected = 0
+
+    def put(self, session, key, payload, size=None):
+        """Keep ``payload`` for the session, evicting others as needed; returns its size."""
+        size = payload_size(payload) if size is None else size
+        now = time.time()
+        with self._lock:
+            self._seen[session] = now
+            self._remove(session, key)
+            if size > min(self.session_budget, self.global_budget):
+                self.rejected += 1
+                return size
+            entries = self._sessions.setdefault(session, {})
+            entries[key] = StoredPayload(session, key, payload, size, now, now)
+            self._bytes[session] = self._bytes.get(session, 0) + size
+            self._total += size
+            self._evict(now, session, keep=key)
+        return size
+
+    def get(self, session, key):
+        """The payload, or None if it was never stored or has been evicted."""
+        now = time.time()
+        with self._lock:
+            self._seen[session] = now
+            entry = self._sessions.get(session, {}).get(key)
+            if entry is None:
+                return None
+            entry.viewed_at = now
+            entry.views += 1
+            return entry.payload
+
+    def discard(self, session, key):
+        with self._lock:
+            self._remove(session, key)
+
+    def clear(self, session, kind=None):
+        """Drop the session's payloads, or only those whose key is a tuple starting with ``kind``."""
+        with self._lock:
+            for key in list(self._sessions.get(session, {})):
+                if kind is None or (isinstance(key, tuple) and key[:1] == (kind,)):
+                    self._remove(session, key)
+
+    def _remove(self, session, key):
+        entry = self._sessions.get(session, {}).pop(key, None)
+        if entry is not None:
+            self._bytes[session] -= entry.size
+            self._total -= entry.size
+        return entry
+
+    def _evict(self, now, session, keep=None):
+        # Idle sessions first, then the new entry's session, then the whole process
+        for idle in [s for s, seen in self._seen.items() if now - seen > self.idle_ttl and s != session]:
+            for key in list(self._sessions.get(idle, {})):
+                self._drop(self._remove(idle, key))
+            self._sessions.pop(idle, None)
+            self._bytes.pop(idle, None)
+            self._seen.pop(idle, None)
+        while self._bytes.get(session, 0) > self.session_budget:
+            self._drop(self._pick(self._sessions[session].values(), now, session, keep))
+        while self._total > self.global_budget:
+            candidates = [entry for entries in self._sessions.values() for entry in entries.values()]
+            self._drop(self._pick(candidates, now, session, keep))
+
+    def _pick(self, candidates, now, session, keep):
+        entry = max(
+            (entry for entry in candidates if not (entry.session == session and entry.key == keep)),
+            key=lambda entry: entry.cost(now),
+        )
+        return self._remove(entry.session, entry.key)
+
+    def _drop(self, entry):
+        self.evicted += 1
+        self.evicted_bytes += entry.size
+
+    def usage(self, session=None):
+        """Bytes held for ``session`` and the whole process, against their budgets."""
+        with self._lock:
+            return {
+                "session_bytes": self._bytes.get(session, 0),
+                "session_entries": len(self._sessions.get(session, {})),
+                "session_budget": self.session_budget,
+                "total_bytes": self._total,
+                "total_entries": sum(len(entries) for entries in self._sessions.values()),
+                "global_budget": self.global_budget,
+                "sessions": len(self._sessions),
+                "evicted": self.evicted,
+                "evicted_bytes": self.evicted_bytes,
+                "rejected": self.rejected,
+            }
+
+    def entries(self, session):
+        """The session's payloads, most recently viewed first, without their contents."""
+        with self._lock:
+            entries = list(self._sessions.get(session, {}).values())
+        return [
+            {"key": str(entry.key), "kb": round(entry.size / 1024, 1), "views": entry.views,
+             "viewed_s_ago": round(time.time() - entry.viewed_at)}
+            for entry in sorted(entries, key=lambda entry: entry.viewed_at, reverse=True)
+        ]
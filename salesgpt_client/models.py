@@ -0,0 +1,331 @@
+"""Typed views over the JSON returned by the SalesGPT API.
+
+Every model keeps the original payload in ``raw`` so callers can still
+reach fields the backend adds later.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SalesStrategy:
+    company_name: str
+    industry: str = None
+    business_type: str = None
+    headquarters: str = None
+    employee_count: object = None
+    annual_revenue: object = None
+    products: list = field(default_factory=list)
+    strategy: dict = field(default_factory=dict)
+    fallback: bool = False
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def ccs_score(self):
+        return self.strategy.get("ccsScore")
+
+    @classmethod
+    def from_json(cls, data, fallback=False):
+        size = data.get("companySize") or {}
+        return cls(
+            company_name=data.get("companyName"),
+            industry=data.get("industry"),
+            business_type=data.get("businessType"),
+            headquarters=data.get("headquarters"),
+            employee_count=size.get("employeeCount"),
+            annual_revenue=size.get("annualRevenue"),
+            products=list(data.get("productOrServiceDetails") or []),
+            strategy=data.get("salesStrategy") or {},
+            fallback=fallback,
+            raw=data,
+        )
+
+
+@dataclass
+class Document:
+    document_id: str
+    collection_name: str = None
+    original_name: str = None
+    uploaded_at: str = None
+    file_size: int = None
+    text_length: int = None
+    content_hash: str = None
+    chunk_count: int = None
+    processed: bool = True
+    text_preview: str = None  # start of the text; the rest comes from documents/{id}/chunks
+    metadata: dict = field(default_factory=dict)
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data):
+        metadata = data.get("metadata") or {}
+        return cls(
+            document_id=data.get("documentId"),
+            collection_name=data.get("collectionName") or metadata.get("collectionName"),
+            original_name=metadata.get("originalName"),
+            uploaded_at=metadata.get("uploadedAt"),
+            file_size=metadata.get("fileSize"),
+            text_length=metadata.get("textLength"),
+            content_hash=metadata.get("contentHash"),
+            chunk_count=data.get("count"),
+            processed=data.get("processed", True),
+            text_preview=data.get("textPreview"),
+            metadata=metadata,
+            raw=data,
+        )
+
+
+@dataclass
+class DocumentChunk:
+    id: str
+    text: str
+    chunk_index: int = 0
+    metadata: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            id=data.get("id"),
+            text=data.get("text") or "",
+            chunk_index=data.get("chunkIndex") or 0,
+            metadata=data.get("metadata") or {},
+        )
+
+
+@dataclass
+class ChunkPage:
+    """One page of documents/{id}/chunks."""
+
+    document_id: str
+    chunks: list
+    collection_name: str = None
+    offset: int = 0
+    total: int = None
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def next_offset(self):
+        """Offset of the following page, or None when this is the last one."""
+        end = self.offset + len(self.chunks)
+        if not self.chunks or (self.total is not None and end >= self.total):
+            return None
+        return end
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            document_id=data.get("documentId"),
+            chunks=[DocumentChunk.from_json(c) for c in data.get("chunks") or []],
+            collection_name=data.get("collectionName"),
+            offset=data.get("offset") or 0,
+            total=data.get("total"),
+            raw=data,
+        )
+
+
+@dataclass
+class DocumentListing:
+    """One documents/list response, possibly incremental or not modified."""
+
+    documents: list
+    collection_names: list = None
+    synced_at: str = None
+    etag: str = None
+    incremental: bool = False
+    not_modified: bool = False
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data, etag=None):
+        return cls(
+            documents=[Document.from_json(doc) for doc in data.get("documents", [])],
+            collection_names=data.get("collectionNames"),
+            synced_at=data.get("syncedAt"),
+            etag=etag,
+            incremental=bool(data.get("incremental")),
+            raw=data,
+        )
+
+
+@dataclass
+class UploadResult:
+    document_id: str
+    collection_name: str = None
+    original_name: str = None
+    size: int = None
+    message: str = None
+    duplicate: bool = False  # linked to an existing copy instead of being processed
+    matched_on: str = None  # "contentHash" or "textHash" for duplicates
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data):
+        file_data = data.get("fileData") or {}
+        return cls(
+            document_id=data.get("documentId"),
+            collection_name=data.get("collectionName"),
+            original_name=file_data.get("originalName"),
+            size=file_data.get("size"),
+            message=data.get("message"),
+            duplicate=bool(data.get("duplicate")),
+            matched_on=data.get("matchedOn"),
+            raw=data,
+        )
+
+
+@dataclass
+class QueryHit:
+    id: str
+    text: str
+    metadata: dict
+    distance: float = None
+
+
+@dataclass
+class QueryResult:
+    hits: list
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data):
+        # The backend returns Chroma's column-oriented layout: one inner
+        # list per query text, and we only ever send one query.
+        results = data.get("results") or {}
+
+        def first(name):
+            values = results.get(name) or [[]]
+            return values[0] if values else []
+
+        ids = first("ids")
+        documents = first("documents")
+        metadatas = first("metadatas")
+        distances = first("distances")
+        hits = [
+            QueryHit(
+                id=ids[i] if i < len(ids) else None,
+                text=text,
+                metadata=metadatas[i] if i < len(metadatas) else {},
+                distance=distances[i] if i < len(distances) else None,
+            )
+            for i, text in enumerate(documents)
+        ]
+        return cls(hits=hits, raw=data)
+
+
+@dataclass
+class DocumentStrategy:
+    document_id: str
+    company_name: str
+    sales_strategy: str = ""
+    company_info: dict = field(default_factory=dict)
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data, document_id=None, company_name=None):
+        return cls(
+            document_id=data.get("documentId", document_id),
+            company_name=data.get("companyName", company_name),
+            sales_strategy=data.get("salesStrategy") or "",
+            company_info=data.get("companyInfo") or {},
+            raw=data,
+        )
+
+
+@dataclass
+class LinkedInProfile:
+    title: str = None
+    url: str = None
+    snippet: str = None
+    name: str = None
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            title=data.get("title"),
+            url=data.get("url"),
+            snippet=data.get("snippet"),
+            name=data.get("name"),
+            raw=data,
+        )
+
+
+@dataclass
+class ProfileSearchResult:
+    profiles: list
+    message: str = None
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            profiles=[LinkedInProfile.from_json(p) for p in data.get("profiles") or []],
+            message=data.get("message"),
+            raw=data,
+        )
+
+
+@dataclass
+class SystemStatus:
+    server: str
+    timestamp: str = None
+    components: dict = field(default_factory=dict)
+    resources: dict = field(default_factory=dict)
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def operational(self):
+        return self.server == "operational"
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            server=data.get("server"),
+            timestamp=data.get("timestamp"),
+            components=data.get("components") or {},
+            resources=data.get("resources") or {},
+            raw=data,
+        )
+
+
+@dataclass
+class ProcessingStatus:
+    """Background indexing state from documents/{id}/status."""
+
+    document_id: str
+    stage: str
+    chunks_indexed: int = 0
+    total_chunks: int = None
+    error: str = None
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def done(self):
+        return self.stage == "complete"
+
+    @property
+    def failed(self):
+        return self.stage == "failed"
+
+    @property
+    def finished(self):
+        return self.done or self.failed
+
+    @property
+    def fraction(self):
+        if self.done:
+            return 1.0
+        if not self.total_chunks:
+            return 0.0
+        return min(self.chunks_indexed / self.total_chunks, 1.0)
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            document_id=data.get("documentId"),
+            stage=data.get("stage"),
+            chunks_indexed=data.get("chunksIndexed") or 0,
+            total_chunks=data.get("totalChunks"),
+            error=data.get("error"),
+            raw=data,
+        )
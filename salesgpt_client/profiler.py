@@ -0,0 +1,281 @@
+"""Opt-in profiler for Streamlit reruns.
+
+A RerunProfiler times each script run of the sessions that turn it on and
+attributes the time to named sections: the page, its tabs, network
+transport, JSON decoding and rendering. Sections nest by where they are
+entered, so "Document Management/Document Library/transport" is network
+time spent while the library tab ran. While a run is profiled, a sampler
+thread also records the script thread's call stack every few
+milliseconds. The aggregated stacks export in the folded format read by
+flamegraph.pl, speedscope and inferno.
+
+Code marks sections with ``section(name)``; outside a profiled run it
+costs one context variable lookup.
+"""
+
+import contextvars
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+
+ENABLED_BY_DEFAULT = os.environ.get("SALESGPT_PROFILE", "") not in ("", "0", "false")
+DEFAULT_INTERVAL = float(os.environ.get("SALESGPT_PROFILE_INTERVAL", 0.005))
+
+# The run being profiled; copied into worker threads with the rest of the context
+current_run = contextvars.ContextVar("salesgpt_profile_run", default=None)
+_current_section = contextvars.ContextVar("salesgpt_profile_section", default=None)
+
+# Leading frames from these packages (the thread and Streamlit's script runner) are trimmed
+_RUNNER_MODULES = (os.sep + "threading.py", os.sep + "streamlit" + os.sep)
+
+
+class ProfileRun:
+    """Section timings and stack samples for one script run."""
+
+    def __init__(self, page, session=None):
+        self.page = page
+        self.session = session
+        self.thread_id = threading.get_ident()
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.last = self.started  # end of the latest section
+        self.wall = None
+        self.samples = 0
+        self.complete = False
+        self.finished = False
+        self.path = ()  # the script thread's open sections, read by the sampler
+        self.sections = {}  # path -> [calls, total, self, max]
+        self._lock = threading.Lock()
+
+    def _add(self, path, elapsed, self_time):
+        with self._lock:
+            # Late sections from worker threads still running after the script are dropped
+            if self.finished:
+                return
+            self.last = time.perf_counter()
+            timing = self.sections.get(path)
+            if timing is None:
+                self.sections[path] = [1, elapsed, self_time, elapsed]
+            else:
+                timing[0] += 1
+                timing[1] += elapsed
+                timing[2] += self_time
+                timing[3] = max(timing[3], elapsed)
+
+    def to_dict(self):
+        return {
+            "page": self.page,
+            "started_at": self.started_at,
+            "wall_ms": round((self.wall or 0.0) * 1000, 1),
+            "sections": len(self.sections),
+            "samples": self.samples,
+            "complete": self.complete,
+        }
+
+
+class _Section:
+    __slots__ = ("name", "run", "names", "started", "children", "token")
+
+    def __init__(self, name, run):
+        self.name = name
+        self.run = run
+
+    def __enter__(self):
+        parent = _current_section.get()
+        self.names = (parent.names if parent is not None and parent.run is self.run else ()) + (self.name,)
+        self.children = 0.0
+        self.token = _current_section.set(self)
+        if threading.get_ident() == self.run.thread_id:
+            self.run.path = self.names
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        _current_section.reset(self.token)
+        parent = _current_section.get()
+        if parent is not None and parent.run is self.run:
+            parent.children += elapsed
+        run = self.run
+        if threading.get_ident() == run.thread_id:
+            run.path = self.names[:-1]
+        # Sections in worker threads overlap their parent, so self time is clamped
+        run._add("/".join(self.names), elapsed, max(elapsed - self.children, 0.0))
+        return False
+
+
+class _NoSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SECTION = _NoSection()
+
+
+def section(name):
+    """Context manager timing ``name`` within the current profiled run, if any."""
+    run = current_run.get()
+    if run is None or run.finished:
+        return _NO_SECTION
+    return _Section(name, run)
+
+
+def profiled(name):
+    """Decorator timing every call of the function as section ``name``."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _fold(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append((code.co_filename, f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"))
+        frame = frame.f_back
+    names.reverse()
+    start = 0
+    while start < len(names) - 1 and any(module in names[start][0] for module in _RUNNER_MODULES):
+        start += 1
+    return [name for _, name in names[start:]]
+
+
+class RerunProfiler:
+    """Aggregates profiled runs across sessions for the in-app report.
+
+    ``start()`` at the top of the script and ``finish()`` at the end; a
+    run that never reaches ``finish()`` (an exception, ``st.rerun()``) is
+    closed as incomplete when its session starts the next one. Keeps the
+    last ``max_runs`` runs, per-section totals and the folded stacks.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, max_runs=200):
+        self.interval = interval
+        self._runs = deque(maxlen=max_runs)
+        self._sections = {}  # path -> [calls, total, self, max]
+        self._stacks = Counter()
+        self._active = {}  # session -> run
+        self._cond = threading.Condition()
+        self._sampler = None
+
+    def start(self, page, session=None):
+        """Profile the calling thread's script run; returns the ProfileRun."""
+        run = ProfileRun(page, session)
+        with self._cond:
+            previous = self._active.pop(session, None)
+            if previous is not None:
+                self._close(previous)
+            self._active[session] = run
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample, name="rerun-profiler", daemon=True)
+                self._sampler.start()
+            self._cond.notify_all()
+        current_run.set(run)
+        return run
+
+    def finish(self, run):
+        with self._cond:
+            if self._active.get(run.session) is run:
+                del self._active[run.session]
+            run.complete = True
+            self._close(run)
+
+    def _close(self, run):
+        with run._lock:
+            if run.finished:
+                return
+            run.finished = True
+        # An abandoned run is timed up to its last section, not until it was noticed
+        run.wall = (time.perf_counter() if run.complete else run.last) - run.started
+        for path, (calls, total, self_time, longest) in run.sections.items():
+            timing = self._sections.setdefault(path, [0, 0.0, 0.0, 0.0])
+            timing[0] += calls
+            timing[1] += total
+            timing[2] += self_time
+            timing[3] = max(timing[3], longest)
+        self._runs.append(run)
+
+    def _sample(self):
+        while True:
+            with self._cond:
+                while not self._active:
+                    self._cond.wait()
+                runs = list(self._active.values())
+            frames = sys._current_frames()
+            stacks = []
+            for run in runs:
+                frame = frames.get(run.thread_id)
+                if frame is None:
+                    # The script thread is gone without finishing the run
+                    with self._cond:
+                        if self._active.get(run.session) is run:
+                            del self._active[run.session]
+                        self._close(run)
+                else:
+                    # Open sections lead the stack so the flame graph groups by page and tab
+                    stacks.append((run, ";".join([f"[{name}]" for name in run.path] + _fold(frame))))
+            del frames
+            with self._cond:
+                for run, stack in stacks:
+                    if not run.finished:
+                        run.samples += 1
+                        self._stacks[stack] += 1
+            time.sleep(self.interval)
+
+    def top_sections(self, n=10):
+        """The ``n`` sections with the most self time over all profiled runs."""
+        with self._cond:
+            wall = sum(run.wall for run in self._runs)
+            rows = [
+                {
+                    "section": path,
+                    "calls": calls,
+                    "self_ms": round(self_time * 1000, 1),
+                    "total_ms": round(total * 1000, 1),
+                    "mean_ms": round(total / calls * 1000, 2),
+                    "max_ms": round(longest * 1000, 1),
+                    "share": round(self_time / wall, 3) if wall else 0.0,
+                }
+                for path, (calls, total, self_time, longest) in self._sections.items()
+            ]
+        rows.sort(key=lambda row: row["self_ms"], reverse=True)
+        return rows[:n]
+
+    def runs(self):
+        """Recently profiled runs, newest first."""
+        with self._cond:
+            return [run.to_dict() for run in reversed(self._runs)]
+
+    def folded(self):
+        """Aggregated stacks as ``frame;frame;... count`` lines for flame graph tools."""
+        with self._cond:
+            return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def stats(self):
+        with self._cond:
+            return {
+                "runs": len(self._runs),
+                "active": len(self._active),
+                "samples": sum(self._stacks.values()),
+                "stacks": len(self._stacks),
+                "interval_ms": self.interval * 1000,
+            }
+
+    def clear(self):
+        with self._cond:
+            self._runs.clear()
+            self._sections.clear()
+            self._stacks.clear()
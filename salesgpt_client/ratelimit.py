@@ -0,0 +1,230 @@
+"""Client-side rate limiting with adaptive concurrency per endpoint.
+
+Endpoints backed by rate-limited upstreams (Apollo for strategies, Exa
+for LinkedIn search) each get a token bucket and a concurrency limit.
+Both adapt AIMD-style: every successful call nudges them up, and a 429
+halves them and pauses the endpoint for the server's Retry-After. When
+latency climbs well above its recent average, the concurrency limit is
+eased down before the upstream starts rejecting; the average decays, so
+a slow spell does not hold the limit down once it has passed. Until the first 429 the rate
+grows faster (slow start) so the ceiling is found quickly. Callers
+waiting for a slot are served round-robin by owner (one Streamlit
+session or batch job), so one session's burst cannot starve the others.
+"""
+
+import contextvars
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from .errors import DeadlineExceeded
+from .telemetry import endpoint_label
+
+
+# Who is asking; set once per Streamlit rerun or job. Requests with no
+# owner share one queue.
+current_owner = contextvars.ContextVar("salesgpt_owner", default=None)
+
+# Latency above this multiple of the recent average counts as upstream queueing
+LATENCY_TOLERANCE = 2.0
+# Weight of each new sample in the moving average of latency
+LATENCY_DECAY = 0.2
+
+
+@dataclass
+class EndpointLimit:
+    """Starting point and bounds for one endpoint's limiter."""
+
+    rate: float  # requests per second to start with
+    burst: int = 2
+    max_concurrency: int = 8
+    min_rate: float = 0.05
+    max_rate: float = None  # defaults to 4x rate
+    max_retries: int = 3  # resends of a request answered with 429
+
+
+DEFAULT_LIMITS = {
+    "generateSalesStrategy": EndpointLimit(rate=2.0, burst=4, max_concurrency=8),
+    "linkedinProfiles/search": EndpointLimit(rate=3.0, burst=5, max_concurrency=6),
+}
+
+
+class _Ticket:
+    __slots__ = ("granted",)
+
+    def __init__(self):
+        self.granted = False
+
+
+class EndpointLimiter:
+    """Token bucket plus AIMD concurrency limit for one endpoint."""
+
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = limit
+        self.max_rate = limit.max_rate or limit.rate * 4
+        self.rate = limit.rate
+        self.tokens = float(limit.burst)
+        self.concurrency = float(max(1, limit.max_concurrency // 2))
+        self.in_flight = 0
+        self.baseline_latency = None  # moving average of successful calls
+        self.slow_start = True
+
+        self.requests = 0
+        self.throttled = 0
+        self.slowed = 0
+        self.expired = 0
+        self.waited = 0.0
+        self.max_queued = 0
+
+        self._queues = OrderedDict()  # owner -> deque of waiting tickets, in serving order
+        self._cond = threading.Condition()
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+
+    @property
+    def queued(self):
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _refill(self, now):
+        self.tokens = min(float(self.limit.burst), self.tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def _delay(self, now):
+        # Seconds until the next request may start; None means wait for a release
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.in_flight >= int(self.concurrency):
+            return None
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def _grant(self, now):
+        """Admit waiting tickets, one owner at a time; returns the delay before the next."""
+        self._refill(now)
+        while self._queues:
+            delay = self._delay(now)
+            if delay != 0.0:
+                return delay
+            owner, queue = next(iter(self._queues.items()))
+            queue.popleft().granted = True
+            if queue:
+                self._queues.move_to_end(owner)
+            else:
+                del self._queues[owner]
+            self.tokens -= 1
+            self.in_flight += 1
+        return None
+
+    def acquire(self, owner=None, deadline=None):
+        """Block until this call may be sent; returns the seconds spent waiting.
+
+        ``deadline`` is a ``time.monotonic()`` value; if it passes first
+        the call gives up its place in the queue and DeadlineExceeded is
+        raised.
+        """
+        ticket = _Ticket()
+        started = time.monotonic()
+        with self._cond:
+            self.requests += 1
+            queue = self._queues.setdefault(owner, deque())
+            queue.append(ticket)
+            self.max_queued = max(self.max_queued, self.queued)
+            while True:
+                now = time.monotonic()
+                delay = self._grant(now)
+                if ticket.granted:
+                    # Others may have been admitted in the same pass
+                    self._cond.notify_all()
+                    break
+                if deadline is not None:
+                    if now >= deadline:
+                        queue.remove(ticket)
+                        if not queue and self._queues.get(owner) is queue:
+                            del self._queues[owner]
+                        self.expired += 1
+                        self.waited += now - started
+                        raise DeadlineExceeded(f"No {self.name} slot before the deadline")
+                    delay = deadline - now if delay is None else min(delay, deadline - now)
+                self._cond.wait(delay)
+            waited = time.monotonic() - started
+            self.waited += waited
+        return waited
+
+    def release(self, status=None, latency=None, retry_after=None, sample=True):
+        """Return the slot and adapt to how the call went.
+
+        ``status`` is the HTTP status (None for a transport error),
+        ``latency`` the seconds the call took once admitted and
+        ``retry_after`` the server's Retry-After in seconds, if any.
+        Only 2xx calls with ``sample`` set adapt the limits; pass False
+        for answers that did not do the usual work, such as a fallback.
+        """
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if status == 429:
+                self.throttled += 1
+                self.slow_start = False
+                self.concurrency = max(1.0, self.concurrency / 2)
+                self.rate = max(self.limit.min_rate, self.rate / 2)
+                self.tokens = 0.0
+                self._refilled = now
+                self._paused_until = max(self._paused_until, now + (retry_after or 1 / self.rate))
+            elif status is not None and 200 <= status < 300 and sample and latency is not None:
+                baseline = self.baseline_latency
+                self.baseline_latency = latency if baseline is None else baseline + LATENCY_DECAY * (latency - baseline)
+                if baseline is not None and latency > baseline * LATENCY_TOLERANCE:
+                    # Upstream is queueing; back off gently before it starts rejecting
+                    self.slowed += 1
+                    self.concurrency = max(1.0, self.concurrency * 0.9)
+                else:
+                    self.concurrency = min(float(self.limit.max_concurrency), self.concurrency + 1 / self.concurrency)
+                    step = 0.25 if self.slow_start else 0.05
+                    self.rate = min(self.max_rate, self.rate + self.limit.rate * step)
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "endpoint": self.name,
+                "rate": self.rate,
+                "concurrency": int(self.concurrency),
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "waiting_owners": len(self._queues),
+                "max_queued": self.max_queued,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "slowed": self.slowed,
+                "baseline_latency_s": self.baseline_latency,
+                "expired": self.expired,
+                "waited_s": self.waited,
+                "paused_s": max(self._paused_until - now, 0.0),
+            }
+
+
+class RateLimiter:
+    """The EndpointLimiters for one client, looked up by endpoint."""
+
+    def __init__(self, limits=None):
+        limits = DEFAULT_LIMITS if limits is None else limits
+        self._limiters = {name: EndpointLimiter(name, limit) for name, limit in limits.items()}
+
+    def get(self, endpoint):
+        """The limiter for ``endpoint``, or None if it is not limited."""
+        return self._limiters.get(endpoint_label(endpoint))
+
+    def stats(self):
+        return [limiter.stats() for limiter in self._limiters.values()]
+
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored."""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
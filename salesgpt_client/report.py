@@ -0,0 +1,185 @@
+"""Compile a generateSalesStrategy response into a few HTML blocks.
+
+Rendering a strategy widget by widget costs one Streamlit element per
+bullet, card and heading. The report is instead built once as a few
+pre-rendered HTML strings, memoized on a hash of the response, so showing
+the same strategy again sends only a handful of elements. Every value
+from the API is HTML-escaped.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from html import escape
+
+
+MAX_CACHED_REPORTS = 128
+
+
+@dataclass
+class StrategyReport:
+    digest: str
+    title: str
+    overview_html: str
+    body_html: str
+    ccs_score: object = None
+    debug: dict = field(default_factory=dict)
+
+
+def strategy_digest(result):
+    """Stable hash of a strategy payload, independent of key order."""
+    canonical = json.dumps(result, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def _text(value, default="Not available"):
+    if value is None or value == "":
+        return escape(default)
+    return escape(str(value))
+
+
+def _bullets(items):
+    if not items:
+        return ""
+    return "<ul>" + "".join(f"<li>{_text(item)}</li>" for item in items) + "</ul>"
+
+
+def _section(title, inner):
+    return f'<h3>{escape(title)}</h3><div class="strategy-section">{inner}</div>'
+
+
+def _obstacles(obstacles):
+    entries = []
+    for key, value in obstacles.items():
+        if isinstance(value, dict) and "description" in value:
+            # obstacle1, obstacle2, ... each with description and mitigation
+            entries.append((value["description"], value.get("mitigation")))
+        elif key == "description" and "mitigation" in obstacles:
+            # A single obstacle given directly as description/mitigation keys
+            entries.append((obstacles["description"], obstacles.get("mitigation")))
+            break
+    return "<hr>".join(
+        f"<p><strong>{_text(description)}</strong></p><p><em>Mitigation:</em> {_text(mitigation)}</p>"
+        for description, mitigation in entries
+    )
+
+
+def _competitors(competitors):
+    cards = []
+    for competitor in competitors:
+        cards.append(
+            '<div class="competitor-card">'
+            f"<h4>{_text(competitor.get('competitor'), 'Competitor')}</h4>"
+            f"<p><strong>Strengths:</strong></p>{_bullets(competitor.get('strengths', []))}"
+            f"<p><strong>Weaknesses:</strong></p>{_bullets(competitor.get('weaknesses', []))}"
+            "</div>"
+        )
+    return '<div class="competitor-grid">' + "".join(cards) + "</div>"
+
+
+def _ccs(score):
+    try:
+        value = float(score)
+    except (TypeError, ValueError):
+        value = 0.0
+    if value >= 85:
+        color, verdict, kind = "#4CAF50", "Excellent compatibility with this prospect", "success"
+    elif value >= 75:
+        color, verdict, kind = "#FFC107", "Good compatibility with this prospect", "warning"
+    else:
+        color, verdict, kind = "#F44336", "Average compatibility - may require additional effort", "error"
+    width = min(max(value, 0.0), 100.0)
+    return (
+        '<h3>Customer Compatibility Score (CCS)</h3>'
+        f'<div class="ccs-track"><div class="ccs-fill" style="width:{width:.0f}%;background:{color}"></div></div>'
+        f'<p style="text-align:center; font-size:24px; font-weight:bold; color:{color}">{_text(score, "0")}/100</p>'
+        f'<div class="ccs-verdict ccs-{kind}">{escape(verdict)}</div>'
+    )
+
+
+def _compile(result, digest):
+    size = result.get("companySize") or {}
+    metrics = [
+        (result.get("industry"), "Industry"),
+        (result.get("businessType"), "Business Type"),
+        (size.get("employeeCount"), "Employees"),
+        (result.get("headquarters"), "Location"),
+    ]
+    overview_html = '<div class="metric-grid">' + "".join(
+        f'<div class="metric-card"><div class="metric-value">{_text(value, "N/A")}</div>'
+        f'<div class="metric-label">{label}</div></div>'
+        for value, label in metrics
+    ) + "</div>"
+
+    products = result.get("productOrServiceDetails") or []
+    parts = [
+        "<h3>Products &amp; Services</h3>"
+        + (_bullets(products) or "<p>No product/service information available</p>")
+    ]
+
+    strategy = result.get("salesStrategy") or {}
+    obstacles = strategy.get("potentialObstaclesMitigation") or {}
+    competitors = strategy.get("competitorAnalysis") or []
+    if strategy:
+        situation = strategy.get("currentSituation") or {}
+        parts.append(_section(
+            "Current Situation",
+            f"<h4>Opportunities &amp; Priorities</h4><p>{_text(situation.get('opportunitiesAndPriorities'))}</p>"
+            f"<h4>Existing Technology Solutions</h4>{_bullets(situation.get('existingTechnologySolutions', []))}"
+            f"<h4>Pain Points &amp; Market Pressures</h4>{_bullets(situation.get('painPointsAndMarketPressures', []))}",
+        ))
+
+        value_prop = strategy.get("valueProposition") or {}
+        parts.append(_section(
+            "Value Proposition",
+            f"<h4>Key Message</h4><p>{_text(value_prop.get('keyMessage'))}</p>"
+            f"<h4>Benefits</h4>{_bullets(value_prop.get('benefits', []))}"
+            f"<h4>Differentiation</h4><p>{_text(value_prop.get('differentiation'))}</p>",
+        ))
+
+        if obstacles:
+            parts.append(_section("Potential Obstacles & Mitigation", _obstacles(obstacles)))
+        else:
+            parts.append("<h3>Potential Obstacles &amp; Mitigation</h3><p>No obstacles information available</p>")
+
+        parts.append(_section("Engagement Strategy", _bullets(strategy.get("engagementStrategy", []))))
+
+        parts.append("<h3>Competitor Analysis</h3>" + (_competitors(competitors) if competitors else ""))
+        parts.append(_ccs(strategy.get("ccsScore", 0)))
+
+    return StrategyReport(
+        digest=digest,
+        title=f"{result.get('companyName', 'Company')} Sales Strategy",
+        overview_html=overview_html,
+        body_html="".join(parts),
+        ccs_score=strategy.get("ccsScore"),
+        debug={
+            "top_level_keys": list(result.keys()),
+            "salesStrategy_keys": list(strategy.keys()),
+            "obstacles_count": len(obstacles),
+            "competitors_count": len(competitors),
+        },
+    )
+
+
+_reports = OrderedDict()
+_reports_lock = threading.Lock()
+
+
+def compile_strategy_report(result):
+    """Return the StrategyReport for ``result``, reusing a cached one if seen before."""
+    digest = strategy_digest(result)
+    with _reports_lock:
+        report = _reports.get(digest)
+        if report is not None:
+            _reports.move_to_end(digest)
+            return report
+
+    report = _compile(result, digest)
+    with _reports_lock:
+        _reports[digest] = report
+        while len(_reports) > MAX_CACHED_REPORTS:
+            _reports.popitem(last=False)
+    return report
@@ -0,0 +1,122 @@
+"""Coalesce identical concurrent calls into one.
+
+While a call for a key is in flight, other callers asking for the same
+key wait for it and receive its result (or exception) instead of
+issuing their own. Nothing is kept once the call returns, so this
+removes duplicate concurrent work without serving stale results.
+
+A waiting caller stays within its own deadline, and when the call it
+waited for ran out of time or was cancelled it makes the call itself.
+"""
+
+import json
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from .cache import normalize_text
+from .deadline import cap_timeout
+from .errors import DeadlineExceeded, JobCancelled
+from .telemetry import endpoint_label
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return normalize_text(value)
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def request_key(method, endpoint, payload=None):
+    """Key for a JSON request; string values are compared case- and whitespace-insensitively."""
+    body = json.dumps(_normalize(payload), sort_keys=True, separators=(",", ":"), default=str)
+    return f"{method.upper()} {endpoint.strip('/')} {body}"
+
+
+class SingleFlight:
+    """Thread-safe single-flight group with per-endpoint counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._counts = {}  # endpoint label -> [executed, shared]
+        self.executed = 0
+        self.shared = 0
+
+    @property
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key, fn, endpoint=None):
+        """Return ``(fn(), shared)``, running ``fn`` only if no call for ``key`` is in flight.
+
+        ``shared`` is True when the result came from another caller's call.
+        Waiting for that call raises DeadlineExceeded once this caller's own
+        ``current_deadline`` passes.
+        """
+        label = endpoint_label(endpoint) if endpoint else key
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            counts = self._counts.setdefault(label, [0, 0])
+            counts[0 if leader else 1] += 1
+            if leader:
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            timeout = cap_timeout(None, f"waiting for {label}")
+            try:
+                return future.result(timeout=timeout), True
+            except FutureTimeout:
+                if future.done():
+                    raise  # the call itself timed out
+                raise DeadlineExceeded(f"Budget ran out while waiting for {label}") from None
+            except (DeadlineExceeded, JobCancelled):
+                # The leader's budget is not ours; try again with what this caller has left
+                return self.do(key, fn, endpoint)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result, False
+
+    def _finish(self, key):
+        # Forget the key before publishing, so later callers start a fresh call
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            total = self.executed + self.shared
+            return {
+                "calls": total,
+                "executed": self.executed,
+                "shared": self.shared,
+                "shared_rate": self.shared / total if total else 0.0,
+                "in_flight": len(self._calls),
+                "endpoints": [
+                    {"endpoint": label, "executed": executed, "shared": shared}
+                    for label, (executed, shared) in sorted(
+                        self._counts.items(), key=lambda item: item[1][1], reverse=True
+                    )
+                ],
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self.executed = 0
+            self.shared = 0
@@ -0,0 +1,45 @@
+"""Minimal parser for server-sent event (``text/event-stream``) bodies."""
+
+import json
+from dataclasses import dataclass
+
+
+@dataclass
+class Event:
+    event: str = "message"
+    data: str = ""
+    id: str = None
+
+    def json(self):
+        return json.loads(self.data) if self.data else None
+
+
+def iter_events(lines):
+    """Yield an Event for each blank-line-terminated block in ``lines``.
+
+    ``lines`` is an iterable of str or bytes without line endings, such as
+    ``response.iter_lines()``. Comment lines (``:keep-alive``) are skipped
+    and multi-line ``data`` fields are joined with newlines.
+    """
+    event, data, event_id = None, [], None
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line:
+            if data or event:
+                yield Event(event or "message", "\n".join(data), event_id)
+            event, data = None, []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            event = value
+        elif name == "data":
+            data.append(value)
+        elif name == "id":
+            event_id = value
+    if data or event:
+        yield Event(event or "message", "\n".join(data), event_id)
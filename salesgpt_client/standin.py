@@ -0,0 +1,444 @@
+"""Local stand-in for the SalesGPT backend with injectable latency.
+
+Serves the endpoints the Streamlit app calls with canned, well-formed
+payloads so the client, the CLI and the benchmark harness can run with
+no Node server, Chroma, GCS or model API keys::
+
+    python -m salesgpt_client standin --port 3003 --latency generateSalesStrategy=1.5
+
+documents/generateSalesStrategy streams server-sent events, one word
+every TOKEN_INTERVAL seconds, when the request accepts
+``text/event-stream``. An injected failure on a stream cuts the
+connection halfway through instead of answering 500.
+
+``ceilings`` imitates rate-limited upstreams: calls to an endpoint beyond
+its requests-per-second ceiling are answered with 429 and Retry-After.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+# Seconds of simulated server time per endpoint; applied with +/- JITTER
+DEFAULT_LATENCY = {
+    "system/status": 0.005,
+    "documents/list": 0.02,
+    "documents/query": 0.08,
+    "documents/upload": 0.05,
+    "documents/status": 0.005,
+    "documents/chunks": 0.02,
+    "documents/get": 0.02,
+    "documents/hash": 0.005,
+    "generateSalesStrategy": 0.8,
+    "documents/generateSalesStrategy": 0.5,  # time to first token
+    "linkedinProfiles/search": 0.3,
+}
+JITTER = 0.25
+
+# Seconds between streamed words of a document-based strategy
+TOKEN_INTERVAL = 0.02
+
+SAMPLE_STRATEGY = {
+    "industry": "Software",
+    "businessType": "B2B",
+    "headquarters": "San Francisco, CA",
+    "companySize": {"employeeCount": "1,000-5,000", "annualRevenue": "$500M"},
+    "productOrServiceDetails": ["Cloud platform", "Analytics suite", "Professional services"],
+    "salesStrategy": {
+        "currentSituation": {
+            "opportunitiesAndPriorities": "Consolidating tooling after rapid growth.",
+            "existingTechnologySolutions": ["Salesforce", "Snowflake"],
+            "painPointsAndMarketPressures": ["Rising cloud costs", "Fragmented reporting"],
+        },
+        "valueProposition": {
+            "keyMessage": "One platform for revenue data.",
+            "benefits": ["Faster forecasting", "Lower tooling spend"],
+            "differentiation": "Native integrations with existing CRM.",
+        },
+        "potentialObstaclesMitigation": {
+            "obstacle1": {"description": "Budget freeze", "mitigation": "Phased rollout"},
+        },
+        "engagementStrategy": ["Executive briefing", "Pilot with one region"],
+        "competitorAnalysis": [
+            {"competitor": "Incumbent BI", "strengths": ["Installed base"], "weaknesses": ["Slow releases"]},
+        ],
+        "ccsScore": 72,
+    },
+}
+
+SAMPLE_DOCUMENT_STRATEGY = """## Key Insights from the Document
+The document highlights **long approval cycles** and fragmented reporting across regional teams.
+
+## Current Situation
+- Three separate CRM instances after recent acquisitions
+- Quarterly forecasts assembled by hand in spreadsheets
+
+## Value Proposition
+A single revenue data layer that cuts forecast preparation from days to hours.
+
+## Potential Obstacles & Mitigation
+- **Budget freeze:** start with a paid pilot in one region
+- **Security review:** share the completed questionnaire up front
+
+## Engagement Strategy
+1. Executive briefing with the CRO
+2. Two-week pilot on live pipeline data
+3. Joint business case for the wider rollout
+
+## Recommended Next Steps
+Book the executive briefing and request read access to one regional CRM.
+"""
+
+_WORDS = ("pricing", "renewal", "onboarding", "security", "budget", "integration", "forecast", "churn")
+
+
+def _parse_pairs(specs, unit):
+    values = {}
+    for spec in specs or []:
+        name, _, value = spec.partition("=")
+        if not value:
+            raise ValueError(f"expected endpoint={unit}, got {spec!r}")
+        values[name.strip()] = float(value)
+    return values
+
+
+def parse_latency(specs):
+    """Parse ``["endpoint=seconds", ...]`` into a dict."""
+    return _parse_pairs(specs, "seconds")
+
+
+def parse_ceilings(specs):
+    """Parse ``["endpoint=requests_per_second", ...]`` into a dict."""
+    return _parse_pairs(specs, "rps")
+
+
+def _iter_body(handler):
+    # The client streams uploads with chunked transfer encoding
+    if handler.headers.get("Transfer-Encoding", "").lower() == "chunked":
+        while True:
+            length = int(handler.rfile.readline().split(b";")[0].strip() or b"0", 16)
+            if length == 0:
+                handler.rfile.readline()
+                return
+            yield handler.rfile.read(length)
+            handler.rfile.readline()
+    length = int(handler.headers.get("Content-Length") or 0)
+    if length:
+        yield handler.rfile.read(length)
+
+
+def _read_body(handler):
+    return b"".join(_iter_body(handler))
+
+
+def _read_upload(handler):
+    """Size and SHA-256 of the file in a single-part multipart upload, read as it streams."""
+    boundary = handler.headers.get("Content-Type", "").partition("boundary=")[2].strip('"')
+    tail = len(f"\r\n--{boundary}--\r\n")
+    digest = hashlib.sha256()
+    size, buffer, in_file = 0, b"", False
+    for data in _iter_body(handler):
+        buffer += data
+        if not in_file:
+            head, found, rest = buffer.partition(b"\r\n\r\n")
+            if not found:
+                continue
+            buffer, in_file = rest, True
+        if len(buffer) > tail:
+            digest.update(buffer[:-tail])
+            size += len(buffer) - tail
+            buffer = buffer[-tail:]
+    return {"size": size, "contentHash": digest.hexdigest()}
+
+
+class StandinBackend:
+    """In-memory backend state shared by the request handlers."""
+
+    def __init__(self, latency=None, error_rate=0.0, documents=50, seed=None, ceilings=None):
+        self.latency = dict(DEFAULT_LATENCY, **(latency or {}))
+        self.error_rate = error_rate
+        self.ceilings = dict(ceilings or {})
+        self.rejected = {}
+        self._buckets = {}  # endpoint -> (tokens, last refill)
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.documents = [self._document(f"doc-{i:04d}", f"report-{i:04d}.pdf") for i in range(documents)]
+        self.server = None
+
+    @staticmethod
+    def _document(document_id, name, chunks=8):
+        return {
+            "documentId": document_id,
+            "collectionName": f"doc_{name.split('.')[0]}_{document_id[:8]}",
+            "metadata": {
+                "originalName": name,
+                "uploadedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "fileSize": 100_000,
+                "textLength": chunks * 1000,
+            },
+            "count": chunks,
+            "processed": True,
+        }
+
+    def _by_hash(self, content_hash):
+        return next((d for d in self.documents if d["metadata"].get("contentHash") == content_hash), None)
+
+    def _chunks(self, document_id, count):
+        return [
+            {
+                "id": f"{document_id}-chunk-{i}",
+                "text": f"{document_id} section {i} covers {_WORDS[(i + len(document_id)) % len(_WORDS)]} "
+                        "and the sales process challenges raised by the account team.",
+                "chunkIndex": i,
+                "metadata": {"documentId": document_id, "chunkIndex": i, "totalChunks": count},
+            }
+            for i in range(count)
+        ]
+
+    def over_ceiling(self, endpoint):
+        """Spend one request of ``endpoint``'s ceiling; True if there is none left."""
+        rate = self.ceilings.get(endpoint)
+        if not rate:
+            return False
+        now = time.monotonic()
+        with self.lock:
+            tokens, last = self._buckets.get(endpoint, (max(rate, 1.0), now))
+            tokens = min(max(rate, 1.0), tokens + (now - last) * rate)
+            if tokens < 1:
+                self._buckets[endpoint] = (tokens, now)
+                self.rejected[endpoint] = self.rejected.get(endpoint, 0) + 1
+                return True
+            self._buckets[endpoint] = (tokens - 1, now)
+            return False
+
+    def delay(self, endpoint):
+        """Sleep for the endpoint's latency; returns True if an error should be injected."""
+        with self.lock:
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+            seconds = self.latency.get(endpoint, 0.0) * self.random.uniform(1 - JITTER, 1 + JITTER)
+            fail = self.random.random() < self.error_rate
+        if seconds > 0:
+            time.sleep(seconds)
+        return fail
+
+    def handle(self, method, endpoint, query, body):
+        """Return (status, payload) for one request."""
+        if method == "GET" and endpoint == "system/status":
+            return 200, {
+                "server": "operational",
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "components": {
+                    "localStorage": "operational",
+                    "documentStorage": "operational",
+                    "gcsStorage": "operational",
+                },
+            }
+        if method == "GET" and endpoint == "documents/list":
+            with self.lock:
+                documents = list(self.documents)
+            return 200, {
+                "documents": documents,
+                "collectionNames": [d["collectionName"] for d in documents],
+                "syncedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "incremental": False,
+            }
+        if method == "POST" and endpoint == "documents/query":
+            limit = int((body or {}).get("limit") or 5)
+            hits = [(d, c) for d in self.documents[:limit] for c in self._chunks(d["documentId"], 1)]
+            return 200, {"results": {
+                "ids": [[c["id"] for _, c in hits]],
+                "documents": [[c["text"] for _, c in hits]],
+                "metadatas": [[dict(d["metadata"], collectionName=d["collectionName"]) for d, _ in hits]],
+                "distances": [[round(0.2 + 0.05 * i, 3) for i in range(len(hits))]],
+            }}
+        if method == "POST" and endpoint == "documents/upload":
+            file_data = {"originalName": "upload.pdf", "size": body["size"]}
+            with self.lock:
+                existing = self._by_hash(body["contentHash"])
+                if existing is not None and query.get("allowDuplicate") != ["true"]:
+                    return 200, {
+                        "message": "Document already uploaded; linked to the existing copy",
+                        "documentId": existing["documentId"],
+                        "collectionName": existing["collectionName"],
+                        "duplicate": True,
+                        "matchedOn": "contentHash",
+                        "fileData": file_data,
+                    }
+                document_id = str(uuid.uuid4())
+                document = self._document(document_id, "upload.pdf")
+                document["metadata"].update(fileSize=body["size"], contentHash=body["contentHash"])
+                self.documents.append(document)
+            return 202, {
+                "message": "Document uploaded; indexing in background",
+                "documentId": document_id,
+                "collectionName": document["collectionName"],
+                "fileData": file_data,
+            }
+        if method == "GET" and endpoint.startswith("documents/hash/"):
+            with self.lock:
+                existing = self._by_hash(endpoint.rsplit("/", 1)[1].lower())
+            if existing is None:
+                return 404, {"error": "No document with this content hash"}
+            return 200, existing
+        match = re.fullmatch(r"documents/([^/]+)/(status|chunks)", endpoint)
+        if method == "GET" and match:
+            document = next((d for d in self.documents if d["documentId"] == match.group(1)), None)
+            if document is None:
+                return 404, {"error": "Document not found"}
+            if match.group(2) == "status":
+                return 200, {"documentId": document["documentId"], "stage": "complete",
+                             "chunksIndexed": document["count"], "totalChunks": document["count"]}
+            if query.get("collectionName", [document["collectionName"]])[0] != document["collectionName"]:
+                return 404, {"error": "Document not found"}
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(document["count"])])[0])
+            chunks = self._chunks(document["documentId"], document["count"])
+            return 200, {"documentId": document["documentId"], "collectionName": document["collectionName"],
+                         "offset": offset, "total": len(chunks), "chunks": chunks[offset:offset + limit]}
+        if method == "GET" and endpoint.startswith("documents/"):
+            document_id = endpoint.split("/", 1)[1]
+            document = next((d for d in self.documents if d["documentId"] == document_id), None)
+            if document is None:
+                return 404, {"error": "Document not found"}
+            return 200, dict(document, textPreview=self._chunks(document_id, 1)[0]["text"][:300] + "...")
+        if method == "POST" and endpoint == "generateSalesStrategy":
+            return 200, dict(SAMPLE_STRATEGY, companyName=(body or {}).get("companyName") or "Company")
+        if method == "POST" and endpoint == "documents/generateSalesStrategy":
+            document_id = (body or {}).get("documentId")
+            document = next((d for d in self.documents if d["documentId"] == document_id), None)
+            if document is None:
+                return 404, {"error": "Document not found"}
+            company = (body or {}).get("companyName") or "Company"
+            return 200, {
+                "documentId": document_id,
+                "companyName": company,
+                "companyInfo": {
+                    "companyName": company,
+                    "documentId": document_id,
+                    "documentName": document["metadata"]["originalName"],
+                    "collectionName": document["collectionName"],
+                },
+                "salesStrategy": SAMPLE_DOCUMENT_STRATEGY,
+            }
+        if method == "POST" and endpoint == "linkedinProfiles/search":
+            company = (body or {}).get("company") or "Company"
+            limit = int((body or {}).get("limit") or 5)
+            return 200, {"profiles": [
+                {"name": f"Person {i}", "title": f"{(body or {}).get('position', 'Manager')} at {company}",
+                 "url": f"https://www.linkedin.com/in/standin-{i}", "snippet": "Stand-in profile"}
+                for i in range(limit)
+            ]}
+        return 404, {"error": f"Unknown endpoint {method} {endpoint}"}
+
+    def start(self, host="127.0.0.1", port=0):
+        """Serve on a daemon thread; returns the API base URL."""
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _dispatch(self, method):
+                parsed = urlparse(self.path)
+                endpoint = parsed.path.split("/api/", 1)[-1].strip("/")
+                if method == "POST" and endpoint == "documents/upload":
+                    body = _read_upload(self)
+                else:
+                    raw = _read_body(self) if method == "POST" else b""
+                    try:
+                        body = json.loads(raw) if raw else None
+                    except ValueError:
+                        body = None
+
+                if endpoint.startswith("documents/hash/"):
+                    timed = "documents/hash"
+                elif re.fullmatch(r"documents/[^/]+/(status|chunks)", endpoint):
+                    timed = "documents/" + endpoint.rsplit("/", 1)[1]
+                elif method == "GET" and endpoint.startswith("documents/") and endpoint != "documents/list":
+                    timed = "documents/get"
+                else:
+                    timed = endpoint
+
+                if backend.over_ceiling(endpoint):
+                    data = json.dumps({"error": "Upstream rate limit reached, retry later"}).encode("utf-8")
+                    self.send_response(429)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Retry-After", "1")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+
+                fail = backend.delay(timed)
+                streaming = (endpoint == "documents/generateSalesStrategy"
+                             and "text/event-stream" in self.headers.get("Accept", ""))
+                if fail and not streaming:
+                    status, payload = 500, {"error": "Injected failure"}
+                else:
+                    status, payload = backend.handle(method, endpoint, parse_qs(parsed.query), body)
+
+                if endpoint == "documents/generateSalesStrategy" and status == 200:
+                    if streaming:
+                        return self._stream_strategy(payload, broken=fail)
+                    # Blocking callers wait for the whole generation
+                    time.sleep(TOKEN_INTERVAL * len(payload["salesStrategy"].split()))
+
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _chunk(self, data):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+
+            def _event(self, event, payload):
+                self._chunk(f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+            def _stream_strategy(self, payload, broken=False):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                meta = {key: payload[key] for key in ("documentId", "companyName", "companyInfo")}
+                self._event("meta", meta)
+                words = re.findall(r"\S+\s*", payload["salesStrategy"])
+                for i, word in enumerate(words):
+                    if broken and i == len(words) // 2:
+                        # Drop the connection without the terminating chunk
+                        self.close_connection = True
+                        return
+                    time.sleep(TOKEN_INTERVAL)
+                    self._event("token", {"text": word})
+                self._event("done", payload)
+                self._chunk(b"")
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="salesgpt-standin", daemon=True).start()
+        return f"http://{host}:{self.server.server_address[1]}/api"
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,165 @@
+"""Per-request latency and size telemetry kept in a bounded ring buffer."""
+
+import os
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+
+
+DEFAULT_SIZE = int(os.environ.get("SALESGPT_TELEMETRY_SIZE", 2000))
+
+# Path segments that are fixed routes rather than document IDs
+_DOCUMENT_ROUTES = {"list", "query", "upload", "hash", "generateSalesStrategy"}
+_ID_RE = re.compile(r"^documents/([^/]+)(/.*)?$")
+
+
+def endpoint_label(endpoint):
+    """Collapse document IDs so calls group by route, e.g. documents/:id/status."""
+    endpoint = endpoint.split("?", 1)[0].strip("/")
+    match = _ID_RE.match(endpoint)
+    if match and match.group(1) == "hash":
+        return "documents/hash/:hash"
+    if match and match.group(1) not in _DOCUMENT_ROUTES:
+        return f"documents/:id{match.group(2) or ''}"
+    return endpoint or "/"
+
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile of an already sorted list, q in [0, 100]."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def body_size(body):
+    """Best-effort byte count of a prepared request body."""
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    # Streamed bodies (MultipartStream) count what they sent
+    return getattr(body, "sent", None)
+
+
+@dataclass
+class RequestEvent:
+    """One API call as seen by the client.
+
+    ``wall_ms`` covers the whole call including waiting for a concurrency
+    slot (``queue_ms``), retries and reading the body. ``ttfb_ms`` is the
+    final attempt's time from sending the request to parsed response
+    headers; ``transfer_ms`` is what remains.
+    """
+
+    at: float
+    method: str
+    endpoint: str
+    status: int = None
+    wall_ms: float = 0.0
+    queue_ms: float = 0.0
+    ttfb_ms: float = None
+    request_bytes: int = None
+    response_bytes: int = None
+    retries: int = 0
+    error: str = None
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and self.status < 400
+
+    @property
+    def transfer_ms(self):
+        if self.ttfb_ms is None:
+            return None
+        return max(self.wall_ms - self.queue_ms - self.ttfb_ms, 0.0)
+
+    def to_dict(self):
+        record = asdict(self)
+        record["transfer_ms"] = self.transfer_ms
+        return record
+
+
+class Telemetry:
+    """Thread-safe ring buffer of the most recent ``maxlen`` RequestEvents."""
+
+    def __init__(self, maxlen=DEFAULT_SIZE):
+        self._events = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    @property
+    def maxlen(self):
+        return self._events.maxlen
+
+    def __len__(self):
+        return len(self._events)
+
+    def record(self, method, endpoint, started, queued, response=None, error=None, stream=False):
+        """Build and store a RequestEvent for a call that began at ``started`` (perf_counter)."""
+        event = RequestEvent(
+            at=time.time(),
+            method=method,
+            endpoint=endpoint_label(endpoint),
+            wall_ms=(time.perf_counter() - started) * 1000,
+            queue_ms=queued * 1000,
+            error=error,
+        )
+        if response is not None:
+            event.status = response.status_code
+            event.ttfb_ms = response.elapsed.total_seconds() * 1000
+            event.request_bytes = body_size(response.request.body)
+            if stream:
+                length = response.headers.get("Content-Length")
+                event.response_bytes = int(length) if length and length.isdigit() else None
+            else:
+                event.response_bytes = len(response.content)
+            retry_state = getattr(response.raw, "retries", None)
+            event.retries = len(retry_state.history) if retry_state is not None else 0
+        with self._lock:
+            self._events.append(event)
+            self.recorded += 1
+        return event
+
+    def events(self):
+        with self._lock:
+            return list(self._events)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+    def summary(self):
+        """Per-endpoint counts, error rate and latency percentiles, busiest first."""
+        groups = {}
+        for event in self.events():
+            groups.setdefault(event.endpoint, []).append(event)
+
+        rows = []
+        for endpoint, events in groups.items():
+            wall = sorted(e.wall_ms for e in events)
+            ttfb = sorted(e.ttfb_ms for e in events if e.ttfb_ms is not None)
+            transfer = sorted(e.transfer_ms for e in events if e.transfer_ms is not None)
+            queue = sorted(e.queue_ms for e in events)
+            received = [e.response_bytes for e in events if e.response_bytes is not None]
+            errors = sum(1 for e in events if not e.ok)
+            rows.append({
+                "endpoint": endpoint,
+                "calls": len(events),
+                "error_rate": errors / len(events),
+                "p50_ms": percentile(wall, 50),
+                "p95_ms": percentile(wall, 95),
+                "p99_ms": percentile(wall, 99),
+                "p50_queue_ms": percentile(queue, 50),
+                "p50_ttfb_ms": percentile(ttfb, 50),
+                "p50_transfer_ms": percentile(transfer, 50),
+                "mean_response_kb": sum(received) / len(received) / 1024 if received else None,
+            })
+        rows.sort(key=lambda row: row["calls"], reverse=True)
+        return rows
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from salesgpt_client import brief
+from salesgpt_client.bulk import DONE, FAILED
+
+
+def test_sections_finish_independently():
+    def fail():
+        raise ValueError("backend down")
+
+    sections = [
+        brief.BriefSection(brief.STRATEGY, lambda: ("plan", False)),
+        brief.BriefSection(brief.CONTACTS, fail),
+    ]
+    finished = [section for section in brief.run_brief(sections, poll_interval=0.01) if section is not None]
+
+    assert sorted(section.key for section in finished) == [brief.CONTACTS, brief.STRATEGY]
+    assert (sections[0].status, sections[0].result) == (DONE, "plan")
+    assert (sections[1].status, sections[1].error) == (FAILED, "backend down")
+
+
+def test_rerun_waits_for_started_sections_instead_of_fetching_again():
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "plan", False
+
+    sections = [brief.BriefSection(brief.STRATEGY, fetch), brief.BriefSection(brief.INSIGHTS, lambda: ("x", False))]
+    origin = time.perf_counter()
+
+    # The caller stops iterating once the quick section is in, as a Streamlit rerun does
+    for section in brief.run_brief(sections, poll_interval=0.01, origin=origin):
+        if section is not None:
+            break
+    assert section.key == brief.INSIGHTS
+
+    release.set()
+    resumed = [section for section in brief.run_brief(sections, poll_interval=0.01, origin=origin) if section]
+
+    assert [section.key for section in resumed] == [brief.STRATEGY]
+    assert sections[0].result == "plan"
+    assert len(calls) == 1
+
+
+def test_deadline_fails_sections_still_running():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "late", False
+
+    sections = [brief.BriefSection(brief.STRATEGY, slow)]
+    try:
+        finished = [section for section in brief.run_brief(sections, deadline=0.05, poll_interval=0.01) if section]
+    finally:
+        release.set()
+
+    assert finished == sections
+    assert sections[0].status == FAILED
+    assert sections[0].error == "No response within 0s"
@@ -0,0 +1,43 @@
+import threading
+import time
+
+from salesgpt_client.bulk import DONE, FAILED, QUEUED, BulkRow, run_bulk
+
+
+def test_failing_row_does_not_stop_the_others():
+    def fetch(row):
+        if row.company_name == "Broken":
+            raise ValueError("backend down")
+        return {"company": row.company_name}, False
+
+    rows = [BulkRow(0, "Acme"), BulkRow(1, "Broken"), BulkRow(2, "Globex")]
+    finished = [row for row in run_bulk(rows, fetch, max_workers=2, poll_interval=0.01) if row is not None]
+
+    assert len(finished) == 3
+    assert [row.status for row in rows] == [DONE, FAILED, DONE]
+    assert rows[1].error == "backend down"
+
+
+def test_stopping_early_does_not_wait_for_queued_rows():
+    release = threading.Event()
+    sent = []
+
+    def fetch(row):
+        sent.append(row.index)
+        release.wait(5)
+        return {}, False
+
+    rows = [BulkRow(i, f"Company {i}") for i in range(6)]
+    started = time.perf_counter()
+    try:
+        # Give up at the first refresh, while both workers are busy
+        for _ in run_bulk(rows, fetch, max_workers=2, poll_interval=0.01):
+            break
+        assert time.perf_counter() - started < 1
+    finally:
+        release.set()
+
+    time.sleep(0.05)
+    # Only the two rows already running were sent; the rest stay queued for a later run
+    assert sorted(sent) == [0, 1]
+    assert [row.status for row in rows[2:]] == [QUEUED] * 4
@@ -0,0 +1,54 @@
+import time
+
+from salesgpt_client.cache import ResultCache, strategy_cache_key
+
+
+def test_get_returns_what_was_put(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("key", {"industry": "Software"})
+
+    entry = cache.get("key")
+    assert entry.value == {"industry": "Software"}
+    assert cache.get("other") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_past_their_ttl_are_misses_and_purged(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), ttl=0.05)
+    cache.put("key", "value")
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_read_entry_is_evicted_first(tmp_path):
+    value = "x" * 100  # 102 bytes as JSON
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), max_bytes=250)
+    cache.put("a", value)
+    time.sleep(0.01)
+    cache.put("b", value)
+    time.sleep(0.01)
+    cache.get("a")
+    cache.put("c", value)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["bytes"] <= 250
+
+
+def test_values_larger_than_the_cache_are_not_stored(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), max_bytes=10)
+    cache.put("key", "x" * 100)
+    assert cache.get("key") is None
+
+
+def test_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResultCache(path).put("key", [1, 2, 3])
+    assert ResultCache(path).get("key").value == [1, 2, 3]
+
+
+def test_strategy_keys_ignore_case_and_whitespace():
+    assert strategy_cache_key(" Google ", "United  States") == strategy_cache_key("google", "united states")
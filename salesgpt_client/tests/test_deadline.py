@@ -0,0 +1,101 @@
+import contextvars
+import threading
+import time
+
+import pytest
+import requests
+
+from salesgpt_client.client import SalesGPTClient
+from salesgpt_client.deadline import cap_timeout, current_deadline, in_background
+from salesgpt_client.errors import DeadlineExceeded
+from salesgpt_client.ratelimit import EndpointLimit
+
+
+def ok_response(endpoint):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"{}"
+    response.request = requests.Request("GET", f"http://backend.test/api/{endpoint}").prepare()
+    return response
+
+
+class FakeTransport:
+    base_url = "http://backend.test/api"
+
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, endpoint, **kwargs):
+        self.calls += 1
+        return ok_response(endpoint)
+
+
+class BlockingTransport(FakeTransport):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def request(self, method, endpoint, **kwargs):
+        self.calls += 1
+        if endpoint == "slow":
+            self.release.wait(5)
+        return ok_response(endpoint)
+
+
+def test_cap_timeout_shortens_to_the_time_left():
+    assert cap_timeout(30) == 30
+    token = current_deadline.set(time.monotonic() + 2)
+    try:
+        assert cap_timeout(30) <= 2
+        assert cap_timeout(None) <= 2
+    finally:
+        current_deadline.reset(token)
+
+
+def test_client_releases_slot_when_deadline_passes_after_acquire():
+    transport = FakeTransport()
+    client = SalesGPTClient(
+        transport=transport, rate_limits={"generateSalesStrategy": EndpointLimit(rate=100.0, burst=10)}
+    )
+    limiter = client.limiter.get("generateSalesStrategy")
+
+    # A free slot is granted before the deadline is looked at, then no time is left for the call
+    token = current_deadline.set(time.monotonic() - 1)
+    try:
+        with pytest.raises(DeadlineExceeded):
+            client.request("POST", "generateSalesStrategy", json={"companyName": "Acme"})
+    finally:
+        current_deadline.reset(token)
+
+    assert transport.calls == 0
+    assert limiter.in_flight == 0
+
+
+def test_background_calls_leave_interactive_slots_free():
+    transport = BlockingTransport()
+    client = SalesGPTClient(transport=transport, max_concurrency=2, interactive_slots=1)
+    assert client.background_slots == 1
+
+    def background(endpoint, deadline=None):
+        in_background.set(True)
+        current_deadline.set(deadline)
+        client.request("GET", endpoint)
+
+    holder = threading.Thread(target=lambda: contextvars.copy_context().run(background, "slow"))
+    holder.start()
+    try:
+        start = time.monotonic()
+        while transport.calls == 0:
+            assert time.monotonic() - start < 5
+            time.sleep(0.005)
+
+        # A second background call waits for the background slot only until its deadline
+        with pytest.raises(DeadlineExceeded):
+            contextvars.copy_context().run(background, "fast", time.monotonic() + 0.1)
+        # while an interactive call still gets the slot kept for it
+        client.request("GET", "fast")
+        assert transport.calls == 2
+    finally:
+        transport.release.set()
+        holder.join(5)
+
@@ -0,0 +1,97 @@
+from io import BytesIO
+
+from salesgpt_client import ingest
+from salesgpt_client.models import ProcessingStatus, UploadResult
+
+
+class FakeClient:
+    """Records the calls ingest makes; uploads get sequential document ids."""
+
+    def __init__(self, fail_uploads=0):
+        self.fail_uploads = fail_uploads
+        self.uploads = []
+        self.waits = []
+        self.hash_lookups = 0
+
+    def find_document_by_hash(self, content_hash):
+        self.hash_lookups += 1
+        return None
+
+    def upload_document(self, fh, name, content_type, timeout=None, progress=None, allow_duplicate=False):
+        body = fh.read()
+        if self.fail_uploads:
+            self.fail_uploads -= 1
+            raise ConnectionError("connection reset")
+        self.uploads.append(name)
+        if progress is not None:
+            progress(len(body), len(body))
+        document_id = f"doc-{len(self.uploads)}"
+        return UploadResult.from_json({"documentId": document_id, "collectionName": f"doc_{document_id}"})
+
+    def wait_for_processing(self, document_id, on_update=None, timeout=None):
+        self.waits.append(document_id)
+        return ProcessingStatus.from_json(
+            {"documentId": document_id, "stage": "complete", "chunksIndexed": 3, "totalChunks": 3}
+        )
+
+
+def make_item(name, content):
+    return ingest.IngestItem(name=name, size=len(content), open=lambda: BytesIO(content))
+
+
+def test_finished_files_are_resumed_without_uploading(tmp_path):
+    path = str(tmp_path / "ingest.sqlite3")
+    client = FakeClient()
+    items = [make_item("a.pdf", b"first"), make_item("b.pdf", b"second")]
+    list(ingest.run_ingest(items, client, ingest.IngestJournal(path), max_workers=2))
+    assert [item.status for item in items] == [ingest.DONE, ingest.DONE]
+
+    # A later run, e.g. after the tab was closed, reads the same journal
+    again = FakeClient()
+    rerun = [make_item("a.pdf", b"first"), make_item("b.pdf", b"second")]
+    list(ingest.run_ingest(rerun, again, ingest.IngestJournal(path), max_workers=2))
+
+    assert [item.status for item in rerun] == [ingest.RESUMED, ingest.RESUMED]
+    assert {item.document_id for item in rerun} == {item.document_id for item in items}
+    assert again.uploads == [] and again.hash_lookups == 0
+    assert ingest.summarize(rerun, 1.0).bytes_uploaded == 0
+
+
+def test_file_left_indexing_is_only_polled(tmp_path):
+    journal = ingest.IngestJournal(str(tmp_path / "ingest.sqlite3"))
+    item = make_item("a.pdf", b"content")
+    item.content_hash = ingest.content_hash(BytesIO(b"content"))
+    item.status = ingest.INDEXING
+    item.document_id, item.collection_name = "doc-7", "doc_doc-7"
+    journal.record(item)
+
+    client = FakeClient()
+    resumed = ingest.ingest_file(client, make_item("a.pdf", b"content"), journal)
+
+    assert client.uploads == []
+    assert client.waits == ["doc-7"]
+    assert (resumed.status, resumed.document_id, resumed.chunks) == (ingest.DONE, "doc-7", 3)
+
+
+def test_failed_files_are_retried_and_recorded(tmp_path):
+    journal = ingest.IngestJournal(str(tmp_path / "ingest.sqlite3"))
+    client = FakeClient(fail_uploads=1)
+    item = make_item("a.pdf", b"content")
+
+    list(ingest.run_ingest([item], client, journal))
+    assert item.status == ingest.FAILED
+    assert journal.get(item.content_hash)["error"] == "connection reset"
+
+    item.status, item.error = ingest.QUEUED, None
+    list(ingest.run_ingest([item], client, journal))
+    assert item.status == ingest.DONE
+    assert journal.get(item.content_hash)["status"] == ingest.DONE
+    assert journal.counts() == {ingest.DONE: 1}
+
+
+def test_open_buffer_reads_from_the_start_and_stays_open():
+    buffer = BytesIO(b"uploaded bytes")
+    buffer.read()
+    with ingest.open_buffer(buffer) as fh:
+        assert fh.read() == b"uploaded bytes"
+    assert not buffer.closed
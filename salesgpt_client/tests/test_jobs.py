@@ -0,0 +1,56 @@
+import threading
+import time
+
+from salesgpt_client.jobs import CANCELLED, DONE, FAILED, JobManager
+
+
+def wait_finished(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        assert time.monotonic() < deadline, "job did not finish"
+        time.sleep(0.005)
+
+
+def test_submit_returns_at_once_and_the_result_is_polled():
+    manager = JobManager(max_workers=2)
+    release = threading.Event()
+    job = manager.submit("strategy", lambda job: release.wait(5) and {"industry": "Software"}, owner="session")
+
+    assert manager.get(job.id) is job
+    assert not job.finished
+    release.set()
+    wait_finished(job)
+
+    assert job.status == DONE
+    assert manager.result(job) == {"industry": "Software"}
+    assert [j.id for j in manager.jobs(owner="session")] == [job.id]
+
+
+def test_cancelled_job_drops_its_late_result():
+    manager = JobManager(max_workers=1)
+    release = threading.Event()
+    job = manager.submit("strategy", lambda job: release.wait(5) and "late", owner="session")
+    while job.started_at is None:
+        time.sleep(0.005)
+
+    assert manager.cancel(job.id)
+    release.set()
+    time.sleep(0.05)
+
+    assert job.status == CANCELLED
+    assert manager.result(job) is None
+
+
+def test_job_fails_once_its_budget_is_spent():
+    manager = JobManager(max_workers=1)
+
+    def run(job):
+        while True:
+            job.check()
+            time.sleep(0.01)
+
+    job = manager.submit("strategy", run, label="Slow strategy", budget=0.05)
+    wait_finished(job)
+
+    assert job.status == FAILED
+    assert "budget" in job.error
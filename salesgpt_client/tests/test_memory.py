@@ -0,0 +1,77 @@
+import time
+
+from salesgpt_client.jobs import DONE, JobManager
+from salesgpt_client.memory import PayloadStore, payload_size, preview
+
+
+def wait_finished(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        assert time.monotonic() < deadline, "job did not finish"
+        time.sleep(0.005)
+
+
+def test_put_and_get_track_session_bytes():
+    store = PayloadStore()
+    size = store.put("s1", ("document", "a"), {"text": "x" * 100})
+
+    assert size == payload_size({"text": "x" * 100})
+    assert store.get("s1", ("document", "a")) == {"text": "x" * 100}
+    assert store.get("s2", ("document", "a")) is None
+    assert store.usage("s1")["session_bytes"] == size
+
+
+def test_large_unviewed_payloads_are_evicted_first():
+    store = PayloadStore(session_budget=1000)
+    store.put("s1", "large", "x" * 500)
+    store.put("s1", "small", "x" * 100)
+    time.sleep(0.01)
+    store.get("s1", "small")
+    store.put("s1", "new", "x" * 450)
+
+    assert store.get("s1", "large") is None
+    assert store.get("s1", "small") is not None
+    assert store.get("s1", "new") is not None
+    assert store.usage("s1")["evicted"] == 1
+
+
+def test_payloads_over_budget_are_not_kept():
+    store = PayloadStore(session_budget=100)
+    store.put("s1", "key", "x" * 500)
+
+    assert store.get("s1", "key") is None
+    assert store.usage("s1")["session_bytes"] == 0
+    assert store.rejected == 1
+
+
+def test_clear_can_drop_one_kind():
+    store = PayloadStore()
+    store.put("s1", ("document", "a"), 1)
+    store.put("s1", ("chunks", "a", 0, 10), 2)
+    store.clear("s1", "document")
+
+    assert store.get("s1", ("document", "a")) is None
+    assert store.get("s1", ("chunks", "a", 0, 10)) == 2
+
+
+def test_preview_shortens_long_values():
+    short, shortened = preview({"text": "x" * 1000, "items": list(range(50))}, max_string=10, max_items=5)
+
+    assert shortened == 2
+    assert short["text"].startswith("x" * 10)
+    assert len(short["items"]) == 6
+
+
+def test_result_is_handed_to_the_owners_store():
+    store = PayloadStore()
+    manager = JobManager(max_workers=2, store=store)
+    job = manager.submit("strategy", lambda job: {"salesStrategy": "..."}, owner="session")
+    wait_finished(job)
+
+    assert job.status == DONE
+    assert job.result is None
+    assert manager.result(job) == {"salesStrategy": "..."}
+    assert store.usage("session")["session_entries"] == 1
+
+    store.clear("session")
+    assert manager.result(job) is None
\ No newline at end of file
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from salesgpt_client.errors import DeadlineExceeded
+from salesgpt_client.ratelimit import EndpointLimit, EndpointLimiter, RateLimiter
+
+
+def make_limiter(max_concurrency=2):
+    # Starts at half of max_concurrency, so one call at a time here
+    return EndpointLimiter("test", EndpointLimit(rate=100.0, burst=10, max_concurrency=max_concurrency))
+
+
+def test_acquire_and_release_track_in_flight():
+    limiter = make_limiter()
+    limiter.acquire("a")
+    assert limiter.in_flight == 1
+    limiter.release(200, 0.01)
+    assert limiter.in_flight == 0
+    assert limiter.stats()["requests"] == 1
+
+
+def test_acquire_gives_up_its_place_at_the_deadline():
+    limiter = make_limiter()
+    limiter.acquire("a")
+
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire("b", deadline=time.monotonic() + 0.05)
+
+    stats = limiter.stats()
+    assert stats["expired"] == 1
+    assert stats["queued"] == 0
+    assert stats["waiting_owners"] == 0
+    assert limiter.in_flight == 1
+
+    limiter.release(200, 0.01)
+    limiter.acquire("b", deadline=time.monotonic() + 1)
+    assert limiter.in_flight == 1
+
+
+def test_throttled_release_halves_limits_and_pauses():
+    limiter = make_limiter(max_concurrency=8)
+    rate, concurrency = limiter.rate, limiter.concurrency
+    limiter.acquire()
+    limiter.release(429, 0.01, retry_after=5)
+
+    stats = limiter.stats()
+    assert stats["throttled"] == 1
+    assert limiter.rate == rate / 2
+    assert limiter.concurrency == concurrency / 2
+    assert stats["paused_s"] > 4
+
+
+def test_rate_limiter_only_limits_configured_endpoints():
+    limiter = RateLimiter({"generateSalesStrategy": EndpointLimit(rate=1.0)})
+    assert limiter.get("generateSalesStrategy").name == "generateSalesStrategy"
+    assert limiter.get("documents/list") is None
+
+def run_calls(limiter, count, latency, status=200, sample=True):
+    for _ in range(count):
+        limiter.acquire()
+        limiter.release(status, latency, sample=sample)
+
+
+def test_fast_errors_and_fallbacks_do_not_set_the_latency_baseline():
+    limiter = make_limiter(max_concurrency=8)
+    run_calls(limiter, 5, 0.01, status=404)
+    run_calls(limiter, 5, 0.01, sample=False)
+    run_calls(limiter, 40, 1.0)
+
+    assert limiter.slowed == 0
+    assert int(limiter.concurrency) == 8
+
+
+def test_limiter_recovers_after_a_slow_spell():
+    limiter = make_limiter(max_concurrency=8)
+    run_calls(limiter, 40, 1.0)
+    assert int(limiter.concurrency) == 8
+
+    run_calls(limiter, 10, 5.0)
+    assert limiter.slowed > 0
+    assert limiter.concurrency < 8
+
+    run_calls(limiter, 60, 1.0)
+    assert int(limiter.concurrency) == 8
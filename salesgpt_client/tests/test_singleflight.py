@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+
+from salesgpt_client.deadline import current_deadline
+from salesgpt_client.errors import DeadlineExceeded
+from salesgpt_client.singleflight import SingleFlight, request_key
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_concurrent_callers_share_one_call():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(group.do("key", fn))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: group.shared == 4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("result", False)] + [("result", True)] * 4
+    assert group.in_flight == 0
+
+
+def test_error_reaches_every_waiting_caller():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ValueError("backend down")
+
+    errors = []
+
+    def call():
+        try:
+            group.do("key", fn)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: group.shared == 3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["backend down"] * 4
+    stats = group.stats()
+    assert (stats["executed"], stats["shared"], stats["in_flight"]) == (1, 3, 0)
+
+
+def test_key_is_free_again_once_the_call_returns():
+    group = SingleFlight()
+
+    def fail():
+        raise ValueError("first")
+
+    with pytest.raises(ValueError):
+        group.do("key", fail)
+    assert group.do("key", lambda: "second") == ("second", False)
+    assert group.executed == 2
+
+
+def test_request_key_ignores_case_and_whitespace():
+    assert request_key("post", "/query/", {"q": "  Sales  Process "}) == request_key("POST", "query", {"q": "sales process"})
+    assert request_key("POST", "query", {"q": "a"}) != request_key("POST", "query", {"q": "b"})
+
+
+def test_follower_gives_up_at_its_own_deadline():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        return "result"
+
+    leader = threading.Thread(target=lambda: group.do("key", fn))
+    leader.start()
+    wait_for(lambda: group.in_flight == 1)
+    token = current_deadline.set(time.monotonic() + 0.05)
+    try:
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            group.do("key", fn)
+        assert time.monotonic() - started < 1
+    finally:
+        current_deadline.reset(token)
+        release.set()
+        leader.join(5)
+
+
+def test_follower_retries_when_the_leader_ran_out_of_time():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def leader_fn():
+        release.wait(5)
+        raise DeadlineExceeded("leader budget spent")
+
+    def follower_fn():
+        calls.append(1)
+        return "result"
+
+    errors = []
+
+    def lead():
+        try:
+            group.do("key", leader_fn)
+        except DeadlineExceeded as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    wait_for(lambda: group.in_flight == 1)
+    follower = []
+    waiting = threading.Thread(target=lambda: follower.append(group.do("key", follower_fn)))
+    waiting.start()
+    wait_for(lambda: group.shared == 1)
+    release.set()
+    leader.join(5)
+    waiting.join(5)
+
+    assert len(errors) == 1
+    assert follower == [("result", False)]
+    assert calls == [1]
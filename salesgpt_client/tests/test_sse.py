@@ -0,0 +1,38 @@
+from salesgpt_client.sse import iter_events
+
+
+def test_events_are_split_on_blank_lines():
+    events = list(iter_events([
+        "event: meta",
+        'data: {"company": "Acme"}',
+        "",
+        "event: token",
+        "data: Hello",
+        "",
+    ]))
+    assert [(event.event, event.data) for event in events] == [("meta", '{"company": "Acme"}'), ("token", "Hello")]
+    assert events[0].json() == {"company": "Acme"}
+
+
+def test_multi_line_data_is_joined_with_newlines():
+    events = list(iter_events(["data: first", "data: second", ""]))
+    assert len(events) == 1
+    assert events[0].event == "message"
+    assert events[0].data == "first\nsecond"
+
+
+def test_comments_and_extra_blank_lines_are_skipped():
+    events = list(iter_events([":keep-alive", "", "", "event: done", "data:{}", ""]))
+    assert [(event.event, event.data) for event in events] == [("done", "{}")]
+
+
+def test_bytes_ids_and_only_one_leading_space_is_dropped():
+    events = list(iter_events([b"id: 7", b"event: token", "data:   indented".encode("utf-8"), b""]))
+    assert events[0].id == "7"
+    assert events[0].data == "  indented"
+
+
+def test_final_event_without_trailing_blank_line_is_kept():
+    events = list(iter_events(["event: done", "data: {}"]))
+    assert [(event.event, event.data) for event in events] == [("done", "{}")]
+    assert list(iter_events([])) == []
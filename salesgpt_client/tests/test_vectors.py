@@ -0,0 +1,79 @@
+import numpy as np
+
+from salesgpt_client.models import DocumentChunk
+from salesgpt_client.vectors import HashingEmbedder, VectorIndex
+
+
+def chunks(prefix, texts):
+    return [DocumentChunk(id=f"{prefix}-{i}", text=text) for i, text in enumerate(texts)]
+
+
+def test_embedder_is_deterministic_and_normalised():
+    embedder = HashingEmbedder(64)
+    first, second = embedder.embed(["pricing objections", "pricing objections"])
+
+    assert np.array_equal(first, second)
+    assert np.isclose(np.linalg.norm(first), 1.0)
+    assert not embedder.embed([""]).any()
+
+
+def test_search_ranks_appended_chunks_by_similarity(tmp_path):
+    index = VectorIndex(str(tmp_path), HashingEmbedder(128))
+    assert index.add(chunks("a", ["pricing objections from procurement", "onboarding checklist"]), "doc-a") == 2
+    assert index.add(chunks("b", ["quarterly pricing review", "travel policy"]), "doc-b", "doc_b") == 2
+    # Chunks already in the index are skipped
+    assert index.add(chunks("a", ["pricing objections from procurement"]), "doc-a") == 0
+
+    result = index.search("pricing objections", 3)
+
+    assert [hit.id for hit in result.hits][:2] == ["a-0", "b-0"]
+    distances = [hit.distance for hit in result.hits]
+    assert distances == sorted(distances)
+    assert result.hits[1].metadata["collectionName"] == "doc_b"
+    assert index.document_ids() == {"doc-a", "doc-b"}
+
+
+def test_limit_is_clamped_to_the_index(tmp_path):
+    index = VectorIndex(str(tmp_path), HashingEmbedder(64))
+    assert index.search("anything", 5).hits == []
+
+    index.add(chunks("a", ["one", "two"]), "doc-a")
+
+    assert len(index.search("one", 10).hits) == 2
+    assert index.search("one", 0).hits == []
+    assert index.search("one", -1).hits == []
+
+
+def test_rows_written_without_a_commit_are_ignored_on_reopen(tmp_path):
+    index = VectorIndex(str(tmp_path), HashingEmbedder(64))
+    index.add(chunks("a", ["committed chunk"]), "doc-a")
+    index.close()
+
+    # A crash after the vectors were written but before SQLite committed the rows
+    matrix = np.memmap(tmp_path / "vectors.f32", dtype=np.float32, mode="r+", shape=(2, 64))
+    matrix[1] = 1.0
+    matrix.flush()
+    del matrix
+
+    index = VectorIndex(str(tmp_path), HashingEmbedder(64))
+    assert len(index) == 1
+    assert [hit.id for hit in index.search("committed chunk", 5).hits] == ["a-0"]
+
+    # The next append reuses the uncommitted row
+    index.add(chunks("b", ["second chunk"]), "doc-b")
+    assert len(index) == 2
+    assert np.allclose(index._matrix[1], HashingEmbedder(64).embed(["second chunk"])[0])
+
+
+def test_changing_the_embedder_resets_the_index(tmp_path):
+    index = VectorIndex(str(tmp_path), HashingEmbedder(64))
+    index.add(chunks("a", ["pricing"]), "doc-a")
+    index.close()
+
+    index = VectorIndex(str(tmp_path), HashingEmbedder(128))
+
+    assert len(index) == 0
+    assert index.document_ids() == set()
+    assert index.stats()["embedder"] == "hashing-crc32-128"
+    index.add(chunks("a", ["pricing"]), "doc-a")
+    assert [hit.id for hit in index.search("pricing", 1).hits] == ["a-0"]
@@ -0,0 +1,151 @@
+"""Pooled, retrying HTTP transport shared by every caller in the process."""
+
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connection pool size per endpoint prefix. Requests are routed to the
+# adapter with the longest matching prefix; "" is the catch-all.
+DEFAULT_POOL_SIZES = {
+    "": 10,
+    "generateSalesStrategy": 8,
+    "documents/": 8,
+    "documents/upload": 4,
+    "documents/generateSalesStrategy": 4,
+    "documents/list": 8,
+    "documents/query": 8,
+    "linkedinProfiles/search": 4,
+    "system/status": 2,
+}
+
+# Only these methods are retried on 5xx/read errors. POSTs to the strategy
+# and upload endpoints are expensive and not safe to replay.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class TransportConfig:
+    """Retry, backoff and pool settings for a Transport."""
+
+    retries: int = int(os.environ.get("SALESGPT_HTTP_RETRIES", 3))
+    backoff_factor: float = float(os.environ.get("SALESGPT_HTTP_BACKOFF", 0.3))
+    status_forcelist: tuple = (429, 502, 503, 504)
+    pool_sizes: dict = field(default_factory=lambda: dict(DEFAULT_POOL_SIZES))
+    pool_block: bool = False
+
+    def build_retry(self):
+        return Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter that records request and retry counts for one prefix."""
+
+    def __init__(self, prefix, pool_size, max_retries, pool_block=False):
+        self.prefix = prefix
+        self.pool_size = pool_size
+        self.requests_sent = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+        super().__init__(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        retry_state = getattr(response.raw, "retries", None)
+        with self._lock:
+            self.requests_sent += 1
+            if retry_state is not None:
+                self.retries += len(retry_state.history)
+        return response
+
+    def pool_counters(self):
+        """Return (new_connections, requests) summed over live pools."""
+        new_connections = 0
+        requests_made = 0
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            try:
+                pool = pools[key]
+            except KeyError:
+                continue
+            new_connections += pool.num_connections
+            requests_made += pool.num_requests
+        return new_connections, requests_made
+
+
+class Transport:
+    """A process-wide requests.Session with per-endpoint connection pools.
+
+    One Transport is created per backend base URL and shared across
+    Streamlit sessions, so repeated reruns reuse keep-alive connections
+    instead of opening a new TCP connection for every widget interaction.
+    """
+
+    def __init__(self, base_url, config=None):
+        self.base_url = base_url.rstrip("/")
+        self.config = config or TransportConfig()
+        self.session = requests.Session()
+        self._adapters = {}
+
+        retry = self.config.build_retry()
+        for prefix, size in self.config.pool_sizes.items():
+            adapter = _CountingAdapter(prefix, size, retry, self.config.pool_block)
+            self.session.mount(f"{self.base_url}/{prefix}", adapter)
+            self._adapters[prefix] = adapter
+
+    def url(self, endpoint):
+        return f"{self.base_url}/{endpoint}"
+
+    def request(self, method, endpoint, **kwargs):
+        return self.session.request(method, self.url(endpoint), **kwargs)
+
+    def get(self, endpoint, **kwargs):
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request("POST", endpoint, **kwargs)
+
+    def stats(self):
+        """Connection reuse counters, one row per endpoint prefix."""
+        rows = []
+        for prefix, adapter in sorted(self._adapters.items()):
+            new_connections, pool_requests = adapter.pool_counters()
+            rows.append({
+                "endpoint": prefix or "*",
+                "pool_size": adapter.pool_size,
+                "requests": adapter.requests_sent,
+                "retries": adapter.retries,
+                "new_connections": new_connections,
+                "reused_connections": max(pool_requests - new_connections, 0),
+            })
+        return rows
+
+    def totals(self):
+        totals = defaultdict(int)
+        for row in self.stats():
+            for key in ("requests", "retries", "new_connections", "reused_connections"):
+                totals[key] += row[key]
+        return dict(totals)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,132 @@
+"""Streaming multipart uploads with byte-level progress.
+
+The body is produced on the fly from the source file in fixed-size
+chunks and sent with chunked transfer encoding, so only one chunk is
+held in memory at a time no matter how large the file is.
+"""
+
+import binascii
+import os
+import time
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _quote(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _file_size(file):
+    """Remaining bytes in ``file`` from its current position, or None."""
+    try:
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class MultipartStream:
+    """Iterable multipart/form-data body for a single file field.
+
+    Iterating yields the part header, then the file in ``chunk_size``
+    reads, then the closing boundary. ``callback(sent, total)`` is called
+    after each chunk; ``total`` is None when the file size is unknown.
+    """
+
+    def __init__(self, file, filename, content_type=None, field_name="document",
+                 chunk_size=DEFAULT_CHUNK_SIZE, callback=None, boundary=None):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.callback = callback
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode("ascii")
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field_name)}"; filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+        file_size = _file_size(file)
+        self.total = None if file_size is None else len(self._head) + file_size + len(self._tail)
+        self.sent = 0
+
+    def _emit(self, chunk):
+        self.sent += len(chunk)
+        if self.callback is not None:
+            self.callback(self.sent, self.total)
+        return chunk
+
+    def __iter__(self):
+        yield self._emit(self._head)
+        while True:
+            chunk = self.file.read(self.chunk_size)
+            if not chunk:
+                break
+            yield self._emit(chunk)
+        yield self._emit(self._tail)
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unavailable."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is a lifetime peak (KB on Linux, bytes on macOS); better than nothing
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class UploadMeter:
+    """Progress callback that also tracks throughput and peak RSS.
+
+    Wraps an optional ``callback(sent, total)`` and samples process RSS
+    every ``sample_every`` calls.
+    """
+
+    def __init__(self, callback=None, sample_every=8):
+        self.callback = callback
+        self.sample_every = sample_every
+        self.started = time.perf_counter()
+        self.finished = None
+        self.bytes_sent = 0
+        self.baseline_rss = current_rss()
+        self.peak_rss = self.baseline_rss
+        self._calls = 0
+
+    def __call__(self, sent, total):
+        self.bytes_sent = sent
+        self._calls += 1
+        if self._calls % self.sample_every == 0 or (total and sent >= total):
+            rss = current_rss()
+            if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+                self.peak_rss = rss
+        if total and sent >= total:
+            self.finished = time.perf_counter()
+        if self.callback is not None:
+            self.callback(sent, total)
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self):
+        """Bytes per second while sending the body."""
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def peak_rss_delta(self):
+        if self.peak_rss is None or self.baseline_rss is None:
+            return None
+        return self.peak_rss - self.baseline_rss
@@ -0,0 +1,314 @@
+"""In-process vector search over document chunks.
+
+Chunk embeddings live in one memory-mapped float32 matrix on disk, with
+chunk text and metadata in a SQLite file next to it. A query is a single
+matrix-vector product over every row followed by a partial sort, so the
+cost is one pass over the matrix regardless of how many documents the
+chunks came from. New documents are appended without touching existing
+rows.
+
+HashingEmbedder is a deterministic, dependency-free stand-in for a real
+embedding model: it lets the index run and be benchmarked offline, and
+ranks chunks by shared words rather than meaning.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from .models import QueryResult
+
+
+DEFAULT_DIM = 256
+MIN_CAPACITY = 1024
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedder:
+    """Signed feature hashing of word unigrams and bigrams, L2-normalised."""
+
+    def __init__(self, dim=DEFAULT_DIM):
+        self.dim = dim
+        self.name = f"hashing-crc32-{dim}"
+
+    def tokens(self, text):
+        words = _TOKEN_RE.findall((text or "").casefold())
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def embed(self, texts):
+        """Embed a list of texts into an (n, dim) float32 matrix."""
+        hashes, counts = [], []
+        for text in texts:
+            tokens = self.tokens(text)
+            # crc32 is stable across processes, unlike hash()
+            hashes.extend([zlib.crc32(token.encode("utf-8")) for token in tokens])
+            counts.append(len(tokens))
+
+        hashes = np.asarray(hashes, dtype=np.uint32)
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), counts)
+        cols = (hashes % self.dim).astype(np.int64)
+        signs = np.where(hashes >> 31, 1.0, -1.0)
+        flat = np.bincount(rows * self.dim + cols, weights=signs, minlength=len(texts) * self.dim)
+
+        vectors = flat.reshape(len(texts), self.dim).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class VectorIndex:
+    """Append-only chunk index stored in ``path`` (a directory).
+
+    Row ``i`` of ``vectors.f32`` belongs to row ``i`` of the ``chunks``
+    table. The file grows by doubling, so appends are amortised O(1) and
+    rows past the committed count are ignored after a crash.
+    """
+
+    def __init__(self, path, embedder=None):
+        self.path = path
+        self.embedder = embedder or HashingEmbedder()
+        self.dim = self.embedder.dim
+        self._lock = threading.Lock()
+        self._matrix = None
+
+        os.makedirs(path, exist_ok=True)
+        self._vectors_path = os.path.join(path, "vectors.f32")
+        self._conn = sqlite3.connect(os.path.join(path, "chunks.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS chunks (
+                row INTEGER PRIMARY KEY,
+                chunk_id TEXT UNIQUE NOT NULL,
+                document_id TEXT NOT NULL,
+                collection_name TEXT,
+                text TEXT NOT NULL,
+                metadata TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS chunks_document ON chunks (document_id)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+
+        stored = self._conn.execute("SELECT value FROM info WHERE key = 'embedder'").fetchone()
+        if stored is not None and stored[0] != self.embedder.name:
+            # Vectors from a different embedder are not comparable; start over
+            self._reset()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO info (key, value) VALUES ('embedder', ?)", (self.embedder.name,)
+        )
+        self._conn.commit()
+
+        self._count = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+        if os.path.exists(self._vectors_path):
+            self._open(os.path.getsize(self._vectors_path) // (4 * self.dim))
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return 0 if self._matrix is None else self._matrix.shape[0]
+
+    def _open(self, capacity):
+        mode = "r+" if os.path.exists(self._vectors_path) else "w+"
+        if mode == "r+" and os.path.getsize(self._vectors_path) < capacity * 4 * self.dim:
+            with open(self._vectors_path, "r+b") as fh:
+                fh.truncate(capacity * 4 * self.dim)
+        self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode=mode,
+                                 shape=(capacity, self.dim)) if capacity else None
+
+    def _ensure_capacity(self, rows):
+        if rows <= self.capacity:
+            return
+        capacity = max(self.capacity, MIN_CAPACITY)
+        while capacity < rows:
+            capacity *= 2
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+        self._open(capacity)
+
+    def _reset(self):
+        self._matrix = None
+        if os.path.exists(self._vectors_path):
+            os.remove(self._vectors_path)
+        self._conn.execute("DELETE FROM chunks")
+        self._conn.commit()
+        self._count = 0
+
+    def clear(self):
+        """Drop every chunk. The index is shared, so this affects every user of it."""
+        with self._lock:
+            self._reset()
+
+    def document_ids(self):
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT DISTINCT document_id FROM chunks")}
+
+    def add(self, chunks, document_id, collection_name=None):
+        """Append DocumentChunk objects for one document. Returns rows added."""
+        with self._lock:
+            known = {
+                row[0] for row in self._conn.execute(
+                    "SELECT chunk_id FROM chunks WHERE document_id = ?", (document_id,)
+                )
+            }
+            fresh = [c for c in chunks if c.id not in known]
+            if not fresh:
+                return 0
+
+            vectors = self.embedder.embed([c.text for c in fresh])
+            start = self._count
+            self._ensure_capacity(start + len(fresh))
+            self._matrix[start:start + len(fresh)] = vectors
+            self._matrix.flush()
+
+            # Rows only become visible once the SQLite transaction commits
+            self._conn.executemany(
+                "INSERT INTO chunks (row, chunk_id, document_id, collection_name, text, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (start + i, c.id, document_id, collection_name, c.text, json.dumps(c.metadata))
+                    for i, c in enumerate(fresh)
+                ],
+            )
+            self._conn.commit()
+            self._count = start + len(fresh)
+            return len(fresh)
+
+    def index_document(self, client, document_id, collection_name=None):
+        """Fetch a document's chunks from the API and append them."""
+        chunks = list(client.iter_document_chunks(document_id, collection_name))
+        return self.add(chunks, document_id, collection_name)
+
+    def sync(self, client, documents):
+        """Index every processed Document not yet in the index. Returns rows added."""
+        indexed = self.document_ids()
+        added = 0
+        for doc in documents:
+            if doc.processed and doc.document_id and doc.document_id not in indexed:
+                added += self.index_document(client, doc.document_id, doc.collection_name)
+        return added
+
+    def search(self, query, limit=5):
+        """Top ``limit`` chunks by cosine similarity, as a QueryResult.
+
+        The result uses the same layout as documents/query; distances are
+        ``1 - cosine`` so lower is better, as with Chroma.
+        """
+        if limit <= 0:
+            return _empty_result()
+        query_vector = self.embedder.embed([query])[0]
+        with self._lock:
+            count = self._count
+            matrix = self._matrix
+            if not count or matrix is None:
+                return _empty_result()
+
+            scores = matrix[:count] @ query_vector
+            k = min(limit, count)
+            top = np.argpartition(scores, count - k)[count - k:]
+            top = top[np.argsort(-scores[top])]
+
+            placeholders = ",".join("?" * len(top))
+            rows = {
+                row: (chunk_id, collection_name, text, metadata)
+                for row, chunk_id, collection_name, text, metadata in self._conn.execute(
+                    "SELECT row, chunk_id, collection_name, text, metadata FROM chunks "
+                    f"WHERE row IN ({placeholders})",
+                    [int(r) for r in top],
+                )
+            }
+
+        ids, documents, metadatas, distances = [], [], [], []
+        for row in top:
+            chunk_id, collection_name, text, metadata = rows[int(row)]
+            metadata = json.loads(metadata)
+            metadata.setdefault("collectionName", collection_name)
+            ids.append(chunk_id)
+            documents.append(text)
+            metadatas.append(metadata)
+            distances.append(float(1.0 - scores[row]))
+        return QueryResult.from_json({
+            "results": {
+                "ids": [ids],
+                "documents": [documents],
+                "metadatas": [metadatas],
+                "distances": [distances],
+            }
+        })
+
+    def stats(self):
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(DISTINCT document_id) FROM chunks").fetchone()[0]
+        return {
+            "chunks": self._count,
+            "documents": documents,
+            "capacity": self.capacity,
+            "dim": self.dim,
+            "matrix_bytes": self.capacity * self.dim * 4,
+            "embedder": self.embedder.name,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._matrix is not None:
+                self._matrix.flush()
+                self._matrix = None
+            self._conn.close()
+
+
+def _empty_result():
+    return QueryResult.from_json({
+        "results": {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+    })
+
+
+def benchmark(chunks=100_000, queries=50, dim=DEFAULT_DIM, path=None, seed=0):
+    """Build a synthetic index of ``chunks`` rows and time searches.
+
+    Returns a dict with build and per-query timings in seconds.
+    """
+    import tempfile
+
+    from .models import DocumentChunk
+
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"term{i}" for i in range(20_000)]
+    path = path or tempfile.mkdtemp(prefix="salesgpt-vectors-")
+    index = VectorIndex(path, HashingEmbedder(dim))
+
+    started = time.perf_counter()
+    batch = 5_000
+    for start in range(0, chunks, batch):
+        words = rng.choice(vocabulary, size=(min(batch, chunks - start), 150))
+        index.add(
+            [DocumentChunk(id=f"c{start + i}", text=" ".join(row)) for i, row in enumerate(words)],
+            document_id=f"doc{start // batch}",
+        )
+    build = time.perf_counter() - started
+
+    timings = []
+    for _ in range(queries):
+        text = " ".join(rng.choice(vocabulary, size=8))
+        started = time.perf_counter()
+        index.search(text, 10)
+        timings.append(time.perf_counter() - started)
+    index.close()
+
+    timings.sort()
+    return {
+        "chunks": chunks,
+        "dim": dim,
+        "build_seconds": build,
+        "query_p50": timings[len(timings) // 2],
+        "query_max": timings[-1],
+        "path": path,
+    }
@@ -23,6 +23,31 @@ class AIService {
       return await openaiService.generateContent(prompt);
     }
   }
+
+  /**
+   * Stream content using available AI services with fallback
+   * @param {String} prompt - The prompt to generate content from
+   * @param {Function} onText - Called with each text delta as it arrives
+   * @returns {Promise<String>} - The full generated text
+   */
+  async generateContentStream(prompt, onText) {
+    let emitted = false;
+    const forward = (delta) => {
+      emitted = true;
+      onText(delta);
+    };
+    
+    try {
+      return await geminiService.generateContentStream(prompt, forward);
+    } catch (error) {
+      // Once text has reached the client, switching models would splice two answers together
+      if (emitted) {
+        throw error;
+      }
+      console.log("Gemini streaming failed, falling back to OpenAI:", error.message);
+      return await openaiService.generateContentStream(prompt, forward);
+    }
+  }
 }
 
 module.exports = new AIService();
\ No newline at end of file
@@ -2,6 +2,9 @@ const { ChromaClient } = require('chromadb');
 const openaiService = require('./openaiService');
 const path = require('path');
 
+// Chunks embedded and written per collection.add call
+const ADD_BATCH_SIZE = parseInt(process.env.CHROMA_ADD_BATCH_SIZE, 10) || 64;
+
 class ChromaService {
   constructor() {
     // Initialize ChromaDB client
@@ -52,13 +55,29 @@ class ChromaService {
           // Convert single string to array if needed
           const textArray = Array.isArray(texts) ? texts : [texts];
           
-          // Generate embeddings
+          // Use a safer approach for empty/invalid texts
+          const isValid = (text) => text && typeof text === 'string' && text.length >= 5;
+          const validTexts = textArray.filter(isValid);
+          
+          // One embeddings request for the whole batch
+          let batchEmbeddings = null;
+          if (validTexts.length > 1) {
+            try {
+              batchEmbeddings = await openaiService.generateBatchEmbeddings(validTexts);
+            } catch (err) {
+              console.error('Error generating batch embeddings, embedding texts one at a time:', err);
+            }
+          }
+          
+          let next = 0;
           const embeddings = await Promise.all(
             textArray.map(async (text) => {
-              // Use a safer approach for empty/invalid texts
-              if (!text || typeof text !== 'string' || text.length < 5) {
+              if (!isValid(text)) {
                 return new Array(1536).fill(0); // Return zero vector for empty text
               }
+              if (batchEmbeddings) {
+                return batchEmbeddings[next++];
+              }
               try {
                 return await openaiService.generateEmbedding(text);
               } catch (err) {
@@ -112,6 +131,22 @@ class ChromaService {
     }
   }
 
+  /**
+   * Get an existing collection; never creates one, so it is safe for reads
+   * driven by request input. Throws if the collection does not exist.
+   */
+  async getCollection(collectionName) {
+    try {
+      return await this.client.getCollection({
+        name: collectionName,
+        embeddingFunction: this.createEmbeddingFunction()
+      });
+    } catch (error) {
+      console.error(`Error accessing ChromaDB collection "${collectionName}":`, error);
+      throw error;
+    }
+  }
+
   /**
    * List all collections
    */
@@ -138,10 +173,32 @@ class ChromaService {
     }
   }
 
+  /**
+   * Get the first chunk's metadata and the chunk count without pulling every chunk
+   */
+  async getCollectionSummary(collectionName) {
+    try {
+      const collection = await this.getCollection(collectionName);
+      const [first, count] = await Promise.all([
+        collection.get({ limit: 1, include: ['metadatas'] }),
+        collection.count()
+      ]);
+      
+      return {
+        metadata: first && first.metadatas && first.metadatas.length > 0 ? first.metadatas[0] : null,
+        count
+      };
+    } catch (error) {
+      console.error(`Error getting summary for collection "${collectionName}":`, error);
+      throw error;
+    }
+  }
+
   /**
    * Add document to a specific collection
+   * onProgress(chunksIndexed, totalChunks) is called after each batch of chunks is added
    */
-  async addDocumentToCollection(text, metadata, id, collectionName) {
+  async addDocumentToCollection(text, metadata, id, collectionName, onProgress = null) {
     try {
       // Get or create the collection
       const collection = await this.getOrCreateCollection(collectionName);
@@ -149,22 +206,27 @@ class ChromaService {
       // Split text into chunks if it's too long
       const chunks = this.splitTextIntoChunks(text, 1000);
       
-      // Add each chunk with the same document ID but different chunk IDs
-      for (let i = 0; i < chunks.length; i++) {
-        const chunkId = `${id}-chunk-${i}`;
-        const chunkMetadata = { 
-          ...metadata, 
-          chunkId: chunkId,
-          documentId: id,
-          chunkIndex: i,
-          totalChunks: chunks.length
-        };
+      // Add chunks in batches: one embedding request and one write per batch
+      // instead of per chunk. Every chunk shares the document ID.
+      for (let start = 0; start < chunks.length; start += ADD_BATCH_SIZE) {
+        const batch = chunks.slice(start, start + ADD_BATCH_SIZE);
+        const ids = batch.map((_, offset) => `${id}-chunk-${start + offset}`);
         
         await collection.add({
-          ids: [chunkId],
-          documents: [chunks[i]],
-          metadatas: [chunkMetadata]
+          ids,
+          documents: batch,
+          metadatas: ids.map((chunkId, offset) => ({
+            ...metadata,
+            chunkId: chunkId,
+            documentId: id,
+            chunkIndex: start + offset,
+            totalChunks: chunks.length
+          }))
         });
+        
+        if (onProgress) {
+          onProgress(start + batch.length, chunks.length);
+        }
       }
       
       console.log(`Added document (${chunks.length} chunks) to collection "${collectionName}"`);
@@ -178,7 +240,7 @@ class ChromaService {
   /**
    * Add document with per-document collections
    */
-  async addDocument(text, metadata, id) {
+  async addDocument(text, metadata, id, onProgress = null) {
     try {
       // Create a collection name based on the document name
       const collectionName = this.createCollectionName(
@@ -193,7 +255,7 @@ class ChromaService {
       };
       
       // Add to collection
-      return await this.addDocumentToCollection(text, updatedMetadata, id, collectionName);
+      return await this.addDocumentToCollection(text, updatedMetadata, id, collectionName, onProgress);
     } catch (error) {
       console.error('Error adding document:', error);
       throw error;
@@ -240,6 +302,53 @@ class ChromaService {
     }
   }
 
+  /**
+   * Get a page of a document's chunks in chunk order
+   * Returns { chunks: [{ id, text, chunkIndex, metadata }], total }
+   */
+  async getDocumentChunks(documentId, collectionName, offset = 0, limit = null) {
+    try {
+      const collection = await this.getCollection(collectionName);
+      
+      // get() does not guarantee an order, so pages are selected by chunkIndex
+      // rather than by offset/limit
+      const range = [{ documentId: documentId }, { chunkIndex: { $gte: offset } }];
+      if (limit) {
+        range.push({ chunkIndex: { $lt: offset + limit } });
+      }
+      const [result, total] = await Promise.all([
+        collection.get({
+          where: { $and: range },
+          include: ['documents', 'metadatas']
+        }),
+        collection.count()
+      ]);
+      
+      if (!result || !result.ids || result.ids.length === 0) {
+        // Past the last chunk is an empty page, not a missing document
+        const probe = offset > 0
+          ? await collection.get({ where: { documentId: documentId }, limit: 1, include: [] })
+          : null;
+        if (probe && probe.ids && probe.ids.length > 0) {
+          return { chunks: [], total };
+        }
+        throw new Error(`Document ${documentId} not found in collection ${collectionName}`);
+      }
+      
+      const chunks = result.ids.map((id, index) => ({
+        id,
+        text: result.documents[index],
+        chunkIndex: result.metadatas[index].chunkIndex || 0,
+        metadata: result.metadatas[index]
+      })).sort((a, b) => a.chunkIndex - b.chunkIndex);
+      
+      return { chunks, total };
+    } catch (error) {
+      console.error(`Error getting chunks from collection "${collectionName}":`, error);
+      throw error;
+    }
+  }
+
   /**
    * Query a specific collection
    */
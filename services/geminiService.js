@@ -33,6 +33,33 @@ class GeminiService {
       throw error;
     }
   }
+
+  /**
+   * Stream content from Gemini AI as it is generated
+   * @param {String} prompt - The prompt to generate content from
+   * @param {Function} onText - Called with each text delta
+   * @returns {Promise<String>} - The full generated text
+   */
+  async generateContentStream(prompt, onText) {
+    console.log('Streaming content with Gemini...');
+    const result = await this.model.generateContentStream({
+      contents: [{ role: "user", parts: [{ text: prompt }] }],
+      generationConfig: {
+        temperature: 0.7,
+        maxOutputTokens: 8192,
+      }
+    });
+    
+    let text = '';
+    for await (const chunk of result.stream) {
+      const delta = chunk.text();
+      if (delta) {
+        text += delta;
+        onText(delta);
+      }
+    }
+    return text;
+  }
 }
 
 module.exports = new GeminiService();
\ No newline at end of file
@@ -76,6 +76,41 @@ class OpenAIService {
       throw error;
     }
   }
+
+  /**
+   * Stream a chat completion as it is generated
+   * @param {String} prompt - The prompt to generate content from
+   * @param {Function} onText - Called with each text delta
+   * @returns {Promise<String>} - The full generated text
+   */
+  async generateContentStream(prompt, onText) {
+    const stream = await this.openai.chat.completions.create({
+      model: "gpt-4",
+      messages: [
+        {
+          role: "system",
+          content: "You are an AI assistant that generates detailed sales strategies based on company information."
+        },
+        {
+          role: "user",
+          content: prompt
+        }
+      ],
+      temperature: 0.7,
+      max_tokens: 4000,
+      stream: true
+    });
+    
+    let text = '';
+    for await (const part of stream) {
+      const delta = part.choices[0]?.delta?.content;
+      if (delta) {
+        text += delta;
+        onText(delta);
+      }
+    }
+    return text;
+  }
 }
 
 module.exports = new OpenAIService();
\ No newline at end of file
@@ -0,0 +1,65 @@
+/**
+ * In-memory tracker for background document processing.
+ *
+ * uploadDocument responds with 202 before chunks are embedded and indexed,
+ * so clients poll GET /documents/:documentId/status to follow progress.
+ */
+class ProcessingStatusService {
+  constructor(maxEntries = 1000) {
+    this.maxEntries = maxEntries;
+    this.statuses = new Map();
+  }
+
+  /**
+   * Create or update the status record for a document
+   * @param {String} documentId - Document identifier
+   * @param {Object} update - Fields to merge (stage, chunksIndexed, totalChunks, error)
+   * @returns {Object} - The updated status record
+   */
+  update(documentId, update) {
+    const previous = this.statuses.get(documentId) || {
+      documentId,
+      stage: 'queued',
+      chunksIndexed: 0,
+      totalChunks: null,
+      startedAt: new Date().toISOString()
+    };
+
+    const status = {
+      ...previous,
+      ...update,
+      updatedAt: new Date().toISOString()
+    };
+
+    // Re-insert so Map iteration order tracks recency
+    this.statuses.delete(documentId);
+    this.statuses.set(documentId, status);
+
+    // Drop the oldest records once we hold too many
+    while (this.statuses.size > this.maxEntries) {
+      const oldest = this.statuses.keys().next().value;
+      this.statuses.delete(oldest);
+    }
+
+    return status;
+  }
+
+  /**
+   * Get the status record for a document
+   * @param {String} documentId - Document identifier
+   * @returns {Object|null} - Status record or null if unknown
+   */
+  get(documentId) {
+    return this.statuses.get(documentId) || null;
+  }
+
+  /**
+   * List all tracked status records, oldest first
+   * @returns {Array<Object>} - Status records
+   */
+  list() {
+    return Array.from(this.statuses.values());
+  }
+}
+
+module.exports = new ProcessingStatusService();
@@ -0,0 +1 @@
+"""Pages of the Streamlit client (app.py) and the resources they share."""
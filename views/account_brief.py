@@ -0,0 +1,179 @@
+"""Account Brief page: strategy, document insights and contacts fetched in parallel."""
+
+import time
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from salesgpt_client import brief, history
+from salesgpt_client.bulk import CACHED, DONE, FAILED, BulkRow, strategy_fetcher
+from salesgpt_client.cache import query_cache_key
+from views.shared import (
+    FREED_TEXT, HISTORY_RENDERERS, base_url, get_client, get_history_store, get_query_cache, get_strategy_cache,
+    session_payload, store_session_payload, strategy_summary
+)
+
+BASE_URL = base_url()
+strategy_cache = get_strategy_cache()
+history_store = get_history_store()
+
+# Payload store key of the latest brief
+BRIEF_RESULT = ("brief", "latest")
+
+# Brief sections share the renderers and history kinds of their original pages
+BRIEF_HISTORY_KINDS = {
+    brief.STRATEGY: history.STRATEGY,
+    brief.INSIGHTS: history.QUERY,
+    brief.DOCUMENT_STRATEGY: history.DOCUMENT_STRATEGY,
+    brief.CONTACTS: history.LINKEDIN_SEARCH,
+}
+
+# Fill one Account Brief section: status line, then the result or the error
+def render_brief_section(section, status_slot, body):
+    if section.status == FAILED:
+        status_slot.error(f"{section.label} failed after {section.elapsed:.1f}s: {section.error}")
+        return
+    source = "from cache" if section.status == CACHED else f"in {section.elapsed:.1f}s"
+    status_slot.caption(f"{section.status_label} {source} (started at +{section.started:.2f}s)")
+    with body:
+        HISTORY_RENDERERS[BRIEF_HISTORY_KINDS[section.key]](section.result, key=f"brief_{section.key}")
+
+st.title("Account Brief")
+st.write("Sales strategy, document insights and LinkedIn contacts for one company, fetched at the same time")
+
+col1, col2 = st.columns(2)
+with col1:
+    brief_company = st.text_input("Company Name", "Google", key="brief_company")
+    brief_position = st.text_input("Contact position", "VP Sales", key="brief_position")
+with col2:
+    brief_location = st.text_input("Location (optional)", "United States", key="brief_location")
+    brief_document = st.text_input("Document ID (optional, adds a document-based strategy)", key="brief_document")
+brief_query = st.text_input(
+    "Document insights query",
+    key="brief_query",
+    placeholder=f"{brief_company} challenges and priorities",
+)
+
+with st.expander("Advanced Options"):
+    brief_deadline = st.slider("Give up on a section after (seconds)", 10, 300, 120, key="brief_deadline")
+    brief_use_cache = st.checkbox("Use cached strategy and query results", value=True, key="brief_use_cache")
+
+if st.button("Build Brief") and brief_company:
+    client = get_client(BASE_URL)
+    query_text = brief_query or f"{brief_company} challenges and priorities"
+    query_cache = get_query_cache(BASE_URL)
+    fetch_strategy = strategy_fetcher(
+        client, strategy_cache, timeout=brief_deadline, force_refresh=not brief_use_cache
+    )
+    
+    def fetch_insights():
+        key = query_cache_key(query_text, 5)
+        cached = query_cache.get(key) if brief_use_cache else None
+        if cached is not None:
+            return cached.value, True
+        result = client.query_documents(query_text, 5).raw
+        query_cache.put(key, result)
+        return result, False
+    
+    sections = [
+        brief.BriefSection(brief.STRATEGY, lambda: fetch_strategy(BulkRow(0, brief_company, brief_location))),
+        brief.BriefSection(brief.INSIGHTS, fetch_insights),
+        brief.BriefSection(brief.CONTACTS, lambda: (client.search_linkedin_profiles(
+            brief_company, brief_position, brief_location, 5).raw, False)),
+    ]
+    if brief_document:
+        sections.insert(2, brief.BriefSection(brief.DOCUMENT_STRATEGY, lambda: (client.generate_document_strategy(
+            brief_document.strip(), brief_company, timeout=brief_deadline).raw, False)))
+    store_session_payload(BRIEF_RESULT, {
+        "sections": sections,
+        "params": {
+            "companyName": brief_company,
+            "location": brief_location,
+            "position": brief_position,
+            "query": query_text,
+            "documentId": brief_document or None,
+        },
+        "started": time.perf_counter(),
+        "deadline": brief_deadline,
+        "wall": None,
+    })
+    st.session_state["brief_result"] = BRIEF_RESULT
+
+state = session_payload(BRIEF_RESULT)
+if state is None and st.session_state.get("brief_result"):
+    st.info(FREED_TEXT)
+if state:
+    sections = state["sections"]
+    params = state["params"]
+    summary_slot = st.empty()
+    
+    # One fixed slot per section, filled in whatever order the calls finish
+    slots = {}
+    for section in sections:
+        st.subheader(section.label)
+        slots[section.key] = (st.empty(), st.container())
+    
+    if state["wall"] is None:
+        # A rerun while the brief is running picks up the sections already started
+        started = state["started"]
+        done_count = 0
+        for section in sections:
+            if section.reported:
+                done_count += 1
+                render_brief_section(section, *slots[section.key])
+            else:
+                slots[section.key][0].info("⏳ Waiting for response...")
+        for section in brief.run_brief(sections, deadline=state["deadline"], origin=started):
+            elapsed = time.perf_counter() - started
+            if section is None:
+                summary_slot.caption(f"{done_count}/{len(sections)} sections ready · {elapsed:.1f}s")
+                continue
+            done_count += 1
+            summary_slot.caption(f"{done_count}/{len(sections)} sections ready · {elapsed:.1f}s")
+            render_brief_section(section, *slots[section.key])
+            if section.status == DONE:
+                history_store.record(
+                    BRIEF_HISTORY_KINDS[section.key],
+                    dict(params, brief=True),
+                    section.result,
+                    elapsed=section.elapsed,
+                    company=params["companyName"],
+                    document_id=params["documentId"] if section.key == brief.DOCUMENT_STRATEGY else None,
+                    summary=(strategy_summary(section.result) if section.key == brief.STRATEGY
+                             else f"Account brief: {section.label}"),
+                )
+        state["wall"] = time.perf_counter() - started
+        # Measured again now that the sections hold their results
+        store_session_payload(BRIEF_RESULT, state)
+    else:
+        # Results survive reruns; nothing is fetched again
+        for section in sections:
+            render_brief_section(section, *slots[section.key])
+    
+    # Critical path: the brief takes as long as its slowest section
+    timing = brief.brief_timing(sections, state["wall"])
+    with summary_slot.container():
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("End to end", f"{timing.wall:.1f}s")
+        col2.metric("Sum of calls", f"{timing.total:.1f}s")
+        col3.metric("Saved by running in parallel", f"{timing.saved:.1f}s")
+        col4.metric("Critical path", brief.SECTION_LABELS.get(timing.critical, "-"))
+        timing_df = pd.DataFrame([
+            {
+                "Section": section.label,
+                "Start (s)": section.started or 0.0,
+                "End (s)": (section.started or 0.0) + (section.elapsed or 0.0),
+                "Status": section.status,
+            }
+            for section in sections
+        ])
+        st.altair_chart(
+            alt.Chart(timing_df).mark_bar().encode(
+                x=alt.X("Start (s):Q", title="Seconds since the brief started"),
+                x2="End (s):Q",
+                y=alt.Y("Section:N", sort=None, title=None),
+                color="Status:N",
+            ).properties(height=40 * len(sections)),
+            width="stretch",
+        )
@@ -0,0 +1,747 @@
+"""Document Management page: upload, browse, query and build strategies from documents."""
+
+import time
+
+import pandas as pd
+import requests
+import streamlit as st
+
+from salesgpt_client import APIError, ChunkPage, Document, StreamError, history, ingest
+from salesgpt_client.cache import query_cache_key
+from salesgpt_client.library import SORT_OPTIONS, DocumentLibrary
+from salesgpt_client.memory import payload_size
+from salesgpt_client.profiler import section
+from salesgpt_client.upload import UploadMeter
+from views.shared import (
+    JOB_SESSION_KEYS, api_call, base_url, format_age, get_client, get_health_monitor, get_history_store,
+    get_ingest_journal, get_job_manager, get_payload_store, get_query_cache, get_vector_index, health_caption,
+    render_document_strategy, render_job, render_query_results, render_raw_json, session_payload,
+    store_session_payload
+)
+
+BASE_URL = base_url()
+history_store = get_history_store()
+
+# Payload store key of the latest bulk ingest run
+INGEST_RESULT = ("bulk", "ingest")
+
+# documents/{id} metadata for the library, or None if it could not be fetched
+def fetch_document_details(document_id):
+    doc_response = api_call(f"documents/{document_id}", method="GET")
+    if doc_response and doc_response.status_code == 200:
+        return doc_response.json()
+    return None
+
+# One range of a document's chunks as documents/{id}/chunks returned it, or None on error
+def fetch_document_chunks(document, offset, limit):
+    try:
+        return get_client(BASE_URL).document_chunks(document.document_id, document.collection_name, offset, limit).raw
+    except (APIError, requests.exceptions.RequestException) as e:
+        st.error(f"Error: Failed to fetch the document text. {e}")
+        return None
+
+# Page through a document's text; each page is one ranged chunks call, kept under the
+# session's memory budget, so a long document is never transferred whole
+def render_document_text(document):
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Chunks per page", [5, 10, 25, 50], index=1, key="document_text_page_size")
+    page_count = max(((document.chunk_count or 0) + page_size - 1) // page_size, 1)
+    with col2:
+        text_page = st.number_input(
+            f"Text page (of {page_count})", min_value=1, max_value=page_count, value=1,
+            key=f"document_text_page_{document.document_id}_{page_size}",
+        )
+    offset = (text_page - 1) * page_size
+    payload = session_payload(
+        ("chunks", document.document_id, offset, page_size),
+        lambda: fetch_document_chunks(document, offset, page_size),
+    )
+    if payload is None:
+        return
+    
+    chunk_page = ChunkPage.from_json(payload)
+    if not chunk_page.chunks:
+        st.info("No text in this range.")
+        return
+    text = "".join(chunk.text for chunk in chunk_page.chunks)
+    first, last = chunk_page.chunks[0].chunk_index, chunk_page.chunks[-1].chunk_index
+    st.caption(f"Chunks {first + 1}-{last + 1} of {chunk_page.total}, {len(text):,} characters")
+    with st.container(height=400):
+        st.text(text)
+    st.download_button(
+        "Download this range",
+        text,
+        file_name=f"{document.document_id}_chunks_{first + 1}-{last + 1}.txt",
+        mime="text/plain",
+        key="document_text_download",
+        on_click="ignore",
+    )
+
+DOC_STRATEGY_JOB = JOB_SESSION_KEYS[history.DOCUMENT_STRATEGY]
+
+# Job body for one document-based strategy. When streaming, the text is kept in job.partial
+# as it is written so the page can show it; if the stream breaks the blocking call is used
+# instead. Runs in a worker thread, so no st.* calls.
+def generate_document_strategy(client, payload, timeout, stream):
+    document_id, company_name = payload["documentId"], payload["companyName"]
+    
+    def run(job):
+        started = time.perf_counter()
+        result = None
+        if stream:
+            events = client.stream_document_strategy(document_id, company_name, timeout=timeout)
+            try:
+                for kind, value in events:
+                    # Stops reading (and closes the stream) once cancelled or out of time
+                    job.check()
+                    if kind == "token":
+                        if job.first_output is None:
+                            job.first_output = time.perf_counter() - started
+                        job.partial += value
+                    elif kind == "done":
+                        result = value.raw
+            except APIError as e:
+                if e.status_code < 500:
+                    # Asking again without streaming would get the same answer
+                    raise
+                job.note = f"Streaming failed ({e}); the strategy was generated without streaming instead."
+            except (StreamError, requests.exceptions.RequestException) as e:
+                job.note = f"Streaming was interrupted ({e}); the strategy was generated without streaming instead."
+            finally:
+                events.close()
+        if result is None:
+            job.first_output = None
+            job.partial = ""
+            result = client.generate_document_strategy(document_id, company_name, timeout=timeout).raw
+        if job.cancelled:
+            return None
+        history_store.record(
+            history.DOCUMENT_STRATEGY,
+            payload,
+            result,
+            elapsed=time.perf_counter() - started,
+            company=company_name,
+            document_id=document_id,
+            summary=(result.get("salesStrategy") or "")[:120],
+        )
+        return result
+    return run
+
+st.title("Document Management")
+
+# Create tabs for different document operations
+tabs = st.tabs(["Upload Document", "Document Library", "Query Documents", "Generate Strategy"])
+
+# Tab 1: Upload Document
+with tabs[0], section("Upload Document"):
+    st.subheader("Upload Document")
+    
+    # Show API connection status
+    server_url = BASE_URL
+    st.caption(f"📡 Connected to server: {server_url}")
+    health = get_health_monitor(BASE_URL).snapshot()
+    if health.online:
+        st.success(f"✅ Server is online ({health_caption(health)})")
+    elif health.checked_at is None:
+        st.info("⏳ Checking server status...")
+    else:
+        st.error(f"❌ Server is offline or unreachable at {server_url} ({health_caption(health)})")
+        st.info("Check if your backend server is running and accessible")
+    
+    uploaded_file = st.file_uploader("Choose a PDF or DOCX file", type=["pdf", "docx"], key="doc_upload")
+    skip_duplicates = st.checkbox(
+        "Skip documents that were already uploaded",
+        value=True,
+        key="doc_skip_duplicates",
+        help="Files are fingerprinted with SHA-256 and checked against the local manifest and the server first. "
+             "The server also links files whose extracted text matches an existing document."
+    )
+    saved = get_ingest_journal().savings()
+    if saved["files"]:
+        st.caption(
+            f"Duplicates skipped so far: {saved['files']} files, "
+            f"{saved['bytes'] / 1024 / 1024:.1f} MB not uploaded, {saved['embeddings']} chunk embeddings not recomputed"
+        )
+    
+    if uploaded_file is not None:
+        file_info = {
+            "Filename": uploaded_file.name,
+            "Size": f"{uploaded_file.size / 1024:.2f} KB",
+            "Type": uploaded_file.type
+        }
+        st.write("File information:", file_info)
+        
+        if st.button("Upload Document"):
+            client = get_client(BASE_URL)
+            journal = get_ingest_journal()
+            upload_item = ingest.IngestItem(
+                name=uploaded_file.name,
+                size=uploaded_file.size,
+                open=lambda: ingest.open_buffer(uploaded_file)
+            )
+            with upload_item.open() as fh:
+                upload_item.content_hash = ingest.content_hash(fh)
+            
+            # Identical bytes already ingested from here or known to the server: link, don't upload
+            try:
+                duplicate = skip_duplicates and ingest.find_existing(client, upload_item, journal)
+            except (APIError, requests.exceptions.RequestException):
+                duplicate = False  # the server still links duplicates when they are uploaded
+            if duplicate:
+                journal.add_savings(upload_item)
+                where = "uploaded before" if upload_item.status == ingest.RESUMED else "already on the server"
+                st.info(
+                    f"This file was {where}, so it was not uploaded again "
+                    f"({upload_item.size / 1024:.0f} KB and {upload_item.chunks or 0} chunk embeddings saved)."
+                )
+                st.write(f"Collection: `{upload_item.collection_name}`")
+                st.code(upload_item.document_id, language="text")
+                st.info("👆 Copy this Document ID to use for queries and strategy generation")
+            else:
+                # Create progress container
+                progress_container = st.container()
+                
+                with progress_container:
+                    # Create columns for status indicators
+                    col1, col2, col3 = st.columns(3)
+                    
+                    # Initialize progress indicators
+                    with col1:
+                        upload_status = st.empty()
+                    with col2:
+                        vectorize_status = st.empty()
+                    with col3:
+                        index_status = st.empty()
+                    
+                    # Set initial status
+                    upload_status.markdown("⏳ Uploading document...")
+                    vectorize_status.markdown("⏳ Vectorization pending...")
+                    index_status.markdown("⏳ Indexing pending...")
+                    
+                    # Add progress bar
+                    progress_bar = st.progress(0)
+                    status_text = st.empty()
+                    
+                    # Progress split: 0-50% request bytes sent, 50-60% server-side
+                    # text extraction, 60-100% chunks embedded and indexed
+                    last_percent = [-1]
+                    
+                    def on_bytes_sent(sent, total):
+                        total = total or uploaded_file.size
+                        percent = min(int(50 * sent / total), 50) if total else 50
+                        if percent == last_percent[0]:
+                            return
+                        last_percent[0] = percent
+                        progress_bar.progress(percent)
+                        status_text.text(f"Uploading file... {sent / 1024 / 1024:.1f} of {total / 1024 / 1024:.1f} MB")
+                        if sent >= total:
+                            upload_status.markdown("✅ Upload sent")
+                            vectorize_status.markdown("⏳ Extracting text...")
+                            status_text.text("Extracting text from document on the server...")
+                    
+                    def on_processing_update(status):
+                        percent = 60 + int(40 * status.fraction)
+                        progress_bar.progress(percent)
+                        if status.total_chunks:
+                            vectorize_status.markdown(f"⏳ Embedding chunks ({status.chunks_indexed}/{status.total_chunks})")
+                            index_status.markdown("⏳ Indexing document...")
+                            status_text.text(f"Embedding and indexing {status.chunks_indexed} of {status.total_chunks} chunks... {percent}%")
+                        else:
+                            status_text.text(f"Waiting for the server to start indexing ({status.stage})...")
+                    
+                    upload_meter = UploadMeter(on_bytes_sent)
+                    try:
+                        uploaded_file.seek(0)
+                        upload = client.upload_document(
+                            uploaded_file,
+                            filename=uploaded_file.name,
+                            content_type=uploaded_file.type,
+                            timeout=180,
+                            progress=upload_meter,
+                            allow_duplicate=not skip_duplicates
+                        )
+                    except (APIError, requests.exceptions.RequestException) as e:
+                        # Handle upload failure
+                        progress_bar.progress(100)
+                        status_text.text("Upload failed!")
+                        
+                        upload_status.markdown("❌ Upload failed")
+                        vectorize_status.markdown("❌ Vectorization failed")
+                        index_status.markdown("❌ Indexing failed")
+                        
+                        if isinstance(e, APIError):
+                            error_msg = f"Error: Failed to upload document. Status: {e.status_code}"
+                            if isinstance(e.payload, dict):
+                                error_msg += f"\nError details: {e.payload.get('error', 'Unknown error')}"
+                                st.error(error_msg)
+                                st.json(e.payload)
+                            else:
+                                st.error(f"{error_msg}\nResponse: {e.text}")
+                        else:
+                            st.error(f"Error during upload: {str(e)}")
+                            st.error(f"Server is not responding. Please check if the backend is running on {server_url}")
+                    else:
+                        result = upload.raw
+                        document_id = upload.document_id
+                        
+                        # Client-side cost of streaming the body
+                        peak_delta = upload_meter.peak_rss_delta
+                        st.caption(
+                            f"Sent {upload_meter.bytes_sent / 1024 / 1024:.1f} MB at "
+                            f"{upload_meter.throughput / 1024 / 1024:.1f} MB/s · peak RSS "
+                            + (f"{upload_meter.peak_rss / 1024 / 1024:.0f} MB (+{peak_delta / 1024 / 1024:.1f} MB during upload)"
+                               if peak_delta is not None else "unavailable")
+                        )
+                        
+                        # Extraction happens before the server responds
+                        progress_bar.progress(60)
+                        upload_status.markdown("✅ Upload successful")
+                        vectorize_status.markdown("✅ Text extracted")
+                        st.info(f"Document ID: `{document_id}`")
+                        if upload.duplicate:
+                            matched = "text" if upload.matched_on == "textHash" else "file"
+                            st.info(f"The server already has a document with the same {matched}; "
+                                    "linked to it instead of embedding the text again.")
+                        
+                        # Follow background embedding/indexing on the server
+                        try:
+                            final_status = client.wait_for_processing(document_id, on_update=on_processing_update, timeout=180)
+                        except (APIError, requests.exceptions.RequestException) as e:
+                            final_status = None
+                            st.warning(f"Could not poll processing status: {str(e)}")
+                        
+                        if final_status is None:
+                            index_status.markdown("⏳ Indexing in background")
+                            status_text.text("Upload complete. The server does not report indexing progress for this document.")
+                            st.success("Document uploaded. It will be searchable once background indexing finishes.")
+                        elif final_status.failed:
+                            progress_bar.progress(100)
+                            vectorize_status.markdown("❌ Vectorization failed")
+                            index_status.markdown("❌ Indexing failed")
+                            status_text.text("Document processing failed!")
+                            st.error(f"Indexing failed: {final_status.error}")
+                        elif final_status.done:
+                            progress_bar.progress(100)
+                            vectorize_status.markdown("✅ Vectorization complete")
+                            index_status.markdown("✅ Indexing complete")
+                            status_text.text(f"Document processing complete! {final_status.total_chunks or 0} chunks indexed. 100%")
+                            st.success("Document uploaded and processed successfully!")
+                            
+                            # Remember the file so the same bytes are never sent again
+                            upload_item.document_id = document_id
+                            upload_item.collection_name = upload.collection_name
+                            upload_item.chunks = final_status.total_chunks
+                            upload_item.status = ingest.LINKED if upload.duplicate else ingest.DONE
+                            journal.record(upload_item)
+                            if upload.duplicate:
+                                journal.add_savings(upload_item)
+                            else:
+                                # Cached query results no longer cover every document
+                                get_query_cache(BASE_URL).clear()
+                            
+                            # Append the new chunks to the local search index if it is in use
+                            vector_index = get_vector_index(BASE_URL)
+                            if len(vector_index) and not upload.duplicate:
+                                try:
+                                    vector_index.index_document(client, document_id, result.get("collectionName"))
+                                except (APIError, requests.exceptions.RequestException) as e:
+                                    st.warning(f"Could not add the document to the local search index: {str(e)}")
+                        else:
+                            index_status.markdown("⏳ Still indexing")
+                            st.warning("Indexing is taking longer than expected and continues in the background.")
+                        
+                        # Display document info
+                        st.subheader("Document Information")
+                        st.write(f"Document ID: `{document_id}`")
+                        st.write(f"Collection: `{result.get('collectionName')}`")
+                        st.write(f"File name: {result.get('fileData', {}).get('originalName')}")
+                        st.write(f"File size: {result.get('fileData', {}).get('size')} bytes")
+                        
+                        # Copy button for document ID
+                        st.code(document_id, language="text")
+                        st.info("👆 Copy this Document ID to use for queries and strategy generation")
+                        
+                        # Document details
+                        render_raw_json("View full document details", result, "upload_result_raw")
+    
+    # Bulk ingestion: many files, a folder or zip archives, uploaded and indexed in parallel
+    st.divider()
+    st.subheader("Upload Many Documents")
+    ingest_mode = st.radio(
+        "Source",
+        ["Files or zip archives", "Folder"],
+        horizontal=True,
+        key="ingest_mode"
+    )
+    if ingest_mode == "Folder":
+        ingest_files = st.file_uploader("Choose a folder", accept_multiple_files="directory", key="ingest_folder")
+    else:
+        ingest_files = st.file_uploader(
+            "Choose PDF, DOCX or zip files",
+            type=["pdf", "docx", "zip"],
+            accept_multiple_files=True,
+            key="ingest_files"
+        )
+    ingest_workers = st.slider("Concurrent uploads", 1, 8, ingest.DEFAULT_MAX_WORKERS, key="ingest_workers")
+    st.caption("Uses the duplicate setting above. An interrupted run picks up where it stopped.")
+    
+    ingest_progress = st.empty()
+    ingest_table = st.empty()
+    
+    ingest_items = ingest.items_from_uploads(ingest_files or [])
+    ingest_result = session_payload(INGEST_RESULT)
+    previous_items = ingest_result["items"] if ingest_result else []
+    retry_failed = [item for item in previous_items if item.status == ingest.FAILED]
+    
+    col1, col2 = st.columns(2)
+    run_items = None
+    with col1:
+        if st.button(f"Ingest {len(ingest_items)} files", disabled=not ingest_items):
+            run_items = ingest_items
+    with col2:
+        if st.button(f"Retry {len(retry_failed)} failed", disabled=not retry_failed):
+            for item in retry_failed:
+                item.status, item.error, item.bytes_sent = ingest.QUEUED, None, 0
+            run_items = previous_items
+    
+    if run_items:
+        started = time.time()
+        finished = sum(1 for item in run_items if item.finished)
+        for item in ingest.run_ingest(run_items, get_client(BASE_URL), get_ingest_journal(),
+                                      max_workers=ingest_workers, dedupe=skip_duplicates):
+            if item is not None:
+                finished += 1
+            ingest_progress.progress(finished / len(run_items), text=f"{finished}/{len(run_items)} files ingested")
+            ingest_table.dataframe(ingest.status_frame(run_items), width="stretch", hide_index=True)
+        
+        # Cached query results no longer cover every document
+        if any(item.status == ingest.DONE for item in run_items):
+            get_query_cache(BASE_URL).clear()
+        
+        ingest_result = {"items": run_items, "summary": ingest.summarize(run_items, time.time() - started)}
+        # The items keep their uploads reachable for retries, so those bytes count too
+        store_session_payload(
+            INGEST_RESULT, ingest_result, payload_size(ingest_result) + sum(item.size for item in run_items)
+        )
+        st.session_state["ingest_result"] = INGEST_RESULT
+    
+    if ingest_result is None and st.session_state.get("ingest_result"):
+        st.info("The last run's file statuses were freed to keep session memory within its budget.")
+    if ingest_result:
+        previous_items = ingest_result["items"]
+        summary = ingest_result["summary"]
+        ingest_progress.progress(1.0, text=f"{summary.files}/{summary.files} files processed in {summary.wall:.1f}s")
+        ingest_table.dataframe(ingest.status_frame(previous_items), width="stretch", hide_index=True)
+        
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Indexed", summary.done)
+        col2.metric("Duplicates", summary.duplicates)
+        col3.metric("Failed", summary.failed)
+        col4.metric("Files / minute", f"{summary.files_per_minute:.1f}")
+        col5.metric("Uploaded", f"{summary.bytes_uploaded / 1024 / 1024:.1f} MB",
+                    f"{summary.megabytes_per_second:.2f} MB/s", delta_color="off")
+        st.caption(
+            f"{summary.bytes_total / 1024 / 1024:.1f} MB across {summary.files} files. "
+            f"Duplicates: {summary.resumed} ingested before, {summary.linked} already on the server; "
+            f"{summary.saved_bytes / 1024 / 1024:.1f} MB and {summary.saved_embeddings} chunk embeddings saved."
+        )
+
+# Add system status visualization
+with tabs[0], section("Storage System Status"):
+    with st.expander("Storage System Status"):
+        monitor = get_health_monitor(BASE_URL)
+        health = monitor.snapshot()
+        if health.status is not None:
+            # Create status indicators
+            st.markdown("### Storage Systems")
+            
+            storage_components = [
+                ("gcsStorage", "Google Cloud Storage"),
+                ("documentStorage", "Document Database"),
+            ]
+            cols = st.columns(len(storage_components))
+            for col, (name, label) in zip(cols, storage_components):
+                component = health.component(name)
+                state = component.state if component else "unknown"
+                icon = "✅" if state == "operational" else "⚠️"
+                with col:
+                    st.markdown(f"{icon} **{label}**: {state.title()}")
+                    if component:
+                        detail = f"since {format_age(time.time() - component.since)} ago"
+                        if component.latency_ms is not None:
+                            detail += f", check took {component.latency_ms:.0f} ms"
+                        st.caption(detail)
+            
+            # If any system is degraded, show message
+            degraded = [
+                health.component(name) for name, _ in storage_components
+                if not health.component(name) or health.component(name).state != "operational"
+            ]
+            if degraded:
+                st.warning("One or more storage systems are experiencing issues. Documents may still upload but with limited functionality.")
+                
+                for component in degraded:
+                    if component and component.message:
+                        st.info(f"Storage message: {component.message}")
+            
+            if health.error:
+                st.caption(f"The latest check failed, so component states are unknown: {health.error}")
+        elif health.checked_at is None:
+            st.info("Checking system status...")
+        else:
+            st.error(f"Could not retrieve system status: {health.error}")
+        
+        # Status check round trips over the monitor's history
+        latency_history = monitor.latency_history()
+        if latency_history:
+            st.caption(f"Status check round trips, last one {health_caption(health)}")
+            latency_df = pd.DataFrame(latency_history, columns=["checked_at", "latency_ms", "online"])
+            latency_df["checked_at"] = pd.to_datetime(latency_df["checked_at"], unit="s")
+            st.line_chart(latency_df, x="checked_at", y="latency_ms", height=160)
+
+# Tab 2: Document Library
+with tabs[1], section("Document Library"):
+    st.subheader("Document Library")
+    st.write("View and manage your uploaded documents")
+    
+    # The library lives in session state and is synced incrementally,
+    # so reruns and row selection don't re-pull the whole list
+    library = st.session_state.setdefault("doc_library", DocumentLibrary())
+    
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        refresh = st.button("Refresh Document List")
+    with col2:
+        full_refresh = st.button("Full Reload")
+    
+    if refresh or full_refresh or not library.synced:
+        with st.spinner("Syncing documents..."):
+            try:
+                sync = library.sync(get_client(BASE_URL), full=full_refresh)
+                if full_refresh:
+                    get_payload_store().clear(st.session_state.get("session_id"), "document")
+                # Documents uploaded elsewhere also make cached query results stale
+                if sync.mode == "incremental" and sync.changed:
+                    get_query_cache(BASE_URL).clear()
+            except (APIError, requests.exceptions.RequestException) as e:
+                st.error(f"Error: Failed to fetch documents. {str(e)}")
+    
+    if library.last_sync:
+        sync = library.last_sync
+        st.caption(
+            f"Last sync {format_age(time.time() - sync.at)} ago: {sync.mode}, "
+            f"{sync.changed} changed, {sync.total} documents, {sync.elapsed * 1000:.0f} ms"
+        )
+    
+    if library.documents:
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            name_filter = st.text_input("Filter by name or ID", "", key="library_filter")
+        with col2:
+            sort_order = st.selectbox("Sort", SORT_OPTIONS, key="library_sort")
+        with col3:
+            page_size = st.selectbox("Per page", [10, 25, 50, 100], index=1, key="library_page_size")
+        
+        _, total_matches = library.query(name_filter, sort_order, page=1, page_size=page_size)
+        page_count = max((total_matches + page_size - 1) // page_size, 1)
+        if st.session_state.get("library_page", 1) > page_count:
+            st.session_state["library_page"] = 1
+        page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, key="library_page")
+        page_docs, total_matches = library.query(name_filter, sort_order, page=page, page_size=page_size)
+        
+        # Create a table of documents
+        with section("build table"):
+            docs_df = pd.DataFrame(
+                [[doc.document_id,
+                  doc.original_name or "Unknown",
+                  doc.uploaded_at or "Unknown",
+                  "✅" if doc.processed else "⏳"]
+                 for doc in page_docs],
+                columns=["Document ID", "Filename", "Upload Date", "Status"]
+            )
+        with section("render table"):
+            st.dataframe(docs_df, width="stretch", hide_index=True)
+        st.caption(f"Showing {len(page_docs)} of {total_matches} matching documents")
+        
+        if page_docs:
+            # Allow selection of a document for details
+            names = {doc.document_id: doc.original_name or "Unknown" for doc in page_docs}
+            selected_doc = st.selectbox(
+                "Select document to view details",
+                options=list(names),
+                format_func=lambda x: f"{x} - {names[x]}"
+            )
+            
+            if selected_doc:
+                # Details are kept under the session's memory budget and fetched again once evicted
+                details = session_payload(("document", selected_doc), lambda: fetch_document_details(selected_doc))
+                if details:
+                    # Show document details
+                    st.subheader("Document Details")
+                    metadata = details.get('metadata', {})
+                    if metadata:
+                        for key, value in metadata.items():
+                            st.write(f"**{key}:** {value}")
+                    document = Document.from_json(details)
+                    if document.chunk_count is not None:
+                        st.write(f"**Indexed chunks:** {document.chunk_count}")
+                    if document.text_preview:
+                        st.caption("Text preview")
+                        st.text(document.text_preview)
+                    
+                    # Add document preview/download options if available
+                    if "fileUrl" in details:
+                        st.markdown(f"[View Document]({details['fileUrl']})")
+                    
+                    # The text is fetched a range of chunks at a time, only while this panel is open
+                    text_panel = st.expander("Document Text", key="document_text_panel", on_change="rerun")
+                    if text_panel.open:
+                        with text_panel:
+                            render_document_text(document)
+                    
+                    render_raw_json("Raw Document Data", details, "document_details_raw")
+    elif library.synced:
+        st.info("No documents found. Upload a document first.")
+
+# Tab 3: Query Documents
+with tabs[2], section("Query Documents"):
+    st.subheader("Query Documents")
+    st.write("Search for information across your uploaded documents")
+    
+    # Query input
+    query = st.text_area("Enter your query", "What are the key challenges in the sales process?")
+    limit = st.slider("Number of results", 1, 10, 5)
+    
+    # Rank chunks in this process instead of querying every collection on the server
+    use_local_index = st.checkbox(
+        "Search locally (in-process index)",
+        help="Downloads document chunks once and searches them here. Uses a local word-hashing embedder, so ranking differs from the server's embeddings."
+    )
+    if use_local_index:
+        vector_index = get_vector_index(BASE_URL)
+        index_cols = st.columns([3, 1])
+        with index_cols[1]:
+            # The index is cached for the whole process, so a rebuild empties it for every session
+            with st.popover("Rebuild local index"):
+                st.caption("Clears the local index for every session using this app, then downloads all chunks again.")
+                rebuild_index = st.button("Clear and rebuild", type="primary")
+        if rebuild_index:
+            vector_index.clear()
+        
+        # Index any processed documents the local index has not seen yet
+        library = st.session_state.setdefault("doc_library", DocumentLibrary())
+        try:
+            if not library.synced:
+                library.sync(get_client(BASE_URL))
+            with st.spinner("Updating local index..."):
+                vector_index.sync(get_client(BASE_URL), library.documents.values())
+        except (APIError, requests.exceptions.RequestException) as e:
+            st.warning(f"Could not update the local index: {str(e)}")
+        
+        with index_cols[0]:
+            index_stats = vector_index.stats()
+            st.caption(
+                f"Local index: {index_stats['chunks']} chunks from {index_stats['documents']} documents, "
+                f"{index_stats['matrix_bytes'] / 1024 / 1024:.1f} MB on disk"
+            )
+    
+    query_cache = get_query_cache(BASE_URL)
+    cache_cols = st.columns([3, 1])
+    with cache_cols[0]:
+        # Filled in after the search so the numbers include it
+        query_cache_caption = st.empty()
+    with cache_cols[1]:
+        if st.button("Clear query cache"):
+            query_cache.clear()
+    
+    if st.button("Search Documents"):
+        with st.spinner("Searching documents..."):
+            started = time.perf_counter()
+            cached = None
+            if use_local_index:
+                result = vector_index.search(query, limit).raw
+                response = None
+            else:
+                # Queries differing only in case, spacing or punctuation share a cache entry
+                cache_key = query_cache_key(query, limit)
+                cached = query_cache.get(cache_key)
+                if cached is not None:
+                    result = cached.value
+                    response = None
+                else:
+                    payload = {
+                        "query": query,
+                        "limit": limit
+                    }
+                    
+                    response = api_call("documents/query", method="POST", data=payload)
+                    result = response.json() if response and response.status_code == 200 else None
+                    if result is not None:
+                        query_cache.put(cache_key, result)
+            
+            if result is not None:
+                if cached is not None:
+                    source = f"Query cache hit ({format_age(cached.age)} old)"
+                else:
+                    source = "Local index search" if use_local_index else "Server search"
+                elapsed = time.perf_counter() - started
+                st.caption(f"{source} took {elapsed * 1000:.0f} ms")
+                if cached is None:
+                    hit_count = len(((result.get("results") or {}).get("documents") or [[]])[0])
+                    history_store.record(
+                        history.QUERY,
+                        {"query": query, "limit": limit, "local": use_local_index},
+                        result,
+                        elapsed=elapsed,
+                        summary=f"{hit_count} results for \"{query[:60]}\"",
+                    )
+                
+                render_query_results(result)
+            else:
+                status = response.status_code if response else "Unknown"
+                st.error(f"Error: Failed to query documents. Status: {status}")
+    
+    query_stats = query_cache.stats()
+    query_cache_caption.caption(
+        f"Query cache: {query_stats['entries']} entries, {query_stats['bytes'] / 1024:.1f} KB, "
+        f"{query_stats['hit_rate']:.0%} hit rate ({query_stats['hits']} hits, {query_stats['misses']} misses)"
+    )
+
+# Tab 4: Generate Document-Based Strategy
+with tabs[3], section("Generate Strategy"):
+    st.subheader("Generate Document-Based Sales Strategy")
+    st.write("Generate a sales strategy using insights from uploaded documents")
+    
+    # Input fields
+    col1, col2 = st.columns(2)
+    with col1:
+        document_id = st.text_input("Document ID", "")
+    with col2:
+        company_name = st.text_input("Company Name", "Google")
+    
+    # Advanced options
+    with st.expander("Advanced Options"):
+        timeout = st.slider("Request Timeout (seconds)", 30, 300, 120)
+        stream_output = st.checkbox(
+            "Show the strategy as it is written",
+            value=True,
+            help="Streams the text from the server; falls back to waiting for the whole strategy if the stream breaks",
+        )
+    
+    if document_id and company_name and st.button("Generate Strategy"):
+        payload = {
+            "documentId": document_id,
+            "companyName": company_name
+        }
+        # Runs in the background under the timeout as its budget; the page only polls it
+        job = get_job_manager().submit(
+            history.DOCUMENT_STRATEGY,
+            generate_document_strategy(get_client(BASE_URL), payload, timeout, stream_output),
+            label=f"Document strategy for {company_name}",
+            params=payload,
+            budget=timeout,
+        )
+        st.session_state[DOC_STRATEGY_JOB] = job.id
+    
+    render_job(DOC_STRATEGY_JOB, render_document_strategy, "Document-based sales strategy generated successfully!")
@@ -0,0 +1,88 @@
+"""History page: reopen earlier results from the local store without calling the backend."""
+
+import datetime
+import time
+
+import pandas as pd
+import streamlit as st
+
+from salesgpt_client import history
+from views.shared import HISTORY_RENDERERS, get_history_store, render_raw_json
+
+history_store = get_history_store()
+
+st.title("History")
+st.write("Reopen strategies, document strategies, queries and LinkedIn searches from earlier sessions")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    kinds = st.multiselect(
+        "Type",
+        list(history.KIND_LABELS),
+        format_func=history.KIND_LABELS.get,
+    )
+with col2:
+    company_filter = st.text_input("Company (starts with)", key="history_company")
+with col3:
+    document_filter = st.text_input("Document ID", key="history_document")
+
+today = datetime.date.today()
+date_range = st.date_input("Date range", (today - datetime.timedelta(days=30), today))
+since = until = None
+if isinstance(date_range, (tuple, list)) and len(date_range) == 2:
+    since = time.mktime(date_range[0].timetuple())
+    until = time.mktime((date_range[1] + datetime.timedelta(days=1)).timetuple())
+
+filters = dict(
+    kinds=kinds or None,
+    company=company_filter or None,
+    document_id=document_filter or None,
+    since=since,
+    until=until,
+)
+total = history_store.count(**filters)
+page_size = 50
+pages = max((total - 1) // page_size + 1, 1)
+if st.session_state.get("history_page", 1) > pages:
+    st.session_state["history_page"] = pages
+page = st.number_input("Page", min_value=1, max_value=pages, value=1, key="history_page")
+entries = history_store.search(**filters, limit=page_size, offset=(page - 1) * page_size)
+
+if not entries:
+    st.info("No saved results match these filters")
+else:
+    st.caption(f"Showing {len(entries)} of {total} saved results")
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "When": time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.created_at)),
+                "Type": entry.label,
+                "Company": entry.company or "",
+                "Document": entry.document_id or "",
+                "Summary": entry.summary or "",
+                "Took (s)": round(entry.elapsed, 1) if entry.elapsed is not None else None,
+            }
+            for entry in entries
+        ]),
+        width="stretch",
+        hide_index=True,
+    )
+    
+    labels = {
+        entry.id: f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.created_at))} · {entry.label}"
+                  f" · {entry.company or entry.document_id or entry.params.get('query', '')}"
+        for entry in entries
+    }
+    selected_id = st.selectbox("Open result", list(labels), format_func=labels.get)
+    entry = history_store.get(selected_id)
+    if entry is not None:
+        with st.expander("Request parameters"):
+            st.json(entry.params)
+        renderer = HISTORY_RENDERERS.get(entry.kind)
+        if renderer is not None:
+            renderer(entry.response, key="history")
+        else:
+            render_raw_json("Response", entry.response, "history_raw")
+        if st.button("Delete this entry"):
+            history_store.delete(entry.id)
+            st.rerun()
@@ -0,0 +1,53 @@
+"""LinkedIn Profiles page: search profiles by company, position and location."""
+
+import time
+
+import streamlit as st
+
+from salesgpt_client import history
+from views.shared import api_call, get_history_store, render_linkedin_profiles
+
+history_store = get_history_store()
+
+st.title("LinkedIn Profiles Search")
+st.write("Find LinkedIn profiles based on company, position, and location")
+
+col1, col2 = st.columns(2)
+with col1:
+    company = st.text_input("Company Name", "Google")
+    position = st.text_input("Position", "Software Engineer")
+with col2:
+    location = st.text_input("Location", "Bangalore")
+    limit = st.slider("Number of profiles", 1, 10, 5)
+
+if st.button("Search LinkedIn Profiles"):
+    with st.spinner(f"Searching for {position} at {company} in {location}..."):
+        payload = {
+            "company": company,
+            "position": position,
+            "location": location,
+            "limit": limit
+        }
+        
+        started = time.time()
+        response = api_call("linkedinProfiles/search", method="POST", data=payload)
+        
+        if response and response.status_code == 200:
+            result = response.json()
+            history_store.record(
+                history.LINKEDIN_SEARCH,
+                payload,
+                result,
+                elapsed=time.time() - started,
+                company=company,
+                summary=f"{len(result.get('profiles', []))} profiles: {position} in {location}",
+            )
+            render_linkedin_profiles(result)
+        else:
+            status = response.status_code if response else "Unknown"
+            st.error(f"Error: Failed to search LinkedIn profiles. Status: {status}")
+            if response:
+                try:
+                    st.json(response.json())
+                except:
+                    st.error("Could not parse error response")
@@ -0,0 +1,201 @@
+"""Generate Sales Strategy page: one company, or a CSV of accounts in bulk."""
+
+import time
+
+import pandas as pd
+import streamlit as st
+
+from salesgpt_client import history
+from salesgpt_client.bulk import (
+    CACHED, DONE, FAILED, BulkInputError, load_accounts, results_frame, results_json, run_bulk,
+    status_frame, strategy_fetcher
+)
+from salesgpt_client.cache import strategy_cache_key
+from salesgpt_client.profiler import section
+from views.shared import (
+    FREED_TEXT, JOB_SESSION_KEYS, base_url, format_age, get_client, get_history_store, get_job_manager,
+    get_strategy_cache, render_job, render_sales_strategy, session_payload, store_session_payload, strategy_summary
+)
+
+BASE_URL = base_url()
+strategy_cache = get_strategy_cache()
+history_store = get_history_store()
+
+STRATEGY_JOB = JOB_SESSION_KEYS[history.STRATEGY]
+# Payload store key of the latest bulk run
+BULK_RESULT = ("bulk", "strategies")
+
+# Job body for one strategy: generate, cache and record it. Runs in a worker thread, so no st.* calls.
+def generate_strategy(client, key, payload, timeout):
+    def run(job):
+        started = time.time()
+        strategy = client.generate_sales_strategy(payload["companyName"], payload["location"], timeout=timeout)
+        # A cancelled strategy is dropped before anything is cached or recorded
+        if job.cancelled:
+            return None
+        # Don't cache the backend's canned fallback strategy
+        if not strategy.fallback:
+            strategy_cache.put(key, strategy.raw)
+        history_store.record(
+            history.STRATEGY,
+            dict(payload, fallback=strategy.fallback),
+            strategy.raw,
+            elapsed=time.time() - started,
+            company=payload["companyName"],
+            summary=strategy_summary(strategy.raw),
+        )
+        return strategy.raw
+    return run
+
+st.title("Generate Sales Strategy")
+st.write("Generate a comprehensive sales strategy for a target company")
+
+single_tab, bulk_tab = st.tabs(["Single Company", "Bulk Accounts"])
+
+with single_tab, section("Single Company"):
+    # Input fields
+    col1, col2 = st.columns(2)
+    with col1:
+        company_name = st.text_input("Company Name", "Google")
+    with col2:
+        location = st.text_input("Location (optional)", "United States")
+
+    # Advanced options
+    with st.expander("Advanced Options"):
+        timeout = st.slider("Request Timeout (seconds)", 30, 300, 120)
+        force_refresh = st.checkbox("Force refresh (ignore cached strategy)", value=False)
+        cache_stats = strategy_cache.stats()
+        st.caption(
+            f"Strategy cache: {cache_stats['entries']} entries, "
+            f"{cache_stats['bytes'] / 1024:.1f} KB of {cache_stats['max_bytes'] / 1024 / 1024:.0f} MB, "
+            f"TTL {format_age(strategy_cache.ttl)}"
+        )
+        if st.button("Clear strategy cache"):
+            strategy_cache.clear()
+            st.success("Strategy cache cleared")
+
+    # Button to generate strategy
+    cached = None
+    if st.button("Generate Sales Strategy"):
+        key = strategy_cache_key(company_name, location)
+        cached = None if force_refresh else strategy_cache.get(key)
+    
+        if cached is not None:
+            st.session_state.pop(STRATEGY_JOB, None)
+            st.info(f"⚡ Cached result from {format_age(cached.age)} ago. Tick \"Force refresh\" to regenerate.")
+            render_sales_strategy(cached.value)
+        else:
+            payload = {
+                "companyName": company_name,
+                "location": location if location else None  # Only send if not empty
+            }
+            # Runs in the background under the timeout as its budget; the page only polls it
+            job = get_job_manager().submit(
+                history.STRATEGY,
+                generate_strategy(get_client(BASE_URL), key, payload, timeout),
+                label=f"Sales strategy for {company_name}",
+                params=payload,
+                budget=timeout,
+            )
+            st.session_state[STRATEGY_JOB] = job.id
+    
+    if cached is None:
+        render_job(STRATEGY_JOB, render_sales_strategy, "Sales strategy generated successfully!")
+
+# Bulk mode: fan a list of accounts out over a bounded worker pool
+with bulk_tab, section("Bulk Accounts"):
+    st.write("Generate strategies for a list of accounts. Upload a CSV with a company column and an optional location column, or edit the table directly.")
+    st.caption("Uses the timeout and force-refresh settings from Advanced Options. Cached strategies are reused.")
+    
+    accounts_file = st.file_uploader("Accounts CSV", type=["csv"], key="bulk_accounts")
+    if accounts_file is not None:
+        accounts_df = pd.read_csv(accounts_file)
+    else:
+        accounts_df = pd.DataFrame({"company": ["Google", "Microsoft"], "location": ["United States", ""]})
+    accounts_df = st.data_editor(
+        accounts_df,
+        num_rows="dynamic",
+        width="stretch",
+        key=f"bulk_editor_{accounts_file.name if accounts_file else 'sample'}"
+    )
+    workers = st.slider("Concurrent requests", 1, 8, 4)
+    
+    bulk_progress = st.empty()
+    bulk_table = st.empty()
+    
+    bulk_result = None
+    if st.button("Run Bulk Generation"):
+        try:
+            rows = load_accounts(accounts_df)
+        except BulkInputError as e:
+            st.error(str(e))
+            rows = []
+        
+        if rows:
+            fetch = strategy_fetcher(get_client(BASE_URL), strategy_cache, timeout=timeout, force_refresh=force_refresh)
+            started = time.time()
+            finished = 0
+            for row in run_bulk(rows, fetch, max_workers=workers):
+                if row is not None:
+                    finished += 1
+                    if row.status == DONE:
+                        history_store.record(
+                            history.STRATEGY,
+                            {"companyName": row.company_name, "location": row.location, "bulk": True},
+                            row.result,
+                            elapsed=row.elapsed,
+                            company=row.company_name,
+                            summary=strategy_summary(row.result),
+                        )
+                bulk_progress.progress(finished / len(rows), text=f"{finished}/{len(rows)} accounts complete")
+                bulk_table.dataframe(status_frame(rows), width="stretch", hide_index=True)
+            
+            # Keep results across reruns (e.g. when a download button is clicked), under the session's budget
+            bulk_result = {"rows": rows, "elapsed": time.time() - started}
+            store_session_payload(BULK_RESULT, bulk_result)
+            st.session_state["bulk_result"] = BULK_RESULT
+    
+    if bulk_result is None:
+        bulk_result = session_payload(BULK_RESULT)
+    if bulk_result is None and st.session_state.get("bulk_result"):
+        st.info(FREED_TEXT)
+    rows = bulk_result["rows"] if bulk_result else None
+    if rows:
+        elapsed = bulk_result["elapsed"]
+        failed = sum(1 for row in rows if row.status == FAILED)
+        cached_count = sum(1 for row in rows if row.status == CACHED)
+        bulk_progress.progress(1.0, text=f"{len(rows)}/{len(rows)} accounts complete")
+        bulk_table.dataframe(status_frame(rows), width="stretch", hide_index=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Accounts", len(rows))
+        col2.metric("Failed", failed)
+        col3.metric("From cache", cached_count)
+        col4.metric("Total time", f"{elapsed:.1f}s")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Download results (CSV)",
+                results_frame(rows).to_csv(index=False),
+                file_name="sales_strategies.csv",
+                mime="text/csv"
+            )
+        with col2:
+            st.download_button(
+                "Download full results (JSON)",
+                results_json(rows),
+                file_name="sales_strategies.json",
+                mime="application/json"
+            )
+        
+        # Drill into any completed account
+        completed = [row for row in rows if row.result]
+        if completed:
+            selected_row = st.selectbox(
+                "View strategy",
+                options=completed,
+                format_func=lambda row: f"{row.company_name} ({row.location})" if row.location else row.company_name
+            )
+            with st.expander("Strategy details"):
+                render_sales_strategy(selected_row.result, key="bulk_strategy")
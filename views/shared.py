@@ -0,0 +1,328 @@
+"""Resources and renderers shared by every page of the Streamlit app.
+
+Imported once per process, so the client, caches and stores below are
+created once and reused by every page and every session.
+"""
+
+import json
+import os
+
+import requests
+import streamlit as st
+
+from salesgpt_client import SalesGPTClient, history
+from salesgpt_client.cache import DEFAULT_CACHE_DIR, ResultCache
+from salesgpt_client.health import HealthMonitor
+from salesgpt_client.jobs import CANCELLED, DONE, JobManager
+from salesgpt_client.memory import PayloadStore, preview
+from salesgpt_client.profiler import RerunProfiler, profiled
+from salesgpt_client.ratelimit import DEFAULT_LIMITS
+from salesgpt_client.report import compile_strategy_report
+
+# Ports offered in the sidebar; the selection is kept in session state under "api_port"
+API_PORTS = [3000, 3001, 3002, 3003]
+DEFAULT_PORT = 3003
+
+# Base URL of the backend picked in the sidebar
+def base_url():
+    return f"http://localhost:{st.session_state.get('api_port', DEFAULT_PORT)}/api"
+
+# One client (and pooled transport) per backend URL, shared by every session in the process.
+# Identical requests from different sessions while one is in flight share its response, and
+# calls to rate-limited upstreams are paced with sessions served in turn.
+@st.cache_resource
+def get_client(base_url):
+    return SalesGPTClient(base_url, coalesce=True, rate_limits=DEFAULT_LIMITS)
+
+def get_transport(base_url):
+    return get_client(base_url).transport
+
+# Background system/status poller; reruns read its last snapshot instead of calling the API
+@st.cache_resource
+def get_health_monitor(base_url):
+    return HealthMonitor(get_client(base_url)).start()
+
+# Disk-backed cache of generateSalesStrategy results, survives restarts
+@st.cache_resource
+def get_strategy_cache():
+    return ResultCache(
+        os.path.join(DEFAULT_CACHE_DIR, "strategies.sqlite3"),
+        ttl=float(os.environ.get("SALESGPT_STRATEGY_TTL", 24 * 3600)),
+        max_bytes=int(os.environ.get("SALESGPT_STRATEGY_CACHE_MB", 50)) * 1024 * 1024,
+    )
+
+# Every generated result, so it can be reopened from the History page without the backend
+@st.cache_resource
+def get_history_store():
+    return history.HistoryStore(os.path.join(DEFAULT_CACHE_DIR, "history.sqlite3"))
+
+# documents/query results per backend URL; cleared whenever the document set changes
+@st.cache_resource
+def get_query_cache(base_url):
+    slug = "".join(c if c.isalnum() else "_" for c in base_url.split("://")[-1])
+    return ResultCache(
+        os.path.join(DEFAULT_CACHE_DIR, f"queries_{slug}.sqlite3"),
+        ttl=float(os.environ.get("SALESGPT_QUERY_TTL", 600)),
+        max_bytes=int(os.environ.get("SALESGPT_QUERY_CACHE_MB", 20)) * 1024 * 1024,
+    )
+
+# Progress of bulk ingestion runs by file content hash, so an interrupted run resumes
+@st.cache_resource
+def get_ingest_journal():
+    # Imported here so pages without uploads don't load pandas
+    from salesgpt_client.ingest import IngestJournal
+    return IngestJournal()
+
+# Optional in-process chunk index for Query Documents, one per backend URL
+@st.cache_resource
+def get_vector_index(base_url):
+    # Imported here so pages without local search don't load numpy
+    from salesgpt_client.vectors import VectorIndex
+    slug = "".join(c if c.isalnum() else "_" for c in base_url.split("://")[-1])
+    return VectorIndex(os.path.join(DEFAULT_CACHE_DIR, "vectors", slug))
+
+# Process-wide pool for long generations; a job outlives the rerun and page that started it.
+# Finished results go to the payload store under the submitting session's budget.
+@st.cache_resource
+def get_job_manager():
+    return JobManager(store=get_payload_store())
+
+# Opt-in timing of reruns by section, with stack samples for flame graphs
+@st.cache_resource
+def get_profiler():
+    return RerunProfiler()
+
+# Large responses kept between reruns, under per-session and process-wide byte budgets
+@st.cache_resource
+def get_payload_store():
+    return PayloadStore()
+
+# A payload kept for this session under ``key``, loaded with ``load()`` (and kept) when it was
+# never stored or has been evicted; None if it is not there and cannot be loaded
+def session_payload(key, load=None):
+    store = get_payload_store()
+    session = st.session_state.get("session_id")
+    payload = store.get(session, key)
+    if payload is None and load is not None:
+        payload = load()
+        if payload is not None:
+            store.put(session, key, payload)
+    return payload
+
+# Keep ``payload`` for this session under ``key``, replacing what was there; a payload over
+# the session's budget is not kept. ``size`` overrides the measured size.
+def store_session_payload(key, payload, size=None):
+    get_payload_store().put(st.session_state.get("session_id"), key, payload, size)
+
+# Shown where a result was dropped to keep the session within its memory budget
+FREED_TEXT = "This result was freed to keep session memory within its budget. It is still in History."
+
+# Session state key holding the id of the job each page shows, by job kind
+JOB_SESSION_KEYS = {
+    history.STRATEGY: "strategy_job",
+    history.DOCUMENT_STRATEGY: "doc_strategy_job",
+}
+
+# Seconds between refreshes of a running job's progress panel
+JOB_POLL_INTERVAL = 0.5
+
+# Human readable age, e.g. "3m 12s"
+def format_age(seconds):
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    if seconds < 86400:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    return f"{seconds // 86400}d {seconds % 86400 // 3600}h"
+
+# Human readable size, e.g. "1.2 MB"
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+# One line summary of the latest health check, e.g. "checked 4s ago, 12 ms"
+def health_caption(snapshot):
+    if snapshot.checked_at is None:
+        return "first status check in progress"
+    return f"checked {format_age(snapshot.age)} ago, {snapshot.latency_ms:.0f} ms"
+
+# Show the job whose id is in session state under ``key``: a progress panel with a Cancel
+# button while it runs, refreshed on its own in a fragment, then the outcome
+@profiled("render job")
+def render_job(key, render_result, success_text):
+    job = get_job_manager().get(st.session_state.get(key))
+    if job is None:
+        return
+    if not job.finished:
+        st.fragment(_job_progress, run_every=JOB_POLL_INTERVAL)(key, job.id)
+    elif job.status == DONE:
+        st.success(success_text)
+        if job.first_output is not None:
+            st.caption(f"First words after {job.first_output:.1f}s, complete in {job.elapsed:.1f}s")
+        else:
+            st.caption(f"Generated in {job.elapsed:.1f}s")
+        if job.note:
+            st.warning(job.note)
+        result = get_job_manager().result(job)
+        if result is None:
+            st.info(FREED_TEXT)
+        else:
+            render_result(result)
+    elif job.status == CANCELLED:
+        st.warning(f"{job.label} was cancelled after {format_age(job.elapsed)}.")
+    else:
+        st.error(f"Error: {job.label} failed. {job.error}")
+
+def _job_progress(key, job_id):
+    manager = get_job_manager()
+    job = manager.get(job_id)
+    if job is None or job.finished:
+        # Redraw the page once so the outcome replaces the progress panel
+        st.rerun()
+    
+    status_col, cancel_col = st.columns([5, 1])
+    with status_col:
+        budget = f" of {format_age(job.budget)}" if job.budget else ""
+        st.progress(
+            min(job.elapsed / job.budget, 1.0) if job.budget else 0.0,
+            text=f"{job.status_label}: {job.label}, {format_age(job.elapsed)}{budget}",
+        )
+    with cancel_col:
+        if st.button("Cancel", key=f"cancel_{key}"):
+            manager.cancel(job_id)
+            st.rerun()
+    if job.partial:
+        st.caption(f"First words after {job.first_output:.1f}s, still writing...")
+        st.subheader("Sales Strategy")
+        st.markdown(job.partial + " ▌")
+    else:
+        st.caption("Runs in the background; you can leave this page and come back to it.")
+
+# Function to make API calls
+def api_call(endpoint, method="GET", data=None, files=None, timeout=60):
+    url = f"{base_url()}/{endpoint}"
+    client = get_client(base_url())
+    
+    try:
+        if method == "GET":
+            response = client.request("GET", endpoint, timeout=timeout)
+        elif method == "POST":
+            if files:
+                response = client.request("POST", endpoint, data=data, files=files, timeout=timeout)
+            else:
+                response = client.request("POST", endpoint, json=data, timeout=timeout)
+        
+        return response
+    except requests.exceptions.ConnectionError:
+        st.error(f"Connection Error: Cannot connect to {url}. Is the server running?")
+        return None
+    except requests.exceptions.Timeout:
+        st.error(f"Timeout Error: The request to {url} timed out after {timeout} seconds.")
+        return None
+    except Exception as e:
+        st.error(f"Error making API call: {str(e)}")
+        return None
+
+# Raw payload in an expander as a preview with long strings and lists cut short, so reruns
+# send a bounded amount; the full payload is built only when its download is clicked
+def render_raw_json(label, payload, key):
+    with st.expander(label):
+        short, shortened = preview(payload)
+        if not shortened:
+            st.json(payload, expanded=False)
+            return
+        st.caption(f"Preview: {shortened} long values shortened")
+        st.json(short, expanded=False)
+        st.download_button(
+            "Download full payload",
+            lambda: json.dumps(payload, indent=2),
+            file_name=f"{key}.json",
+            mime="application/json",
+            key=f"{key}_download",
+            on_click="ignore",
+        )
+
+# Render a sales strategy response from generateSalesStrategy.
+# The report is compiled to a few HTML blocks (memoized per response) rather
+# than one element per bullet, so reruns send a handful of elements.
+@profiled("render strategy")
+def render_sales_strategy(result, key="strategy"):
+    report = compile_strategy_report(result)
+    
+    st.header(report.title)
+    st.markdown(report.overview_html, unsafe_allow_html=True)
+    st.markdown(report.body_html, unsafe_allow_html=True)
+    
+    # Raw JSON option
+    render_raw_json("View raw JSON data", result, f"{key}_raw")
+    
+    with st.expander("Debug Info"):
+        st.json({"report_digest": report.digest, **report.debug})
+
+# Render a documents/query response
+@profiled("render query results")
+def render_query_results(result, key="query"):
+    # Handle potentially different response formats
+    if 'results' in result and 'documents' in result['results']:
+        documents = result['results']['documents'][0] if len(result['results']['documents']) > 0 else []
+        metadatas = result['results']['metadatas'][0] if len(result['results']['metadatas']) > 0 else []
+        
+        st.success(f"Found {len(documents)} matching documents")
+        
+        for i, (doc, meta) in enumerate(zip(documents, metadatas)):
+            with st.expander(f"Result {i+1}: {meta.get('originalName', 'Document')}"):
+                st.markdown("**Document Excerpt:**")
+                st.text(doc[:1000] + ("..." if len(doc) > 1000 else ""))
+                
+                st.markdown("**Metadata:**")
+                st.json(meta)
+    else:
+        st.warning("Response format is different than expected")
+        render_raw_json("View raw results", result, f"{key}_raw")
+
+# Render a documents/generateSalesStrategy response
+@profiled("render document strategy")
+def render_document_strategy(result, key="document_strategy"):
+    # Display company info
+    st.subheader("Company Information")
+    company_info = result.get('companyInfo', {})
+    if company_info:
+        st.json(company_info)
+    
+    # Display sales strategy
+    st.subheader("Sales Strategy")
+    strategy = result.get('salesStrategy', "")
+    st.markdown(strategy)
+
+# Render a linkedinProfiles/search response
+@profiled("render profiles")
+def render_linkedin_profiles(result, key="profiles"):
+    st.success(f"Found {len(result.get('profiles', []))} LinkedIn profiles")
+    
+    for i, profile in enumerate(result.get('profiles', [])):
+        with st.container():
+            st.markdown(f"### Profile {i+1}")
+            st.markdown(f"**Title:** {profile.get('title', 'No title')}")
+            st.markdown(f"**URL:** [{profile.get('url')}]({profile.get('url')})")
+            st.markdown(f"**Snippet:** {profile.get('snippet', 'No description')}")
+            st.markdown("---")
+    
+    # Show raw data in expander
+    render_raw_json("View raw results", result, f"{key}_raw")
+
+HISTORY_RENDERERS = {
+    history.STRATEGY: render_sales_strategy,
+    history.DOCUMENT_STRATEGY: render_document_strategy,
+    history.QUERY: render_query_results,
+    history.LINKEDIN_SEARCH: render_linkedin_profiles,
+}
+
+# Short description of a strategy for history listings
+def strategy_summary(result):
+    ccs = (result.get("salesStrategy") or {}).get("ccsScore")
+    return f"{result.get('industry', 'Unknown industry')} · CCS {ccs if ccs is not None else 'n/a'}"